@@ -0,0 +1,100 @@
+"""
+Compares the peak memory and time of the default and streaming csv readers on
+a synthetic spreadsheet. Each reader runs in its own process, so its peak is
+measured from the process's maximum resident memory, including what Pandas
+allocates outside of Python.
+
+The streaming reader should stay under `TARGET_MIB_PER_MILLION` MiB above the
+memory used before reading, per million rows.
+
+Usage:
+    python -m benchmarks.bench_csv_reader [--rows N]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, Tuple
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+
+TARGET_MIB_PER_MILLION = 175
+
+
+def _max_rss_mib() -> float:
+    """
+    Returns the maximum resident memory of this process so far, in MiB.
+    """
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def measure(path: str, reader: str) -> Tuple[float, float]:
+    """
+    Reads `path` with the given reader, and returns how long it took in
+    seconds and how much the peak memory grew in MiB.
+    """
+    from src.read_data.read_data import read_data
+
+    before = _max_rss_mib()
+    start = perf_counter()
+    read_data.__wrapped__(path, use_cache=False, reader=reader)
+    return perf_counter() - start, _max_rss_mib() - before
+
+
+def in_process(*args: str) -> str:
+    """
+    Runs this benchmark with `args` in a fresh process and returns its output.
+    A process starts with the peak memory of the one that started it, so the
+    spreadsheet is generated in a fresh process too.
+    """
+    return subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_csv_reader", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--write", metavar="PATH", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--measure", nargs=2, metavar=("READER", "PATH"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.write is not None:
+        write_ledger(generate_year(LedgerSpec(rows=args.rows), 2024), args.write)
+        return
+
+    if args.measure is not None:
+        print(json.dumps(measure(args.measure[1], args.measure[0])))
+        return
+
+    results: Dict[str, Tuple[float, float]] = {}
+    with TemporaryDirectory() as tmp:
+        path = join(tmp, "Spending.csv")
+        in_process("--rows", str(args.rows), "--write", path)
+        for reader in ("default", "streaming"):
+            seconds, peak = json.loads(in_process("--measure", reader, path))
+            results[reader] = (seconds, peak)
+
+    target = TARGET_MIB_PER_MILLION * args.rows / 1_000_000
+    print(f"{args.rows} rows, target {target:.0f} MiB for streaming")
+    for reader, (seconds, peak) in results.items():
+        print(f"  {reader:<10} {seconds:8.3f}s  {peak:8.1f} MiB peak")
+
+    if results["streaming"][1] > target:
+        sys.exit("The streaming reader went over its memory target")
+
+
+if __name__ == "__main__":
+    main()
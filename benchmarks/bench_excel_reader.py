@@ -0,0 +1,64 @@
+"""
+Compares the default and streaming Excel readers on `sample_data.xlsx`, scaled
+up to a realistic number of rows.
+
+Usage:
+    python -m benchmarks.bench_excel_reader [--scale N] [--repeat N]
+"""
+
+import argparse
+import pandas as pd
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict
+
+from src.read_data.read_data import read_data
+
+
+def scaled_workbook(src: str, dst: str, scale: int) -> int:
+    """
+    Writes `src` repeated `scale` times to `dst`. Returns the number of rows.
+    """
+    df = pd.read_excel(src, sheet_name="Sheet1")
+    big = pd.concat([df] * scale, ignore_index=True)
+    big.to_excel(dst, sheet_name="Sheet1", index=False)
+    return big.shape[0]
+
+
+def time_readers(path: str, repeat: int) -> Dict[str, float]:
+    """
+    Returns the best time of each reader at parsing `path`, in seconds.
+    """
+    times = {}
+    for reader in ("default", "streaming"):
+        best = float("inf")
+        for _ in range(repeat):
+            start = perf_counter()
+            read_data.__wrapped__(path, use_cache=False, reader=reader)
+            best = min(best, perf_counter() - start)
+
+        times[reader] = best
+
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        path = join(tmp, "Spending.xlsx")
+        rows = scaled_workbook("sample_data.xlsx", path, args.scale)
+        times = time_readers(path, args.repeat)
+
+    print(f"{rows} rows, best of {args.repeat}")
+    for reader, seconds in times.items():
+        speedup = times["default"] / seconds
+        print(f"  {reader:<10} {seconds:8.3f}s  {speedup:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
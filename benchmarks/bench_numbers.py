@@ -0,0 +1,87 @@
+"""
+Compares reading a numbers file row by row, as it used to be read, with
+building its columns straight from the table, and times writing it.
+
+Usage:
+    python -m benchmarks.bench_numbers [--rows N] [--repeat N]
+"""
+
+import argparse
+import tracemalloc
+import pandas as pd
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, Tuple
+
+from benchmarks.synthetic import LedgerSpec, generate_year
+from src.read_data.read_data import convert_columns, _numbers_column
+from src.read_data.write_data import write_data
+
+
+def by_rows(table: Any) -> pd.DataFrame:
+    """
+    Reads the table the way `_read_numbers` used to, through a list of rows.
+    """
+    data = table.rows(values_only=True)
+    return pd.DataFrame(data[1:], columns=data[0])
+
+
+def by_columns(table: Any) -> pd.DataFrame:
+    """
+    Reads the table the way `_read_numbers` does, a column at a time.
+    """
+    return pd.DataFrame(
+        {
+            values[0]: _numbers_column(values[1:])
+            for values in table.iter_cols(values_only=True)
+            if values[0] is not None
+        }
+    )
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """
+    Returns the best time of `func` in seconds, and its peak memory in bytes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    from numbers_parser import Document
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = convert_columns(generate_year(LedgerSpec(rows=args.rows), 2024))
+    results: Dict[str, Tuple[float, int]] = {}
+    with TemporaryDirectory() as tmp:
+        path = join(tmp, "Spending.numbers")
+        results["write"] = measure(lambda: write_data(df, path), 1)
+        results["load document"] = measure(lambda: Document(path), 1)
+
+        table = Document(path).sheets[0].tables[0]
+        for name, reader in (("rows", by_rows), ("columns", by_columns)):
+            results[f"parse by {name}"] = measure(
+                lambda: convert_columns(reader(table)), args.repeat
+            )
+
+    print(f"{args.rows} rows")
+    for name, (seconds, peak) in results.items():
+        print(f"  {name:<18} {seconds:8.3f}s  {peak / 2**20:8.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compares two result files written by `benchmarks.run`, and exits with an error
+if any scenario got slower by more than the threshold.
+
+Usage:
+    python -m benchmarks.compare BASE HEAD [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare(
+    base: Dict[str, Any], head: Dict[str, Any], threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Compares the median time of every scenario in both results.
+
+    Parameters:
+        base (Dict[str, Any]): the results to compare against
+        head (Dict[str, Any]): the new results
+        threshold (float): how much slower a scenario can get, as a proportion
+            of its base time, before it counts as a regression
+
+    Returns:
+        lines (List[str]): a line describing each scenario
+        regressions (List[str]): the names of the scenarios that got slower
+    """
+    lines = []
+    regressions = []
+    for name, new in head["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            lines.append(f"{name:<45} {'':>9} {new['median']:8.3f}s  (new)")
+            continue
+
+        change = new["median"] / old["median"] - 1 if old["median"] > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+
+        lines.append(
+            f"{name:<45} {old['median']:8.3f}s {new['median']:8.3f}s "
+            + f"{change:+8.1%}{flag}"
+        )
+
+    return lines, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    base = _load(args.base)
+    head = _load(args.head)
+    ledger = lambda res: (res["meta"]["spec"], res["meta"]["format"])
+    if ledger(base) != ledger(head):
+        print("Warning: the results were generated from different ledgers")
+
+    print(
+        f"{'scenario':<45} {base['meta']['commit'] or 'base':>9} "
+        + f"{head['meta']['commit'] or 'head':>9}"
+    )
+    lines, regressions = compare(base, head, args.threshold)
+    print("\n".join(lines))
+
+    if len(regressions) > 0:
+        print(
+            f"\n{len(regressions)} scenario(s) regressed by over {args.threshold:.0%}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measures how long each entry point takes to import, using `python -X importtime`.
+
+Usage:
+    python -m benchmarks.import_time [--top N]
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict
+
+ENTRY_POINTS = (
+    "main",
+    "src.initialize",
+    "src.analyze_spending",
+    "src.drivers.ui.ui_driver",
+)
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Imports `module` in a fresh interpreter and returns the cumulative import
+    time of every module it pulled in.
+
+    Parameters:
+        module (str): the module to import
+
+    Returns:
+        times (Dict[str, int]): mapping from module name to how many
+            microseconds it took to import, including its own imports
+    """
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for entry in ENTRY_POINTS:
+        times = import_times(entry)
+        print(f"{entry}: {times[entry] / 1000:.1f} ms")
+        top_level = {
+            name: us for name, us in times.items() if "." not in name and name != entry
+        }
+        for name, us in sorted(top_level.items(), key=lambda t: -t[1])[: args.top]:
+            print(f"  {name:<30} {us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
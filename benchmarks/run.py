@@ -0,0 +1,151 @@
+"""
+Times each stage of the pipeline and every plotter on synthetic ledgers, and
+writes the results as JSON so they can be compared between commits with
+`python -m benchmarks.compare`.
+
+Usage:
+    python -m benchmarks.run [--rows N] [--years Y [Y ...]] [--output FILE]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from os import makedirs
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Dict, List
+
+import matplotlib
+
+from benchmarks.scenarios import pipeline_scenarios, plotter_scenarios, reset_caches
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.models.paths import Paths
+from src.read_config.get_config import config_globals
+from src.read_data.read_data import read_data
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per year")
+    parser.add_argument("--categories", type=int, default=6)
+    parser.add_argument("--years", type=int, nargs="+", default=[2024])
+    parser.add_argument("--bill-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=("xlsx", "csv"), default="xlsx")
+    parser.add_argument("--income", type=float, default=60_000.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--only", default="", help="only run scenarios whose name contains this"
+    )
+    parser.add_argument("--output", help="where to write the results")
+    return parser.parse_args()
+
+
+def _commit() -> str:
+    """
+    Returns the commit being benchmarked, or an empty string outside of git.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def summarize(runs: List[float]) -> Dict[str, Any]:
+    """
+    Summarizes the times of one scenario.
+
+    Parameters:
+        runs (List[float]): how long each repetition took, in seconds
+
+    Returns:
+        summary (Dict[str, Any]): the runs and their min, median and mean
+    """
+    return {
+        "runs": runs,
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+    }
+
+
+def main() -> None:
+    args = _parse_args()
+    spec = LedgerSpec(
+        rows=args.rows,
+        categories=args.categories,
+        years=tuple(args.years),
+        bill_ratio=args.bill_ratio,
+        seed=args.seed,
+    )
+
+    matplotlib.use("Agg")
+
+    times: Dict[str, List[float]] = {}
+    with TemporaryDirectory() as root:
+        Paths.set_data_root(root)
+        for year in spec.years:
+            makedirs(join(root, str(year)))
+            path = join(root, str(year), f"Spending.{args.format}")
+            write_ledger(generate_year(spec, year), path)
+            config_globals()["YEARLY_TAKE_HOME_PAY"][str(year)] = args.income
+
+        for i in range(args.repeat):
+            for year in spec.years:
+                Paths.set_year(year)
+                out_dir = join(root, str(year), "bench")
+                makedirs(out_dir, exist_ok=True)
+
+                for scenario in pipeline_scenarios() + plotter_scenarios(out_dir):
+                    if args.only not in scenario.name:
+                        continue
+
+                    reset_caches()
+                    read_data(Paths.spending_path())
+
+                    start = perf_counter()
+                    scenario.run()
+                    elapsed = perf_counter() - start
+
+                    runs = times.setdefault(scenario.name, [0.0] * args.repeat)
+                    runs[i] += elapsed
+
+    results = {
+        "meta": {
+            "commit": _commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": {**vars(spec), "years": list(spec.years)},
+            "format": args.format,
+            "repeat": args.repeat,
+        },
+        "results": {name: summarize(runs) for name, runs in times.items()},
+    }
+
+    out = json.dumps(results, indent=2)
+    if args.output is None:
+        print(out)
+        return
+
+    if len(dirname(args.output)) > 0:
+        makedirs(dirname(args.output), exist_ok=True)
+
+    with open(args.output, "w") as f:
+        f.write(out + "\n")
+
+    for name, summary in results["results"].items():
+        print(f"{name:<45} {summary['median']:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+The timed scenarios. Each one runs a stage of the pipeline against the year
+and data directory currently set in `Paths`.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List
+
+from src.drivers.aggregation_driver import AggregationDriver
+from src.drivers.validation_driver import ValidationDriver
+from src.drivers.visualization_driver import VisualizationDriver, plotter_name
+from src.models.paths import Paths
+from src.read_data.read_data import read_data
+from src.utilities.decorators import clear_frame_memos
+from src.utilities.mask_cache import MASK_CACHE
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    A named piece of work to time.
+
+    Attributes:
+        name (str): identifies the scenario in the results
+        run (Callable[[], None]): does the work
+    """
+
+    name: str
+    run: Callable[[], None]
+
+
+def reset_caches() -> None:
+    """
+    Drops every in-memory cache so that each scenario starts cold. The on-disk
+    parse cache is kept, since it's part of what `read_data` is measured on.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    read_data.cache_clear()
+    clear_frame_memos()
+    MASK_CACHE.clear()
+
+
+def _parse() -> None:
+    read_data.__wrapped__(Paths.spending_path(), use_cache=False)
+
+
+def _parse_cached() -> None:
+    read_data.__wrapped__(Paths.spending_path(), use_cache=True)
+
+
+def pipeline_scenarios() -> List[Scenario]:
+    """
+    Returns the scenarios for each stage of `analyze_spending`. The drivers
+    read the spreadsheet through `read_data`, so its parse isn't included in
+    their times.
+
+    Parameters:
+        None
+
+    Returns:
+        scenarios (List[Scenario]): the scenarios, in the order they should run
+    """
+    return [
+        Scenario("read_data", _parse),
+        Scenario("read_data:cached", _parse_cached),
+        Scenario("validate", lambda: ValidationDriver().validate_spending()),
+        Scenario("visualize", lambda: VisualizationDriver().visualize(rebuild=True)),
+        Scenario("aggregate", lambda: AggregationDriver().aggregate(rebuild=True)),
+    ]
+
+
+def plotter_scenarios(out_dir: str) -> List[Scenario]:
+    """
+    Returns a scenario for each plotter, which plots the whole year into
+    `out_dir` like the Combined folder.
+
+    Parameters:
+        out_dir (str): where to save the plots
+
+    Returns:
+        scenarios (List[Scenario]): one scenario per plotter
+    """
+    driver = VisualizationDriver()
+    scenarios = []
+    for plotter in driver.monthlys + driver.yearlys:
+
+        def run(plotter=plotter) -> None:  # type: ignore
+            plotter(read_data(Paths.spending_path()), out_dir)
+
+        scenarios.append(Scenario(f"plot:{plotter_name(plotter)}", run))
+
+    return scenarios
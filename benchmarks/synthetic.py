@@ -0,0 +1,133 @@
+"""
+Deterministic synthetic spending ledgers, shaped like `sample_data.xlsx`, for
+benchmarking at sizes no real spreadsheet in the repository reaches.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from src.read_data.column import Column
+
+# name, whether it's food, chance of being controllable, mean price
+DEFAULT_CATEGORIES: List[Tuple[str, bool, float, float]] = [
+    ("Eating Out", True, 1.0, 14.0),
+    ("Groceries", True, 0.05, 41.0),
+    ("Household", False, 0.4, 54.0),
+    ("Recreation", False, 1.0, 49.0),
+    ("Car", False, 0.0, 42.0),
+    ("Beauty", False, 0.75, 22.0),
+]
+
+BILLS = ("Bills", False, 0.25, 400.0)
+
+
+@dataclass(frozen=True)
+class LedgerSpec:
+    """
+    Describes a synthetic ledger.
+
+    Attributes:
+        rows (int): how many transactions to generate per year
+        categories (int): how many non-bill categories to use. Categories past
+            the defaults are named "Category N"
+        years (Tuple[int, ...]): which years to generate transactions for
+        bill_ratio (float): the proportion of transactions that are bills
+        seed (int): seeds the random number generator
+    """
+
+    rows: int = 10_000
+    categories: int = len(DEFAULT_CATEGORIES)
+    years: Tuple[int, ...] = (2024,)
+    bill_ratio: float = 0.05
+    seed: int = 0
+
+
+def _categories(count: int) -> List[Tuple[str, bool, float, float]]:
+    """
+    Returns `count` non-bill categories, extending the defaults if needed.
+    """
+    extra = [
+        (f"Category {i}", i % 3 == 0, 0.5, 20.0 + 5 * (i % 7))
+        for i in range(len(DEFAULT_CATEGORIES), count)
+    ]
+    return (DEFAULT_CATEGORIES + extra)[:count]
+
+
+def generate_year(spec: LedgerSpec, year: int) -> pd.DataFrame:
+    """
+    Generates one year of transactions. The same spec and year always give the
+    same ledger.
+
+    Parameters:
+        spec (LedgerSpec): the shape of the ledger
+        year (int): which year the transactions are in
+
+    Returns:
+        df (DataFrame): an unparsed spreadsheet, sorted by date, with the same
+            columns as `sample_data.xlsx`
+    """
+    if spec.rows <= 0 or spec.categories <= 0:
+        raise ValueError("A ledger needs at least one row and one category")
+
+    if not 0 <= spec.bill_ratio <= 1:
+        raise ValueError(f"Invalid bill ratio: {spec.bill_ratio}")
+
+    rng = np.random.default_rng([spec.seed, year])
+    cats = _categories(spec.categories)
+
+    is_bill = rng.random(spec.rows) < spec.bill_ratio
+    picks = rng.integers(0, len(cats), spec.rows)
+    table = [cats[i] for i in picks]
+    table = [BILLS if bill else row for bill, row in zip(is_bill, table)]
+
+    names, food, controllable_chance, means = map(np.array, zip(*table))
+
+    start = np.datetime64(f"{year}-01-01")
+    days = (np.datetime64(f"{year + 1}-01-01") - start).astype(int)
+    dates = np.sort(start + rng.integers(0, days, spec.rows).astype("timedelta64[D]"))
+
+    prices = np.round(rng.gamma(2.0, means.astype(float) / 2.0), 2)
+
+    return pd.DataFrame(
+        {
+            Column.DATE: dates.astype("datetime64[ns]"),
+            "Description": names,
+            "Vendor": "_synthetic_",
+            Column.CATEGORY: names,
+            Column.PRICE: np.maximum(prices, 0.01),
+            Column.IS_FOOD: food.astype(int),
+            Column.CONTROLLABLE: (
+                rng.random(spec.rows) < controllable_chance.astype(float)
+            ).astype(int),
+        }
+    )
+
+
+def write_ledger(df: pd.DataFrame, path: str) -> None:
+    """
+    Writes a generated ledger to `path` in the format given by its extension.
+
+    Parameters:
+        df (DataFrame): a ledger returned by `generate_year`
+        path (str): where to write it, ending in .xlsx, .csv or .numbers
+
+    Returns:
+        None
+    """
+    if path.endswith(".xlsx"):
+        df.to_excel(path, sheet_name="Sheet1", index=False)
+
+    elif path.endswith(".csv"):
+        df.assign(**{Column.DATE: df[Column.DATE].dt.strftime("%m/%d/%Y")}).to_csv(
+            path, index=False
+        )
+
+    elif path.endswith(".numbers"):
+        from src.read_data.write_data import write_data
+
+        write_data(df, path)
+
+    else:
+        raise NotImplementedError(f"Can't write a ledger to {path}")
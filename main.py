@@ -1,17 +1,85 @@
 import sys
 
-from src.analyze_spending import analyze_spending
-from src.drivers.ui.ui_driver import UIDriver
-from src.initialize import initialize
+from src.models.paths import Paths
 from src.utilities.parse_args import parse_args, Subcommand
 
+# each command imports only what it needs, since matplotlib, Pandas and tkinter
+# take longer to import than some commands take to run
 if __name__ == "__main__":
     cmd = parse_args().subparser_name
+    with_file = (Subcommand.CLI, Subcommand.COMPACT, Subcommand.IMPORT)
+    if cmd in with_file and parse_args().file is not None:
+        Paths.set_spending_path(parse_args().file)
+    elif cmd in with_file or cmd == Subcommand.INIT:
+        Paths.set_year(parse_args().year)
+
     if cmd == Subcommand.INIT:
+        from src.initialize import initialize
+
         initialize()
+    elif cmd == Subcommand.CLI and (
+        parse_args().all_years or parse_args().years is not None
+    ):
+        from src.drivers.multi_year_driver import MultiYearDriver
+
+        if parse_args().file is not None or parse_args().watch:
+            raise ValueError("Can't analyze several years with --file or --watch")
+        if parse_args().profile or parse_args().pstats is not None:
+            raise ValueError("Can't analyze several years with --profile or --pstats")
+
+        results = MultiYearDriver(parse_args().years, parse_args().jobs).analyze(
+            rebuild=parse_args().rebuild,
+            stages=parse_args().only,
+            plots=parse_args().plots,
+        )
+        if any(res.error is not None for res in results):
+            sys.exit(1)
+    elif cmd == Subcommand.CLI and parse_args().watch:
+        from src.drivers.watch_driver import WatchDriver
+
+        if parse_args().profile or parse_args().pstats is not None:
+            raise ValueError("Can't watch the spreadsheet with --profile or --pstats")
+
+        WatchDriver(
+            parse_args().jobs,
+            parse_args().interval,
+            stages=parse_args().only,
+            plots=parse_args().plots,
+        ).watch(rebuild=parse_args().rebuild)
     elif cmd == Subcommand.CLI:
-        analyze_spending()
+        from src.analyze_spending import analyze_spending
+
+        analyze_spending(
+            jobs=parse_args().jobs,
+            rebuild=parse_args().rebuild,
+            profile=parse_args().profile,
+            pstats_path=parse_args().pstats,
+            stages=parse_args().only,
+            plots=parse_args().plots,
+        )
+    elif cmd == Subcommand.TRENDS:
+        from src.drivers.trends_driver import TrendsDriver
+
+        TrendsDriver(parse_args().years).trends(rebuild=parse_args().rebuild)
+    elif cmd == Subcommand.COMPACT:
+        from src.read_data.write_data import compact
+
+        count = compact(Paths.spending_path())
+        print(f"Wrote {count} transaction(s) to {Paths.spending_path()}")
+    elif cmd == Subcommand.IMPORT:
+        from src.read_data.import_transactions import import_transactions
+
+        result = import_transactions(
+            parse_args().source, Paths.spending_path(), dry_run=parse_args().dry_run
+        )
+        verb = "Would add" if parse_args().dry_run else "Added"
+        print(
+            f"{verb} {result.added} of {result.read} transaction(s) to "
+            + f"{Paths.spending_path()}, skipping {result.duplicates} duplicate(s)"
+        )
     elif cmd == Subcommand.UI:
+        from src.drivers.ui.ui_driver import UIDriver
+
         UIDriver().mainloop()
     else:
         raise ValueError(f"Invalid subcommand {sys.argv[1]}")
@@ -1,26 +1,77 @@
 from datetime import datetime
+from typing import Collection, List, Optional
 
 from src.drivers.visualization_driver import VisualizationDriver
 from src.drivers.aggregation_driver import AggregationDriver
 from src.drivers.validation_driver import ValidationDriver
+from src.models.paths import Paths
+from src.utilities.mask_cache import MASK_CACHE
+from src.utilities.parse_args import Stage
+from src.utilities.profiler import PROFILER
 
 
-def analyze_spending(verbose: bool = True) -> None:
+def analyze_spending(
+    verbose: bool = True,
+    jobs: int = 1,
+    rebuild: bool = False,
+    profile: bool = False,
+    pstats_path: Optional[str] = None,
+    stages: Optional[Collection[Stage]] = None,
+    plots: Optional[List[str]] = None,
+) -> None:
     """
     Runs the visualization script and performs aggregations.
 
     Parameters:
-        verbose (bool): whether to print the time taken. Default is True
+        verbose (bool): whether to print the time taken and how often filter
+            masks were reused. Default is True
+        jobs (int): how many processes to render plots in. Default is 1
+        rebuild (bool): whether to regenerate every output, even those whose
+            inputs haven't changed since they were last generated. Default is False
+        profile (bool): whether to record the time and memory taken by each
+            validation, plot and aggregation, and write a report. Default is False
+        pstats_path (Optional[str]): where to write cProfile statistics for the
+            whole run. Only used if `profile` is set. Default is None
+        stages (Optional[Collection[Stage]]): which stages to run. Default is
+            None, which runs only the plots if `plots` is given and every stage
+            otherwise
+        plots (Optional[List[str]]): the names of the plots to render. Default is
+            None, which renders all of them
 
     Returns:
         None
     """
     start = datetime.now()
-    ValidationDriver().validate_spending()
-    VisualizationDriver().visualize()
-    AggregationDriver().aggregate()
+    if profile:
+        PROFILER.enable(with_cprofile=pstats_path is not None)
+
+    if stages is None:
+        stages = [Stage.PLOTS] if plots is not None else list(Stage)
+
+    if Stage.VALIDATE in stages:
+        with PROFILER.stage("stage", Stage.VALIDATE):
+            ValidationDriver().validate_spending()
+
+    if Stage.PLOTS in stages:
+        with PROFILER.stage("stage", Stage.PLOTS):
+            VisualizationDriver(plots).visualize(jobs, rebuild)
+
+    if Stage.AGGREGATIONS in stages:
+        with PROFILER.stage("stage", Stage.AGGREGATIONS):
+            AggregationDriver().aggregate(rebuild)
+
+    if profile:
+        PROFILER.disable()
+        PROFILER.write_json(Paths.profile_path())
+        if pstats_path is not None:
+            PROFILER.dump_stats(pstats_path)
+
+        print(PROFILER.report())
+        print(f"Profile written to {Paths.profile_path()}")
+
     if verbose:
         print(
-            f"Completed in {round((datetime.now() - start).microseconds / 1e5, 2)}"
+            f"Completed in {round((datetime.now() - start).total_seconds(), 2)}"
             + " seconds."
         )
+        print(MASK_CACHE.report())
@@ -1,17 +1,19 @@
 import numpy as np
 import pandas as pd
 from typing import Dict
-from datetime import date, timedelta
 
 from src.models.day_counts import DayCounts
-from src.utilities.helpers import time_filter
 from src.read_data.column import Column
 from src.read_config.get_config import config_globals
+from src.utilities.decorators import memoize_by_frame
 
 
+@memoize_by_frame
 def monthly_spending(df: pd.DataFrame) -> Dict[str, float]:
     """
-    Calculates how much was spent each month in df.
+    Calculates how much was spent each month in df. Bills are spread over the
+    whole month, and other spending is prorated over the days that have data.
+    The result is remembered for as long as df is alive.
 
     Parameters:
         df (DataFrame): the Pandas DataFrame to analyze
@@ -20,33 +22,49 @@ def monthly_spending(df: pd.DataFrame) -> Dict[str, float]:
         monthly_spending (Dict[str, float]): mapping from month name to
             how much was spent that month
     """
-    current: date = df[Column.DATE].min().date()
-    end: date = df[Column.DATE].max().date()
-    res = {}
-    fmt = "%m/%d/%Y"
+    if df.shape[0] == 0:
+        return {}
+
+    thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
+    days_per_month = DayCounts.days_per_month()
 
-    while current <= end:
-        next_date = date(
-            current.year + int(current.month == DayCounts.months_per_year()),
-            (current.month % DayCounts.months_per_year()) + 1,
-            1,
-        ) - timedelta(days=1)
+    dates = df[Column.DATE].to_numpy()
+    prices = df[Column.PRICE].to_numpy(dtype=float)
+    months = dates.astype("datetime64[M]")
+    month_ends = ((months + 1).astype("datetime64[D]") - 1).astype(dates.dtype)
 
-        month_df = time_filter(df, current.strftime(fmt), next_date.strftime(fmt))
+    # each month runs through midnight of its last day
+    in_month = dates <= month_ends
+    is_bill = (df[Column.CATEGORY] == "Bills").to_numpy() & (
+        prices >= (thresh if thresh >= 0 else np.inf)
+    )
 
-        thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
-        filt_cond = (df[Column.CATEGORY] == "Bills") & (
-            df[Column.PRICE] >= (thresh if thresh >= 0 else np.inf)
+    bills = (
+        pd.Series(prices[in_month & is_bill]).groupby(months[in_month & is_bill]).sum()
+    )
+    rest = in_month & ~is_bill
+    spent = (
+        pd.DataFrame(
+            {"month": months[rest], "date": dates[rest], "price": prices[rest]}
         )
+        .groupby("month")
+        .agg(total=("price", "sum"), first=("date", "min"), last=("date", "max"))
+    )
 
-        bills = month_df.loc[filt_cond][Column.PRICE].sum()
-        month_df = month_df.loc[~filt_cond]
+    first_day = dates.min().astype("datetime64[D]")
+    res = {}
+    for month in np.arange(months.min(), months.max() + 1):
+        start = max(month.astype("datetime64[D]"), first_day)
+        days_in_period = ((month + 1).astype("datetime64[D]") - start).astype(int)
 
-        num_days = (month_df[Column.DATE].max() - month_df[Column.DATE].min()).days + 1
-        spent = (month_df[Column.PRICE].sum() / num_days) * DayCounts.days_per_month()
-        spent += (bills / ((next_date - current).days + 1)) * DayCounts.days_per_month()
+        if month in spent.index:
+            row = spent.loc[month]
+            num_days = (row["last"] - row["first"]).days + 1
+            total = (row["total"] / num_days) * days_per_month
+        else:
+            total = np.nan
 
-        res[current.strftime("%b")] = spent
-        current = next_date + timedelta(days=1)
+        total += (bills.get(month, 0.0) / days_in_period) * days_per_month
+        res[pd.Timestamp(month).strftime("%b")] = total
 
     return res
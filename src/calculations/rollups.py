@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from src.read_data.column import Column
+
+ROLLUP_COLUMNS = {
+    "year": "int64",
+    "month": "int64",
+    Column.CATEGORY: "str",
+    "total": "float",
+    "count": "int64",
+    "food": "float",
+    "controllable": "float",
+}
+
+
+def monthly_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Totals the spending in df by month and category. Unlike `monthly_spending`,
+    nothing is prorated, so rollups of different years can be added together.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to roll up
+
+    Returns:
+        rollup (DataFrame): one row per month and category with the year, the
+            month number, the category, the total spent, the number of
+            transactions, and how much of the total was food and controllable
+    """
+    if df.shape[0] == 0:
+        return empty_rollup()
+
+    prices = df[Column.PRICE].to_numpy(dtype=float)
+    dates = df[Column.DATE]
+    res = (
+        pd.DataFrame(
+            {
+                "year": dates.dt.year.to_numpy(dtype=np.int64),
+                "month": dates.dt.month.to_numpy(dtype=np.int64),
+                Column.CATEGORY: df[Column.CATEGORY].to_numpy(dtype=str),
+                "total": prices,
+                "count": np.ones(prices.shape[0], dtype=np.int64),
+                "food": np.where(
+                    df[Column.IS_FOOD].to_numpy(dtype=bool, na_value=False), prices, 0
+                ),
+                "controllable": np.where(
+                    df[Column.CONTROLLABLE].to_numpy(dtype=bool, na_value=False),
+                    prices,
+                    0,
+                ),
+            }
+        )
+        .groupby(["year", "month", Column.CATEGORY], as_index=False, sort=True)
+        .sum()
+    )
+    return res.astype(ROLLUP_COLUMNS)
+
+
+def empty_rollup() -> pd.DataFrame:
+    """
+    Returns a rollup without any rows.
+
+    Parameters:
+        None
+
+    Returns:
+        rollup (DataFrame): an empty DataFrame with the rollup columns
+    """
+    return pd.DataFrame(
+        {col: pd.Series(dtype=dtype) for col, dtype in ROLLUP_COLUMNS.items()}
+    )
+
+
+def year_over_year(rollups: pd.DataFrame) -> pd.DataFrame:
+    """
+    Totals the spending of each category in each year.
+
+    Parameters:
+        rollups (DataFrame): monthly rollups of any number of years
+
+    Returns:
+        totals (DataFrame): one row per category and one column per year, with a
+            "Total" row at the bottom. Categories without spending in a year
+            are 0
+    """
+    totals = rollups.pivot_table(
+        index=Column.CATEGORY,
+        columns="year",
+        values="total",
+        aggfunc="sum",
+        fill_value=0.0,
+    )
+    totals.loc["Total"] = totals.sum(axis=0)
+    totals.columns.name = None
+    return totals
+
+
+def seasonality(rollups: pd.DataFrame) -> pd.DataFrame:
+    """
+    Totals the spending of each month in each year.
+
+    Parameters:
+        rollups (DataFrame): monthly rollups of any number of years
+
+    Returns:
+        totals (DataFrame): one row per month number from 1 to 12 and one
+            column per year. Months without data are NaN
+    """
+    totals = rollups.pivot_table(
+        index="month", columns="year", values="total", aggfunc="sum"
+    )
+    totals.columns.name = None
+    return totals.reindex(range(1, 13))
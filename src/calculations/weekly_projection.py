@@ -1,13 +1,12 @@
+import calendar
 import numpy as np
 import pandas as pd
 from typing import List
-from datetime import datetime, timedelta, date
 
 from src.models.day_counts import DayCounts
-from src.utilities.helpers import get_weeks, time_filter
+from src.utilities.helpers import get_weeks
 from src.read_data.column import Column
 from src.read_config.get_config import config_globals
-from src.utilities.df_common import group_by_month
 
 
 def weekly_projection(df: pd.DataFrame) -> List[float]:
@@ -21,61 +20,56 @@ def weekly_projection(df: pd.DataFrame) -> List[float]:
         week_spent (List[float]): how much was spent per week,
             projected as a per_month total
     """
-    fmt = "%m/%d/%Y"
-    one_week = timedelta(weeks=1)
-    all_dates = get_weeks(df[Column.DATE].min().date(), df[Column.DATE].max().date())
-    month_starts, month_dfs = group_by_month(df)
+    if df.shape[0] == 0:
+        return []
+
+    weeks = get_weeks(df[Column.DATE].min().date(), df[Column.DATE].max().date())
+    if len(weeks) == 0:
+        return []
 
     thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
-    filt_cond = (df[Column.CATEGORY] == "Bills") & (
-        df[Column.PRICE] >= (thresh if thresh > 0 else np.inf)
+    prices = df[Column.PRICE].to_numpy(dtype=float)
+    is_bill = (df[Column.CATEGORY] == "Bills").to_numpy() & (
+        prices >= (thresh if thresh > 0 else np.inf)
     )
 
-    monthly_bills = {}
-    for month_dtm, sub_df in zip(month_starts, month_dfs):
-        monthly_bills[month_dtm.strftime("%B")] = sub_df.loc[filt_cond]
-
-    df = df.loc[~filt_cond]
+    # each week covers its first day through midnight of its seventh day
+    dates = df[Column.DATE].to_numpy()
+    one_week = np.timedelta64(7, "D")
+    offsets = dates - np.datetime64(weeks[0], "ns")
+    week_codes = offsets // one_week
+    in_week = (
+        (offsets >= np.timedelta64(0))
+        & (week_codes < len(weeks))
+        & (offsets - week_codes * one_week <= np.timedelta64(6, "D"))
+    )
 
-    fmt = "%m/%d/%Y"
-    avgs = []
-    for i in range(len(all_dates)):
-        dtm = datetime.combine(all_dates[i], datetime.min.time())
-        week_df = time_filter(
-            df,
-            datetime.strftime(dtm, fmt),
-            datetime.strftime(dtm + one_week - timedelta(days=1), fmt),
-        )
+    spent = in_week & ~is_bill
+    week_totals = np.bincount(
+        week_codes[spent],
+        weights=np.nan_to_num(prices[spent]),
+        minlength=len(weeks),
+    )
+    week_counts = np.bincount(week_codes[spent], minlength=len(weeks))
 
-        mo = dtm.strftime("%B")
-        if mo in monthly_bills:
-            week_df = week_df.loc[
-                ~week_df[Column.TRANSACTION_ID].isin(
-                    list(monthly_bills[mo][Column.TRANSACTION_ID])
-                )
-            ]
+    month_codes = (df[Column.DATE].dt.year * 12 + df[Column.DATE].dt.month).to_numpy()
+    monthly_bills = (
+        pd.Series(prices[is_bill]).groupby(month_codes[is_bill]).sum().to_dict()
+    )
 
-        if week_df.shape[0] == 0:
+    days_per_month = DayCounts.days_per_month()
+    avgs = []
+    for week_start, total, count in zip(weeks, week_totals, week_counts):
+        if count == 0:
             avgs.append(0.0)
-        else:
-            monthly_bill_smooth = monthly_bills[mo][Column.PRICE].sum() * (
-                DayCounts.days_per_month()
-                / (
-                    date(
-                        dtm.year + int(dtm.month == DayCounts.months_per_year()),
-                        (dtm.month % DayCounts.months_per_year()) + 1,
-                        1,
-                    )
-                    - timedelta(days=1)
-                ).day
-            )
+            continue
 
-            avgs.append(
-                (
-                    (week_df[Column.PRICE].sum() / one_week.days)
-                    * DayCounts.days_per_month()
-                )
-                + monthly_bill_smooth
-            )
+        month_code = week_start.year * 12 + week_start.month
+        monthly_bill_smooth = monthly_bills.get(month_code, 0.0) * (
+            days_per_month / calendar.monthrange(week_start.year, week_start.month)[1]
+        )
+        avgs.append(
+            (total / DayCounts.days_per_week()) * days_per_month + monthly_bill_smooth
+        )
 
     return avgs
@@ -1,9 +1,10 @@
 import pandas as pd
-from os.path import join
+from os.path import join, exists
 from typing import Any, Dict, List
 
 from src.models.day_counts import DayCounts
 from src.models.paths import Paths
+from src.models.manifest import Manifest
 from src.utilities.helpers import format_currency
 from src.read_data.read_data import read_data
 from src.read_config.custom_aggregations import custom_aggregations
@@ -13,6 +14,12 @@ from src.utilities.get_funcs_from_module import (
 )
 from src.read_data.column import Column
 from src.read_data.write_data import write_data
+from src.utilities.profiler import PROFILER
+from src.utilities.fingerprints import (
+    combine_fingerprints,
+    config_fingerprint,
+    frame_fingerprint,
+)
 
 
 class AggregationDriver:
@@ -22,6 +29,19 @@ class AggregationDriver:
 
     num_days: int
 
+    def _fingerprint(self) -> str:
+        """
+        Fingerprints everything the aggregations are calculated from.
+        """
+        return combine_fingerprints(
+            frame_fingerprint(read_data(Paths.spending_path())),
+            config_fingerprint("globals", "aggregations"),
+            Paths.get_year(),
+            *sorted(
+                get_modules_from_folder(join("src", "calculations", "aggregations"))
+            ),
+        )
+
     def _get_aggs(self) -> Dict[str, Any]:
         """
         Performs all the aggregations and formats them into a dictionary.
@@ -36,7 +56,9 @@ class AggregationDriver:
             join("src", "calculations", "aggregations")
         ):
             for func in get_funcs_from_module(path):
-                agg_val = func(spending)
+                with PROFILER.stage("aggregation", func.__name__):
+                    agg_val = func(spending)
+
                 if hasattr(agg_val, "__iter__") and not isinstance(agg_val, str):
                     for label, amount in agg_val:
                         out[to_title(label)] = amount
@@ -61,17 +83,28 @@ class AggregationDriver:
 
         return str(val)
 
-    def aggregate(self) -> None:
+    def aggregate(self, rebuild: bool = False) -> None:
         """
         Performs a series of aggregations writes the output to the
-        plots directory.
+        plots directory. Skipped if the data and configs haven't changed since
+        the aggregations were last written.
 
         Parameters:
-            None
+            rebuild (bool): whether to recalculate the aggregations even if they
+                are up to date. Default is False
 
         Returns:
             None
         """
+        manifest = Manifest(Paths.manifest_path())
+        fingerprint = self._fingerprint()
+        if (
+            not rebuild
+            and exists(Paths.aggregation_path())
+            and manifest.is_current("aggregations", fingerprint)
+        ):
+            return
+
         aggs = self._get_aggs()
 
         cols: Dict[str, List[str]] = {
@@ -114,3 +147,4 @@ class AggregationDriver:
                 cols[col].append(val)
 
         write_data(pd.DataFrame(cols), Paths.aggregation_path())
+        manifest.update("aggregations", fingerprint)
@@ -0,0 +1,172 @@
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Collection, List, Optional
+
+from src.analyze_spending import analyze_spending
+from src.models.paths import Paths
+from src.read_config.get_config import get_config, use_config
+from src.utilities.parse_args import Stage
+
+
+@dataclass
+class YearResult:
+    """
+    The outcome of analyzing one year.
+
+    Attributes:
+        year (int): the year analyzed
+        seconds (float): how long the analysis took
+        error (Optional[str]): the traceback if the analysis failed, else None
+    """
+
+    year: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def _init_worker(config: dict, data_root: str) -> None:
+    """
+    Prepares a worker process to analyze years without a display, using the
+    configs read by the main process.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    use_config(config)
+    Paths.set_data_root(data_root)
+
+
+def analyze_year(
+    year: int,
+    rebuild: bool = False,
+    stages: Optional[Collection[Stage]] = None,
+    plots: Optional[List[str]] = None,
+) -> YearResult:
+    """
+    Runs the whole analysis for one year, catching any error.
+
+    Parameters:
+        year (int): the year to analyze
+        rebuild (bool): whether to regenerate every output. Default is False
+        stages (Optional[Collection[Stage]]): which stages to run. Default is
+            None, which runs the default stages of `analyze_spending`
+        plots (Optional[List[str]]): the names of the plots to render. Default is
+            None, which renders all of them
+
+    Returns:
+        result (YearResult): how long the analysis took and any error
+    """
+    Paths.set_year(year)
+    start = perf_counter()
+    try:
+        analyze_spending(verbose=False, rebuild=rebuild, stages=stages, plots=plots)
+    except Exception:
+        return YearResult(year, perf_counter() - start, traceback.format_exc())
+
+    return YearResult(year, perf_counter() - start)
+
+
+class MultiYearDriver:
+    """
+    Class to analyze several years at once, each in its own worker process
+    since `Paths` only holds one year at a time.
+
+    Attributes:
+        years (List[int]): the years to analyze
+        jobs (int): how many years to analyze at once
+    """
+
+    years: List[int]
+    jobs: int
+
+    def __init__(self, years: Optional[List[int]] = None, jobs: int = 1) -> None:
+        """
+        Finds the years to analyze.
+
+        Parameters:
+            years (Optional[List[int]]): the years to analyze. Default is None,
+                which analyzes every year with a spreadsheet in the data directory
+            jobs (int): how many years to analyze at once. Default is 1
+
+        Returns:
+            None
+        """
+        self.years = Paths.available_years() if years is None else sorted(years)
+        self.jobs = jobs
+
+    def analyze(
+        self,
+        rebuild: bool = False,
+        stages: Optional[Collection[Stage]] = None,
+        plots: Optional[List[str]] = None,
+    ) -> List[YearResult]:
+        """
+        Analyzes every year, then prints how long each took and which failed.
+        With one job, the years are analyzed one after another in this process.
+        Otherwise they're spread over a pool of worker processes, which all use
+        the configs read here.
+
+        Parameters:
+            rebuild (bool): whether to regenerate every output. Default is False
+            stages (Optional[Collection[Stage]]): which stages to run. Default is
+                None, which runs the default stages of `analyze_spending`
+            plots (Optional[List[str]]): the names of the plots to render.
+                Default is None, which renders all of them
+
+        Returns:
+            results (List[YearResult]): the result of each year, in order
+        """
+        available = set(Paths.available_years())
+        missing = [
+            YearResult(year, 0.0, "No spending spreadsheet found")
+            for year in self.years
+            if year not in available
+        ]
+        years = [year for year in self.years if year in available]
+
+        if self.jobs <= 1 or len(years) <= 1:
+            results = [analyze_year(year, rebuild, stages, plots) for year in years]
+
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(years)),
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(get_config(), Paths.get_data_root()),
+            ) as pool:
+                futures = [
+                    pool.submit(analyze_year, year, rebuild, stages, plots)
+                    for year in years
+                ]
+
+            results = [future.result() for future in futures]
+
+        results = sorted(results + missing, key=lambda res: res.year)
+        print(self.report(results))
+        return results
+
+    def report(self, results: List[YearResult]) -> str:
+        """
+        Summarizes the results of each year.
+
+        Parameters:
+            results (List[YearResult]): the results to summarize
+
+        Returns:
+            report (str): a line per year, followed by the errors of the years
+                that failed
+        """
+        lines = []
+        errors = []
+        for res in results:
+            status = "ok" if res.error is None else "FAILED"
+            lines.append(f"{res.year}  {status:<6} {res.seconds:8.2f}s")
+            if res.error is not None:
+                errors.append(f"\n{res.year}:\n{res.error.rstrip()}")
+
+        failed = len(errors)
+        lines.append(f"{len(results) - failed} succeeded, {failed} failed")
+        return "\n".join(lines + errors)
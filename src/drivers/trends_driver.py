@@ -0,0 +1,107 @@
+from os import makedirs
+from os.path import basename, exists, join, splitext
+from typing import List, Optional
+
+from src.calculations.rollups import seasonality, year_over_year
+from src.models.manifest import Manifest
+from src.models.paths import Paths
+from src.models.rollup_store import RollupStore
+from src.read_data.write_data import write_data
+from src.utilities.fingerprints import combine_fingerprints
+from src.utilities.get_funcs_from_module import (
+    get_funcs_from_module,
+    get_modules_from_folder,
+)
+
+
+class TrendsDriver:
+    """
+    Class to compare spending across years. Each year is reduced to monthly
+    rollups, which are kept up to date in the rollup store, and every multi-year
+    plot and aggregation is computed from them instead of the spreadsheets.
+
+    Attributes:
+        years (List[int]): the years to compare
+        store (RollupStore): where the rollups of each year are kept
+    """
+
+    years: List[int]
+    store: RollupStore
+
+    def __init__(self, years: Optional[List[int]] = None) -> None:
+        """
+        Finds the years to compare.
+
+        Parameters:
+            years (Optional[List[int]]): the years to compare. Default is None,
+                which compares every year with a spreadsheet in the data directory
+
+        Returns:
+            None
+        """
+        available = Paths.available_years()
+        if years is not None:
+            missing = sorted(set(years) - set(available))
+            if len(missing) > 0:
+                raise ValueError(
+                    f"No spending spreadsheet for {', '.join(map(str, missing))}"
+                )
+
+        self.years = available if years is None else sorted(set(years))
+        self.store = RollupStore(Paths.rollups_dir())
+
+    def trends(self, rebuild: bool = False) -> None:
+        """
+        Refreshes the rollups of any year whose spreadsheet changed, then writes
+        the multi-year plots and aggregations to the trends directory. They're
+        skipped if none of the rollups changed since they were last written and
+        every output is still there.
+
+        Parameters:
+            rebuild (bool): whether to rebuild every rollup and output, even
+                those that are up to date. Default is False
+
+        Returns:
+            None
+        """
+        if len(self.years) == 0:
+            raise ValueError("No years with a spending spreadsheet to compare")
+
+        self.store.refresh(self.years, rebuild)
+
+        out_dir = Paths.trends_dir()
+        makedirs(out_dir, exist_ok=True)
+        tables = {"year_over_year": year_over_year, "seasonality": seasonality}
+        plot_modules = get_modules_from_folder(
+            join("src", "visualizations", "multi_year")
+        )
+        # each multi-year plotting module writes a plot named after itself
+        outputs = [f"{name}.csv" for name in tables] + [
+            splitext(basename(mod))[0] + ".png" for mod in plot_modules
+        ]
+
+        manifest = Manifest(join(out_dir, ".manifest.json"))
+        fingerprint = combine_fingerprints(
+            *((year, self.store.manifest.entries.get(str(year))) for year in self.years)
+        )
+        if (
+            not rebuild
+            and manifest.is_current("trends", fingerprint)
+            and all(exists(join(out_dir, output)) for output in outputs)
+        ):
+            return
+
+        rollups = self.store.load(self.years)
+        if rollups.shape[0] == 0:
+            raise ValueError("None of the spreadsheets have any spending")
+
+        for name, table in tables.items():
+            write_data(
+                table(rollups).round(2).reset_index(), join(out_dir, f"{name}.csv")
+            )
+
+        for mod in plot_modules:
+            for plotter in get_funcs_from_module(mod):
+                plotter(rollups, out_dir)
+
+        manifest.update("trends", fingerprint)
@@ -20,7 +20,8 @@ from src.initialize import add_spending_sheet
 
 from src.read_data.read_data import read_data
 from src.read_data.column import Column
-from src.read_data.write_data import write_data
+from src.read_data.write_data import append_transactions
+from src.read_data.import_transactions import import_transactions
 
 from src.drivers.ui.styling import ColorScheme, PADDING, TITLE
 from src.drivers.ui.widgets import (
@@ -99,11 +100,16 @@ class UIDriver(tk.Tk):
         self.new_path_button = button(self.input_frame, "Change path", self.change_path)
         self.new_path_button.grid(padx=PADDING, pady=PADDING / 2, row=1, column=0)
 
+        self.import_button = button(
+            self.input_frame, "Import batch", self.import_handler
+        )
+        self.import_button.grid(padx=PADDING, pady=PADDING / 2, row=2, column=0)
+
         self.analyze_button = button(
             self.input_frame, "Start analysis", self.file_handler
         )
         self.analyze_button.grid(
-            padx=PADDING, pady=(PADDING / 2, PADDING), row=2, column=0
+            padx=PADDING, pady=(PADDING / 2, PADDING), row=3, column=0
         )
 
     def _add_output_frame(self) -> None:
@@ -208,13 +214,41 @@ class UIDriver(tk.Tk):
         try:
             df = read_data(refs)
             new_year = cast(datetime, df[Column.DATE].median()).year
-            Paths._year_mut[0] = new_year
-            Paths._sheet_override[0] = refs
+            Paths.set_year(new_year)
+            Paths.set_spending_path(refs)
             self.filename_label.config(text=self.filename_text(Paths.spending_path()))
 
         except Exception as e:
             self.error(str(e))
 
+    def import_handler(self) -> None:
+        """
+        Adds a batch of transactions from a file to the spreadsheet.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        refs = fd.askopenfilename(
+            parent=self,
+            title="Transactions to import:",
+            filetypes=(("transactions", ["*.csv", "*.txt", "*.jsonl", "*.json"]),),
+        )
+        if len(refs) == 0:
+            return
+
+        try:
+            result = import_transactions(refs, Paths.spending_path())
+            self.info_label.config(
+                text=f"Imported {result.added} transactions, "
+                + f"skipping {result.duplicates} duplicates."
+            )
+
+        except Exception as e:
+            self.error(str(e))
+
     def file_handler(self) -> None:
         """
         Processes the files and creates the plots and aggregations.
@@ -245,10 +279,18 @@ class UIDriver(tk.Tk):
 
                 add_file(Paths.aggregation_path())
 
-                for dir_path, _, file_names in walk(Paths.this_years_data()):
+                profile = abspath(Paths.profile_path())
+                for dir_path, dir_names, file_names in walk(Paths.this_years_data()):
+                    dir_names[:] = [d for d in dir_names if not d.startswith(".")]
                     for file in file_names:
-                        if splitext(file)[1] not in ALLOWED_EXTNS:
-                            add_file(join(dir_path, file))
+                        path = join(dir_path, file)
+                        skipped = (
+                            file.startswith(".")
+                            or splitext(file)[1] in ALLOWED_EXTNS
+                            or abspath(path) == profile
+                        )
+                        if not skipped:
+                            add_file(path)
 
             self.info_label.config(text="Archive created!")
 
@@ -282,8 +324,8 @@ class UIDriver(tk.Tk):
                 self.info_label.config(text=f"Invalid value for {col}: '{val}'")
                 return
 
-        Paths._year_mut[0] = cols[Column.DATE][0].year
-        write_data(pd.DataFrame(cols), Paths.spending_path(), mode="a")
+        Paths.set_year(cols[Column.DATE][0].year)
+        append_transactions(pd.DataFrame(cols), Paths.spending_path())
         self.info_label.config(text="Transaction added!")
 
         for col, var in self.transaction_vars.items():
@@ -1,5 +1,5 @@
 from os import makedirs
-from os.path import join, exists
+from os.path import basename, join, exists
 
 from src.read_data.read_data import read_data
 from src.models.paths import Paths
@@ -8,6 +8,7 @@ from src.utilities.get_funcs_from_module import (
     get_modules_from_folder,
 )
 from src.initialize import add_spending_sheet
+from src.utilities.profiler import PROFILER
 
 
 class ValidationDriver:
@@ -30,8 +31,10 @@ class ValidationDriver:
         if not exists(Paths.spending_path()):
             add_spending_sheet()
 
-        df = read_data(Paths.spending_path())
+        with PROFILER.stage("read", basename(Paths.spending_path())):
+            df = read_data(Paths.spending_path())
 
         for mod in get_modules_from_folder(join("src", "read_data", "validations")):
             for func in get_funcs_from_module(mod):
-                func(df)
+                with PROFILER.stage("validation", func.__name__):
+                    func(df)
@@ -1,18 +1,70 @@
 import pandas as pd
-from os import makedirs
-from os.path import join
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import makedirs, listdir
+from os.path import join, basename, normpath, splitext
+from typing import Collection, List, Optional, Set, Tuple, cast
 
 from src.models.paths import Paths
+from src.models.manifest import Manifest
 from src.read_data.read_data import read_data, get_month_dfs
 from src.utilities.get_funcs_from_module import (
     get_funcs_from_module,
     get_modules_from_folder,
 )
 from src.read_data.column import Column
+from src.utilities.profiler import PROFILER, StageRecord
+from src.utilities.fingerprints import (
+    combine_fingerprints,
+    config_fingerprint,
+    frame_fingerprint,
+)
 
 from src.read_config.plotters_from_config import plotters_from_config, Plotter
 
+PlotJob = Tuple[Plotter, pd.DataFrame, str]
+PlotFolder = Tuple[str, pd.DataFrame, List[Plotter]]
+
+
+def plotter_name(plotter: Plotter) -> str:
+    """
+    Returns a readable name for the plotter, which is the key in the config
+    file for configured plots and the function name otherwise.
+
+    Parameters:
+        plotter (Plotter): the plotting function
+
+    Returns:
+        name (str): the name of the plotter
+    """
+    return getattr(getattr(plotter, "__self__", None), "plot_name", plotter.__name__)
+
+
+def _init_worker(year: int, sheet_override: str, data_root: str, profile: bool) -> None:
+    """
+    Prepares a worker process to render plots without a display.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    Paths.set_year(year)
+    Paths.set_spending_path(sheet_override)
+    Paths.set_data_root(data_root)
+    if profile:
+        PROFILER.enable()
+
+
+def _render(plotter: Plotter, df: pd.DataFrame, out_dir: str) -> List[StageRecord]:
+    """
+    Renders one plot in a worker process, returning how long it took if the
+    profiler is enabled.
+    """
+    PROFILER.records = []
+    with PROFILER.stage("plot", plotter_name(plotter)):
+        plotter(df, out_dir)
+
+    return PROFILER.records
+
 
 class VisualizationDriver:
     """
@@ -21,64 +73,180 @@ class VisualizationDriver:
     Attributes:
         monthlys (List[Plotter]): the plotters to call each month
         yearlys (List[Plotters]): the plotters to call each year
+        selected (Optional[Set[str]]): the names of the plots to render, or None
+            if every plot is rendered
     """
 
     monthlys: List[Plotter]
     yearlys: List[Plotter]
+    selected: Optional[Set[str]]
 
-    def __init__(self) -> None:
-        makedirs(join(Paths.plots_dir(), "Combined"), exist_ok=True)
-        self.monthlys, self.yearlys = plotters_from_config()
-
-        visualizers = join("src", "visualizations")
-
-        for mod in get_modules_from_folder(join(visualizers, "monthly")):
-            for func in get_funcs_from_module(mod):
-                self.monthlys.append(func)
-
-        for mod in get_modules_from_folder(join(visualizers, "yearly")):
-            for func in get_funcs_from_module(mod):
-                self.yearlys.append(func)
-
-    def _plot_df(self, df: pd.DataFrame, out_dir: str) -> None:
+    def __init__(self, plots: Optional[Collection[str]] = None) -> None:
         """
-        Makes a bunch of plots for the dataframe and puts them in the `out_dir`
-        directory.
+        Loads the plotters.
 
         Parameters:
-            df (DataFrame): a Pandas DataFrame to plot
-            out_dir (str): the out_dir path to put the plots in
+            plots (Optional[Collection[str]]): the names of the plots to render,
+                which are either keys of the plots in the configs or names of
+                the plotting modules. Only the plotting modules that are needed
+                are imported. Default is None, which renders every plot
 
         Returns:
             None
         """
-        for m in self.monthlys:
-            m(df, out_dir)
+        makedirs(join(Paths.plots_dir(), "Combined"), exist_ok=True)
+        self.selected = None if plots is None else set(plots)
+        self.monthlys, self.yearlys = plotters_from_config(self.selected)
 
-    def visualize(self) -> None:
+        visualizers = join("src", "visualizations")
+        folders = {
+            "monthly": get_modules_from_folder(join(visualizers, "monthly")),
+            "yearly": get_modules_from_folder(join(visualizers, "yearly")),
+        }
+        stem = lambda mod: splitext(basename(mod))[0]
+        stems = {stem(mod) for mods in folders.values() for mod in mods}
+        # names that aren't configured plots or modules may be functions in any
+        # module, in which case every module has to be searched
+        unmatched = (
+            set()
+            if self.selected is None
+            else self.selected
+            - set(map(plotter_name, self.monthlys + self.yearlys))
+            - stems
+        )
+
+        for timeframe, plotters in (
+            ("monthly", self.monthlys),
+            ("yearly", self.yearlys),
+        ):
+            for mod in folders[timeframe]:
+                load_all = self.selected is None or stem(mod) in self.selected
+                if not (load_all or len(unmatched) > 0):
+                    continue
+
+                for func in get_funcs_from_module(mod):
+                    if load_all or func.__name__ in cast(Set[str], self.selected):
+                        plotters.append(func)
+
+        if self.selected is not None:
+            found = set(map(plotter_name, self.monthlys + self.yearlys))
+            missing = self.selected - found - stems
+            if len(missing) > 0:
+                raise ValueError(f"No plots named {', '.join(sorted(missing))}")
+
+    def _folders(self) -> List[PlotFolder]:
         """
-        Creates plots of all the spreadsheets. Main driver for
-        the visualizations.
-
-        Parameters:
-            None
-
-        Returns:
-            None
+        Lists every folder of plots, with the data and plotters for each.
         """
         all_dfs = read_data(Paths.spending_path())
-        months = get_month_dfs(all_dfs)
-        for df in months:
+        folders: List[PlotFolder] = []
+        for df in get_month_dfs(all_dfs):
             dates_in_df = list(df.sort_values(Column.DATE)[Column.DATE])
             month = dates_in_df[len(dates_in_df) // 2].strftime("%B")
             out_dir = join(Paths.plots_dir(), month)
             makedirs(out_dir, exist_ok=True)
-            self._plot_df(df, out_dir)
+            folders.append((out_dir, df, self.monthlys))
 
         combined_path = join(Paths.plots_dir(), "Combined")
-        plot_funcs = [
-            self._plot_df,
-            *self.yearlys,
-        ]
-        for f in plot_funcs:
-            f(all_dfs, combined_path)
+        folders.append((combined_path, all_dfs, self.monthlys + self.yearlys))
+        return folders
+
+    def _fingerprint(self, df: pd.DataFrame) -> str:
+        """
+        Fingerprints everything a folder of plots is generated from.
+        """
+        return combine_fingerprints(
+            frame_fingerprint(df),
+            config_fingerprint("globals", "plots"),
+            Paths.get_year(),
+            *map(plotter_name, self.monthlys + self.yearlys),
+        )
+
+    def _render_parallel(
+        self, jobs: List[PlotJob], num_workers: int
+    ) -> List[Tuple[str, str]]:
+        """
+        Renders the plots in a pool of worker processes, waiting for all of them
+        to finish. Returns the directory and a description of every plot that
+        failed.
+        """
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                Paths.get_year(),
+                Paths.get_spending_override(),
+                Paths.get_data_root(),
+                PROFILER.enabled,
+            ),
+        ) as pool:
+            futures = [pool.submit(_render, *job) for job in jobs]
+
+        errors = []
+        for (plotter, _, out_dir), future in zip(jobs, futures):
+            exc = future.exception()
+            if exc is not None:
+                name = join(out_dir, plotter_name(plotter))
+                errors.append((out_dir, f"{name}: {exc!r}"))
+
+            else:
+                PROFILER.records.extend(future.result())
+
+        return errors
+
+    def visualize(self, jobs: int = 1, rebuild: bool = False) -> None:
+        """
+        Creates plots of all the spreadsheets. Main driver for
+        the visualizations. Folders whose data, configs and plotters haven't
+        changed since they were last rendered are skipped. If only some plots
+        are selected, they're always rendered, and the folders aren't marked as
+        up to date since the other plots weren't.
+
+        Parameters:
+            jobs (int): how many processes to render the plots in. If more than
+                one, each plot is rendered in a worker process using the Agg
+                backend. Default is 1
+            rebuild (bool): whether to render every folder, even those that are
+                up to date. Default is False
+
+        Returns:
+            None
+        """
+        manifest = Manifest(Paths.manifest_path())
+        stale: List[Tuple[str, str, str, List[PlotJob]]] = []
+        for out_dir, df, plotters in self._folders():
+            key = "plots/" + basename(normpath(out_dir))
+            fingerprint = self._fingerprint(df)
+            if (
+                rebuild
+                or not manifest.is_current(key, fingerprint)
+                or len(listdir(out_dir)) == 0
+            ):
+                jobs_in_folder = [(p, df, out_dir) for p in plotters]
+                stale.append((key, out_dir, fingerprint, jobs_in_folder))
+
+        if jobs <= 1:
+            for key, _, fingerprint, jobs_in_folder in stale:
+                for plotter, df, out_dir in jobs_in_folder:
+                    with PROFILER.stage("plot", plotter_name(plotter)):
+                        plotter(df, out_dir)
+
+                if self.selected is None:
+                    manifest.update(key, fingerprint)
+
+            return
+
+        errors = self._render_parallel(
+            [job for *_, jobs_in_folder in stale for job in jobs_in_folder], jobs
+        )
+        failed_dirs = {out_dir for out_dir, _ in errors}
+        for key, out_dir, fingerprint, _ in stale:
+            if out_dir not in failed_dirs and self.selected is None:
+                manifest.update(key, fingerprint)
+
+        if len(errors) > 0:
+            raise RuntimeError(
+                f"{len(errors)} plot(s) failed to render:\n"
+                + "\n".join(message for _, message in errors)
+            )
@@ -0,0 +1,213 @@
+import traceback
+from copy import deepcopy
+from os import stat
+from time import sleep
+from typing import Collection, Dict, List, Optional, Tuple
+
+from src.analyze_spending import analyze_spending
+from src.drivers.aggregation_driver import AggregationDriver
+from src.drivers.validation_driver import ValidationDriver
+from src.drivers.visualization_driver import VisualizationDriver
+from src.models.paths import Paths
+from src.read_config.get_config import get_config
+from src.read_data.journal import journal_path
+from src.read_data.read_data import read_data
+from src.utilities.decorators import clear_frame_memos
+from src.utilities.mask_cache import MASK_CACHE
+from src.utilities.parse_args import Stage
+
+Snapshot = Dict[str, Optional[Tuple[int, int]]]
+
+
+def stages_to_run(
+    spending_changed: bool, old_config: dict, new_config: dict
+) -> List[Stage]:
+    """
+    Decides which stages have to be re-run after the inputs change.
+
+    Parameters:
+        spending_changed (bool): whether the spreadsheet changed
+        old_config (dict): the configs from the last run
+        new_config (dict): the configs now
+
+    Returns:
+        stages (List[Stage]): the stages to run, in order
+    """
+    changed = {
+        section
+        for section in old_config.keys() | new_config.keys()
+        if old_config.get(section) != new_config.get(section)
+    }
+    # the plots and aggregations stages only read their own config sections
+    own_sections = {Stage.PLOTS, Stage.AGGREGATIONS}
+    if spending_changed or len(changed - own_sections) > 0:
+        return list(Stage)
+
+    return [stage for stage in Stage if stage in changed]
+
+
+class WatchDriver:
+    """
+    Class to re-run the analysis whenever the spreadsheet or configs change.
+    The process stays alive between runs, so the imports, plotting modules and
+    anything that didn't change are kept in memory.
+
+    Attributes:
+        jobs (int): how many processes to render plots in
+        interval (float): how many seconds to wait between checking the files
+        stages (Optional[Collection[Stage]]): which stages to run, or None for
+            the default of `analyze_spending`
+        plots (Optional[List[str]]): the names of the plots to render, or None
+            to render all of them
+    """
+
+    jobs: int
+    interval: float
+    stages: Optional[Collection[Stage]]
+    plots: Optional[List[str]]
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        interval: float = 1.0,
+        stages: Optional[Collection[Stage]] = None,
+        plots: Optional[List[str]] = None,
+    ) -> None:
+        self.jobs = jobs
+        self.interval = interval
+        self.stages = stages
+        self.plots = plots
+
+    def _watched(self) -> List[str]:
+        """
+        Returns the paths of the files to watch.
+        """
+        return [
+            Paths.spending_path(),
+            journal_path(Paths.spending_path()),
+            Paths.config_path(),
+            Paths.base_config(),
+        ]
+
+    def _snapshot(self) -> Snapshot:
+        """
+        Returns the modification time and size of each watched file, or None if
+        it doesn't exist.
+        """
+        snapshot: Snapshot = {}
+        for path in self._watched():
+            try:
+                info = stat(path)
+                snapshot[path] = (info.st_mtime_ns, info.st_size)
+
+            except OSError:
+                snapshot[path] = None
+
+        return snapshot
+
+    def _wait_for_change(self, last: Snapshot) -> Snapshot:
+        """
+        Polls the watched files until they change, then until they stop
+        changing, so a file isn't read while it's still being saved.
+        """
+        current = last
+        while current == last:
+            sleep(self.interval)
+            current = self._snapshot()
+
+        settled = None
+        while settled != current:
+            settled = current
+            sleep(self.interval)
+            current = self._snapshot()
+
+        return current
+
+    def _reload(self, spending_changed: bool) -> List[Stage]:
+        """
+        Drops the caches made stale by the change and returns the stages to
+        re-run.
+        """
+        old_config = deepcopy(get_config())
+        get_config.cache_clear()
+        if spending_changed:
+            read_data.cache_clear()
+
+        clear_frame_memos()
+        MASK_CACHE.clear()
+
+        return stages_to_run(spending_changed, old_config, get_config())
+
+    def _run(self, stages: List[Stage]) -> None:
+        """
+        Runs the given stages, reporting errors instead of raising them so the
+        watch can continue.
+        """
+        try:
+            if Stage.VALIDATE in stages:
+                ValidationDriver().validate_spending()
+
+            if Stage.PLOTS in stages:
+                VisualizationDriver(self.plots).visualize(self.jobs)
+
+            if Stage.AGGREGATIONS in stages:
+                AggregationDriver().aggregate()
+
+        except Exception:
+            traceback.print_exc()
+            return
+
+        print(f"Updated: {', '.join(stages)}")
+
+    def watch(self, rebuild: bool = False, max_runs: Optional[int] = None) -> None:
+        """
+        Runs the analysis, then waits for the spreadsheet or the configs to change
+        and re-runs the stages they affect. Stops on a keyboard interrupt.
+
+        Parameters:
+            rebuild (bool): whether the first run should regenerate every
+                output. Default is False
+            max_runs (Optional[int]): how many times to re-run before returning.
+                Default is None, which watches until interrupted
+
+        Returns:
+            None
+        """
+        try:
+            analyze_spending(
+                jobs=self.jobs, rebuild=rebuild, stages=self.stages, plots=self.plots
+            )
+        except Exception:
+            traceback.print_exc()
+
+        last = self._snapshot()
+
+        print(f"Watching {', '.join(self._watched())} for changes...")
+        runs = 0
+        try:
+            while max_runs is None or runs < max_runs:
+                current = self._wait_for_change(last)
+                spending_changed = any(
+                    current.get(path) != last.get(path) for path in self._watched()[:2]
+                )
+                last = current
+                runs += 1
+
+                try:
+                    stages = self._reload(spending_changed)
+                except Exception:
+                    traceback.print_exc()
+                    continue
+
+                if self.stages is not None or self.plots is not None:
+                    selected = self.stages or [Stage.PLOTS]
+                    stages = [stage for stage in stages if stage in selected]
+
+                if len(stages) == 0:
+                    print("Nothing to update.")
+                    continue
+
+                self._run(stages)
+
+        except KeyboardInterrupt:
+            print("Stopped watching.")
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
-from typing import Literal, Any
+from dataclasses import field
+from numbers import Number
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional, Union
 from operator import (
     __eq__,
     __gt__,
@@ -10,6 +13,52 @@ from operator import (
 
 from src.models.types import OperatorFunction
 from src.utilities.decorators import dataclass_from_json
+from src.utilities.mask_cache import MASK_CACHE, freeze
+
+OPERATORS: Dict[str, OperatorFunction] = {
+    "=": __eq__,
+    ">": __gt__,
+    "<": __lt__,
+    "<=": __le__,
+    ">=": __ge__,
+    "contains": lambda series, val: series.str.contains(val, case=True, regex=False),
+    "icontains": lambda series, val: series.str.contains(val, case=False, regex=False),
+    "iequals": lambda series, val: series.str.casefold() == val.casefold(),
+    "in": lambda series, val: series.isin(val),
+}
+
+# the operators that can be evaluated on the NumPy arrays of numeric columns
+NUMPY_OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "=": np.equal,
+    ">": np.greater,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">=": np.greater_equal,
+    "in": lambda arr, val: np.isin(arr, list(val)),
+}
+
+
+def _is_number(value: Any) -> bool:
+    """
+    Checks whether the value can be compared to a numeric NumPy array.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(map(_is_number, value))
+
+    return isinstance(value, Number) and not isinstance(value, complex)
+
+
+def _numeric_values(series: pd.Series) -> Optional[np.ndarray]:
+    """
+    Returns the values of a plain numeric or boolean column as a NumPy array, or
+    None otherwise. Missing floats are NaN, which fails every comparison. Nullable
+    columns are left to Pandas, which already compares their masked arrays.
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind not in "biuf":
+        return None
+
+    return series.to_numpy()
 
 
 @dataclass_from_json
@@ -21,38 +70,52 @@ class Filter:
         column (str): which column of the DataFrame to compare
         operator (str): how to compare the column to the value
         value (Any): the value to compare to those of the column
+        key (Hashable): identifies the filter in the mask cache
     """
 
     column: str
-    operator: Literal["=", ">", "<", "<=", ">=", "contains", "icontains", "in"]
+    operator: Literal[
+        "=", ">", "<", "<=", ">=", "contains", "icontains", "iequals", "in"
+    ]
     value: Any
+    key: Hashable = field(init=False, repr=False, compare=False)
 
-    def _convert_operator(self) -> OperatorFunction:
+    def __post_init__(self) -> None:
+        if self.operator not in OPERATORS:
+            raise ValueError(f"Invalid filter operator: {self.operator}")
+
+        self.key = ("filter", self.column, self.operator, freeze(self.value))
+        self._numeric = _is_number(self.value)
+
+    def _evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Compares the column to the value over the whole DataFrame. Numeric
+        columns compared to numbers are evaluated directly on their NumPy arrays,
+        and everything else goes through Pandas.
+        """
+        series = df[self.column]
+        numpy_op = NUMPY_OPERATORS.get(self.operator) if self._numeric else None
+        values = None if numpy_op is None else _numeric_values(series)
+        if numpy_op is None or values is None:
+            return OPERATORS[self.operator](series, self.value).to_numpy(
+                dtype=bool, na_value=False
+            )
+
+        return np.asarray(numpy_op(values, self.value), dtype=bool)
+
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
         """
-        Parses `self.operator` and returns a function that can be called.
+        Returns the rows of the DataFrame that pass this filter. Masks are shared
+        through the mask cache, so an identical filter on the same frame is only
+        evaluated once. Missing values never pass.
 
         Parameters:
-            None
+            df (DataFrame): the Pandas DataFrame to filter
 
         Returns:
-            filterer (OperatorFunction): the function that can be called to filter df
+            mask (np.ndarray): a read-only boolean array with one value per row
         """
-        mapping = {
-            "=": __eq__,
-            ">": __gt__,
-            "<": __lt__,
-            "<=": __le__,
-            ">=": __ge__,
-            "contains": lambda series, val: series.str.contains(
-                val, case=True, regex=False
-            ),
-            "icontains": lambda series, val: series.str.contains(
-                val, case=False, regex=False
-            ),
-            "iequals": lambda series, val: series.str.casefold() == val.casefold(),
-            "in": lambda series, val: series.isin(val),
-        }
-        return mapping[self.operator]
+        return MASK_CACHE.get(df, self.key, lambda: self._evaluate(df))
 
     def filter_cond(self, df: pd.DataFrame) -> pd.Series:
         """
@@ -64,4 +127,208 @@ class Filter:
         Returns:
             col (DataFrame): a series of booleans that can filter df
         """
-        return self._convert_operator()(df[self.column], self.value)
+        return pd.Series(self.mask(df), index=df.index)
+
+
+class NegatedFilter:
+    """
+    Passes the rows that fail a filter or a group of filters, including the rows
+    that failed because of missing values.
+
+    Attributes:
+        child (FilterNode): the filter to negate
+        key (Hashable): identifies the negated filter in the mask cache
+    """
+
+    child: "FilterNode"
+    key: Hashable
+
+    def __init__(self, child: "FilterNode") -> None:
+        self.child = child
+        self.key = ("not", child.key)
+
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Returns the rows of the DataFrame that fail the filter.
+
+        Parameters:
+            df (DataFrame): the Pandas DataFrame to filter
+
+        Returns:
+            mask (np.ndarray): a read-only boolean array with one value per row
+        """
+        return MASK_CACHE.get(df, self.key, lambda: ~self.child.mask(df))
+
+
+class CompiledFilter:
+    """
+    A group of filters compiled into a single predicate when the configs are
+    loaded. The members can be filters or other groups, so AND and OR can be
+    nested. Groups are keyed by their members regardless of order, so every
+    identical filter or group across all plots and aggregations is evaluated
+    once per frame through the mask cache. The members' masks are combined into
+    one buffer, stopping early once no row can pass (or, with OR, once every
+    row has).
+
+    Attributes:
+        filters (List[FilterNode]): the members of the group, without duplicates.
+            Members that are groups of the same kind are merged into this one
+        disjunction (bool): whether to combine the filters using OR instead of AND
+        key (Hashable): identifies the group in the mask cache
+    """
+
+    filters: List["FilterNode"]
+    disjunction: bool
+    key: Hashable
+
+    def __init__(self, filters: List["FilterNode"], disjunction: bool = False) -> None:
+        unique: Dict[Hashable, FilterNode] = {}
+        for node in filters:
+            members = (
+                node.filters
+                if isinstance(node, CompiledFilter) and node.disjunction == disjunction
+                else [node]
+            )
+            for member in members:
+                unique.setdefault(member.key, member)
+
+        self.filters = list(unique.values())
+        self.disjunction = disjunction
+        self.key = ("any" if disjunction else "all", frozenset(unique))
+
+    @classmethod
+    def from_json(cls, filters: Any, disjunction: bool = False) -> "CompiledFilter":
+        """
+        Compiles filters read from the config files.
+
+        Parameters:
+            filters (Any): a list of filters and groups, or a single group. See
+                `parse_filters`
+            disjunction (bool): whether to combine the list using OR instead of
+                AND. Default is False
+
+        Returns:
+            compiled (CompiledFilter): the compiled filters
+        """
+        return cls(parse_filters(filters), disjunction)
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+    def _evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Combines the mask of every member into one new array.
+        """
+        combine = np.logical_or if self.disjunction else np.logical_and
+        res = self.filters[0].mask(df).copy()
+        for node in self.filters[1:]:
+            if res.all() if self.disjunction else not res.any():
+                break
+
+            combine(res, node.mask(df), out=res)
+
+        return res
+
+    def mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Returns the rows of the DataFrame that pass the filters. Missing values
+        never pass a filter.
+
+        Parameters:
+            df (DataFrame): the Pandas DataFrame to filter
+
+        Returns:
+            mask (np.ndarray): a read-only boolean array with one value per row
+                of df. If there are no filters, every row passes
+        """
+        if len(self.filters) == 0:
+            return MASK_CACHE.get(
+                df, self.key, lambda: np.ones(df.shape[0], dtype=bool)
+            )
+
+        if len(self.filters) == 1:
+            return self.filters[0].mask(df)
+
+        return MASK_CACHE.get(df, self.key, lambda: self._evaluate(df))
+
+
+FilterNode = Union[Filter, CompiledFilter, NegatedFilter]
+
+GROUPS = ("all", "any", "not")
+
+
+def parse_filter(node: Any) -> FilterNode:
+    """
+    Parses a filter or a group of filters from the config files. A group is a
+    dictionary with a single key: `all` or `any` with a list of members that
+    must all or any pass, or `not` with a member or list of members that must
+    not all pass. Members are filters or groups.
+
+    Parameters:
+        node (Any): the filter or group to parse
+
+    Returns:
+        filt (FilterNode): the parsed filter
+    """
+    if isinstance(node, list):
+        return parse_filter({"all": node})
+
+    if not isinstance(node, dict):
+        raise ValueError(f"Invalid filter: {node!r}")
+
+    groups = [key for key in GROUPS if key in node]
+    if len(groups) == 0:
+        return Filter(**node)
+
+    if len(node) > 1:
+        raise ValueError(
+            f"A filter group must only have one key, not {', '.join(map(str, node))}"
+        )
+
+    kind = groups[0]
+    members = node[kind]
+    if kind == "not":
+        child = parse_filter(members)
+        return child.child if isinstance(child, NegatedFilter) else NegatedFilter(child)
+
+    if not isinstance(members, list) or len(members) == 0:
+        raise ValueError(f"The '{kind}' filter group must be a non-empty list")
+
+    group = CompiledFilter(list(map(parse_filter, members)), kind == "any")
+    return group.filters[0] if len(group) == 1 else group
+
+
+def parse_filters(filters: Any) -> List[FilterNode]:
+    """
+    Parses the filters of a line or aggregation from the config files.
+
+    Parameters:
+        filters (Any): a list of filters and groups, or a single group
+
+    Returns:
+        filters (List[FilterNode]): the parsed filters
+    """
+    if isinstance(filters, dict):
+        return [parse_filter(filters)]
+
+    return list(map(parse_filter, filters))
+
+
+def combine_filters(
+    filters: List[FilterNode], disjunction: bool, df: pd.DataFrame
+) -> np.ndarray:
+    """
+    Evaluates the filters over the whole DataFrame and combines them into a
+    single mask. Missing values never pass a filter. Prefer compiling the
+    filters once with `CompiledFilter` when they're used more than once.
+
+    Parameters:
+        filters (List[FilterNode]): the filters to apply. If empty, every row
+            passes
+        disjunction (bool): whether to combine the filters using OR instead of AND
+        df (DataFrame): the Pandas DataFrame to filter
+
+    Returns:
+        mask (np.ndarray): a read-only boolean array with one value per row of df
+    """
+    return CompiledFilter(filters, disjunction).mask(df)
@@ -1,13 +1,18 @@
+from dataclasses import field
 from typing import List, Optional
 
 from src.utilities.decorators import dataclass_from_converted_json
 from src.models.config_objs.agg_function import AggFunction
-from src.models.config_objs.filter import Filter
+from src.models.config_objs.filter import (
+    CompiledFilter,
+    FilterNode,
+    parse_filters,
+)
 
 
 @dataclass_from_converted_json(
     converters={
-        "filters": lambda lst: list(map(Filter, lst)),  # type: ignore
+        "filters": parse_filters,
         "agg": AggFunction,
     }
 )
@@ -16,7 +21,8 @@ class Line:
     A line in a plot, summing the total amount spent over a period of time.
 
     Attributes:
-        filters (List[Filter]): what filters to apply to draw this line
+        filters (List[FilterNode]): what filters and groups of filters to apply
+            to draw this line
         agg (Optional[AggFunction]): a function used to aggregate the line. In
             the config file, this is a list of aggregations, but the list is
             exploded so there is just one function per line
@@ -26,10 +32,15 @@ class Line:
             line has a label
         disjunction (bool): whether to combine the filters using OR instead
             of AND. Default is False
+        predicate (CompiledFilter): the filters, compiled once the line is read
     """
 
-    filters: List[Filter]
+    filters: List[FilterNode]
     agg: Optional[AggFunction] = None
     style: str = "b"
     label: str = ""
     disjunction: bool = False
+    predicate: CompiledFilter = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.predicate = CompiledFilter(self.filters, self.disjunction)
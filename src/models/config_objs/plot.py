@@ -1,15 +1,14 @@
 import pandas as pd
 import numpy as np
-from operator import __or__, __and__
-from functools import reduce
 from os.path import join
+from datetime import date
 
-from typing import Literal, List
+from typing import Literal, List, Dict, Tuple
 
 from src.utilities.df_common import (
-    group_by_month,
-    group_by_week,
-    filter_large_transactions,
+    codes_by_month,
+    codes_by_week,
+    large_transaction_threshold,
 )
 from src.read_data.column import Column
 
@@ -39,50 +38,69 @@ class Plot:
     timeframe: Literal["yearly", "monthly"]
     lines: List[Line]
 
-    def create_plot(self, df: pd.DataFrame, out_dir: str) -> None:
+    def metrics(
+        self, df: pd.DataFrame
+    ) -> Tuple[List[date], Dict[str, Tuple[np.ndarray, str]]]:
         """
-        Writes the plot to the correct path.
+        Calculates the y-values of every line. Each line is filtered once over the
+        whole DataFrame and then summed per period, with the outliers that were
+        filtered out spread evenly over the periods.
 
         Parameters:
             df (DataFrame): a Pandas DataFrame to plot
-            out_dir (str): the directory to put the plots in
 
         Returns:
-            None
+            starts (List[date]): the starting date of each period
+            metrics (Dict[str, Tuple[np.ndarray, str]]): a mapping of line label to
+                a tuple of [the y-values, the line style]
         """
-        filt_total = 0.0
         if self.timeframe == "monthly":
-            starts, partitions = group_by_week(df)
+            starts, codes = codes_by_week(df)
         elif self.timeframe == "yearly":
-            starts, partitions = group_by_month(df)
+            starts, codes = codes_by_month(df)
         else:
             raise ValueError(f"Invalid timeframe: {self.timeframe}")
 
+        prices = np.nan_to_num(df[Column.PRICE].to_numpy(dtype=float))
+        thresh = large_transaction_threshold()
+        small = (prices < thresh) | (df[Column.CATEGORY] == "Bills").to_numpy()
+        large = prices >= thresh
+
+        filt_total = 0.0
         metrics = {}
         for line in self.lines:
             if len(line.filters) == 0:
-                y_vals = list(map(lambda p: p[Column.PRICE].sum(), partitions))
+                keep = np.ones(prices.shape[0], dtype=bool)
 
             else:
-                y_vals = []
-                for part in partitions:
-                    condition = reduce(
-                        __or__ if line.disjunction else __and__,
-                        map(lambda f: f.filter_cond(part), line.filters),
-                    )
-
-                    part_filt, to_add = filter_large_transactions(part.loc[condition])
-                    y_vals.append(part_filt[Column.PRICE].sum())
-                    filt_total += to_add
-
-            y_vals_arr = np.array(y_vals) + (filt_total / len(y_vals))
+                mask = line.predicate.mask(df)
+                keep = mask & small
+                filt_total += prices[mask & large].sum()
+
+            y_vals_arr = np.bincount(
+                codes[keep], weights=prices[keep], minlength=len(starts)
+            ) + (filt_total / len(starts))
             if line.agg is not None:
                 y_vals_arr = np.full(
-                    len(partitions), getattr(np, line.agg.func)(y_vals_arr)
+                    len(starts), getattr(np, line.agg.func)(y_vals_arr)
                 )
 
             metrics[line.label] = (y_vals_arr, line.style)
 
+        return starts, metrics
+
+    def create_plot(self, df: pd.DataFrame, out_dir: str) -> None:
+        """
+        Writes the plot to the correct path.
+
+        Parameters:
+            df (DataFrame): a Pandas DataFrame to plot
+            out_dir (str): the directory to put the plots in
+
+        Returns:
+            None
+        """
+        starts, metrics = self.metrics(df)
         metrics_over_time(
             np.array(starts),
             metrics,
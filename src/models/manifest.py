@@ -0,0 +1,61 @@
+import json
+from os import replace
+from os.path import exists
+from typing import Dict
+
+
+class Manifest:
+    """
+    Records the fingerprint of the inputs used to generate each output, so
+    outputs whose inputs haven't changed can be skipped.
+
+    Attributes:
+        path (str): where the manifest is stored
+        entries (Dict[str, str]): mapping from output name to the fingerprint of
+            the inputs it was generated from
+    """
+
+    path: str
+    entries: Dict[str, str]
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries = {}
+        if exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.entries = json.load(f)
+
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def is_current(self, output: str, fingerprint: str) -> bool:
+        """
+        Checks whether the output was last generated from the same inputs.
+
+        Parameters:
+            output (str): the name of the output
+            fingerprint (str): the fingerprint of the current inputs
+
+        Returns:
+            current (bool): whether the output is up to date
+        """
+        return self.entries.get(output) == fingerprint
+
+    def update(self, output: str, fingerprint: str) -> None:
+        """
+        Records that the output was generated from the given inputs and saves
+        the manifest.
+
+        Parameters:
+            output (str): the name of the output
+            fingerprint (str): the fingerprint of the inputs
+
+        Returns:
+            None
+        """
+        self.entries[output] = fingerprint
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+        replace(self.path + ".tmp", self.path)
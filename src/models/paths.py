@@ -1,12 +1,8 @@
 from os import listdir
-from os.path import splitext, join, basename
+from os.path import splitext, join, basename, exists, isdir
 from typing import cast, List
 from datetime import datetime
 
-from src.utilities.parse_args import parse_args, Subcommand
-from src.read_data.read_data import read_data
-from src.read_data.column import Column
-
 
 ALLOWED_EXTNS = {
     ".xlsx",
@@ -18,15 +14,14 @@ ALLOWED_EXTNS = {
 
 def _default_year() -> int:
     """
-    Returns the year passed to the command on the command line, or the
-    system time's year if no year was passed.
+    Returns the median year of the spreadsheet if one was set, or the system
+    time's year otherwise.
     """
-    cmd = parse_args().subparser_name
-    if cmd == Subcommand.CLI and parse_args().file is not None:
-        return cast(datetime, read_data(parse_args().file)[Column.DATE].median()).year
+    if len(Paths._sheet_override[0]) > 0:
+        # imported here so commands that don't read spreadsheets skip Pandas
+        from src.read_data.read_data import read_dates
 
-    if cmd in (Subcommand.CLI, Subcommand.INIT):
-        return cast(int, parse_args().year)
+        return cast(datetime, read_dates(Paths._sheet_override[0]).median()).year
 
     return datetime.now().year
 
@@ -48,14 +43,17 @@ def _first_spreadsheet(parent: str, sheet_name: str) -> str:
 
 
 class Paths:
-    _year_mut: List[int] = [_default_year()]
+    _year_mut: List[int] = []
     _sheet_override: List[str] = [""]
+    _data_root: List[str] = ["data"]
 
     @staticmethod
     def get_year() -> int:
         """
-        Returns the year passed to the command on the command line, or the
-        system time's year if no year was passed.
+        Returns the year set with `set_year`. If no year was set, it's the
+        median year of the spreadsheet set with `set_spending_path`, or the
+        system time's year if there is none. Worked out the first time it's
+        needed rather than on import.
 
         Parameters:
             None
@@ -63,8 +61,102 @@ class Paths:
         Returns:
             year (int): which year to analyze
         """
+        if len(Paths._year_mut) == 0:
+            Paths._year_mut.append(_default_year())
+
         return Paths._year_mut[0]
 
+    @staticmethod
+    def set_year(year: int) -> None:
+        """
+        Sets which year to analyze.
+
+        Parameters:
+            year (int): the year
+
+        Returns:
+            None
+        """
+        Paths._year_mut[:] = [year]
+
+    @staticmethod
+    def set_spending_path(path: str) -> None:
+        """
+        Analyzes the spreadsheet at `path` instead of the one in this year's
+        data directory. Unless a year is also set, the year is inferred from the
+        spreadsheet.
+
+        Parameters:
+            path (str): the path of the spreadsheet
+
+        Returns:
+            None
+        """
+        Paths._sheet_override[0] = path
+
+    @staticmethod
+    def get_spending_override() -> str:
+        """
+        Returns the path set with `set_spending_path`.
+
+        Parameters:
+            None
+
+        Returns:
+            path (str): the path of the spreadsheet, or an empty string if the
+                one in this year's data directory is analyzed
+        """
+        return Paths._sheet_override[0]
+
+    @staticmethod
+    def set_data_root(root: str) -> None:
+        """
+        Sets the directory that each year's data directory is in.
+
+        Parameters:
+            root (str): the directory. Default is "data"
+
+        Returns:
+            None
+        """
+        Paths._data_root[0] = root
+
+    @staticmethod
+    def get_data_root() -> str:
+        """
+        Returns the directory set with `set_data_root`.
+
+        Parameters:
+            None
+
+        Returns:
+            root (str): the directory that each year's data directory is in
+        """
+        return Paths._data_root[0]
+
+    @staticmethod
+    def available_years() -> List[int]:
+        """
+        Finds every year with a spending spreadsheet in the data directory.
+
+        Parameters:
+            None
+
+        Returns:
+            years (List[int]): the years, in order
+        """
+        root = Paths._data_root[0]
+        if not isdir(root):
+            return []
+
+        return sorted(
+            int(name)
+            for name in listdir(root)
+            if name.isdigit()
+            and isdir(join(root, name))
+            and exists(Paths.year_spending_path(int(name)))
+        )
+
     @staticmethod
     def this_years_data() -> str:
         """
@@ -76,7 +168,7 @@ class Paths:
         Returns:
             path (str): this year's data
         """
-        return join("data", str(Paths.get_year()))
+        return join(Paths._data_root[0], str(Paths.get_year()))
 
     @staticmethod
     def spending_path() -> str:
@@ -92,13 +184,47 @@ class Paths:
         if len(Paths._sheet_override[0]) > 0:
             return Paths._sheet_override[0]
 
-        if (
-            parse_args().subparser_name == Subcommand.CLI
-            and parse_args().file is not None
-        ):
-            return parse_args().file
+        return Paths.year_spending_path(Paths.get_year())
+
+    @staticmethod
+    def year_spending_path(year: int) -> str:
+        """
+        Returns where the spending spreadsheet of the given year is located,
+        ignoring any spreadsheet set with `set_spending_path`.
+
+        Parameters:
+            year (int): the year
+
+        Returns:
+            path (str): where the year's spreadsheet is located
+        """
+        return _first_spreadsheet(join(Paths._data_root[0], str(year)), "Spending")
+
+    @staticmethod
+    def rollups_dir() -> str:
+        """
+        Returns the directory the monthly rollups of every year are stored in.
+
+        Parameters:
+            None
+
+        Returns:
+            dir (str): where the rollups are stored
+        """
+        return join(Paths._data_root[0], ".rollups")
+
+    @staticmethod
+    def trends_dir() -> str:
+        """
+        Returns the directory the multi-year plots and aggregations go in.
 
-        return _first_spreadsheet(Paths.this_years_data(), "Spending")
+        Parameters:
+            None
+
+        Returns:
+            dir (str): where the multi-year outputs go
+        """
+        return join(Paths._data_root[0], "trends")
 
     @staticmethod
     def plots_dir() -> str:
@@ -154,6 +280,33 @@ class Paths:
         """
         return join(Paths.this_years_data(), "aggregation.csv")
 
+    @staticmethod
+    def manifest_path() -> str:
+        """
+        Returns the path to the manifest recording which inputs each plot folder
+        and the aggregations were generated from.
+
+        Parameters:
+            None
+
+        Returns:
+            path (str): the path to the manifest
+        """
+        return join(Paths.this_years_data(), ".manifest.json")
+
+    @staticmethod
+    def profile_path() -> str:
+        """
+        Returns the path to the report written by `--profile`.
+
+        Parameters:
+            None
+
+        Returns:
+            path (str): the path to the profile report
+        """
+        return join(Paths.this_years_data(), "profile.json")
+
     @staticmethod
     def config_path() -> str:
         """
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+from os import makedirs, replace, stat
+from os.path import exists, join
+from typing import Collection, List
+
+from src.calculations.rollups import ROLLUP_COLUMNS, empty_rollup, monthly_rollup
+from src.models.manifest import Manifest
+from src.models.paths import Paths
+from src.read_data.journal import has_journal, journal_path
+from src.read_data.read_data import read_data
+from src.utilities.fingerprints import combine_fingerprints
+
+ROLLUP_VERSION = 1
+
+
+class RollupStore:
+    """
+    Stores the monthly rollups of each year as typed arrays, so spending can be
+    compared across years without reading every spreadsheet. A year's rollup
+    is only rebuilt when its spreadsheet changes, and rebuilding reads the
+    spreadsheet through `read_data`, so the parse cache is used if it's fresh.
+
+    Attributes:
+        root (str): the directory the rollups are stored in
+        manifest (Manifest): records which spreadsheet each rollup was built from
+    """
+
+    root: str
+    manifest: Manifest
+
+    def __init__(self, root: str) -> None:
+        makedirs(root, exist_ok=True)
+        self.root = root
+        self.manifest = Manifest(join(root, "manifest.json"))
+
+    def _path(self, year: int) -> str:
+        """
+        Returns where the rollup of the year is stored.
+        """
+        return join(self.root, f"{year}.npz")
+
+    def _fingerprint(self, year: int) -> str:
+        """
+        Identifies the year's spreadsheet and its journal by their paths, sizes
+        and modification times.
+        """
+        path = Paths.year_spending_path(year)
+        files = [path, journal_path(path)] if has_journal(path) else [path]
+        return combine_fingerprints(
+            ROLLUP_VERSION,
+            *(
+                (file, info.st_size, info.st_mtime_ns)
+                for file, info in zip(files, map(stat, files))
+            ),
+        )
+
+    def is_current(self, year: int) -> bool:
+        """
+        Checks whether the year's rollup was built from its current spreadsheet.
+
+        Parameters:
+            year (int): the year to check
+
+        Returns:
+            current (bool): whether the rollup is up to date
+        """
+        return exists(self._path(year)) and self.manifest.is_current(
+            str(year), self._fingerprint(year)
+        )
+
+    def build(self, year: int) -> pd.DataFrame:
+        """
+        Rolls up the year's spreadsheet and stores the result.
+
+        Parameters:
+            year (int): the year to roll up
+
+        Returns:
+            rollup (DataFrame): the year's monthly rollup
+        """
+        fingerprint = self._fingerprint(year)
+        rollup = monthly_rollup(read_data(Paths.year_spending_path(year)))
+
+        # strings are stored as fixed width arrays so they load without pickle
+        arrays = {
+            col: rollup[col].to_numpy(dtype=str if dtype == "str" else dtype)
+            for col, dtype in ROLLUP_COLUMNS.items()
+        }
+        path = self._path(year)
+        with open(path + ".tmp", "wb") as f:
+            np.savez(f, **arrays)  # type: ignore
+
+        replace(path + ".tmp", path)
+        self.manifest.update(str(year), fingerprint)
+        return rollup
+
+    def refresh(self, years: Collection[int], rebuild: bool = False) -> List[int]:
+        """
+        Rebuilds the rollups of the years whose spreadsheets changed.
+
+        Parameters:
+            years (Collection[int]): the years to refresh
+            rebuild (bool): whether to rebuild every rollup, even those that are
+                up to date. Default is False
+
+        Returns:
+            rebuilt (List[int]): the years that were rebuilt, in order
+        """
+        rebuilt = []
+        for year in sorted(years):
+            if rebuild or not self.is_current(year):
+                self.build(year)
+                rebuilt.append(year)
+
+        return rebuilt
+
+    def load(self, years: Collection[int]) -> pd.DataFrame:
+        """
+        Loads the stored rollups of the given years into one DataFrame. Years
+        without a stored rollup are left out.
+
+        Parameters:
+            years (Collection[int]): the years to load
+
+        Returns:
+            rollups (DataFrame): the rollups of every year, in order
+        """
+        frames = []
+        for year in sorted(years):
+            if not exists(self._path(year)):
+                continue
+
+            with np.load(self._path(year), allow_pickle=False) as arrays:
+                frames.append(
+                    pd.DataFrame({col: arrays[col] for col in ROLLUP_COLUMNS})
+                )
+
+        if len(frames) == 0:
+            return empty_rollup()
+
+        return pd.concat(frames, ignore_index=True).astype(ROLLUP_COLUMNS)
@@ -1,9 +1,11 @@
 import pandas as pd
-import tkinter as tk
-from typing import Union, Dict, Any, Callable
+from typing import TYPE_CHECKING, Union, Dict, Any, Callable
+
+if TYPE_CHECKING:
+    import tkinter as tk
 
 Number = Union[int, float]
 NestedDict = Union[Number, Dict[str, "NestedDict"]]
 OperatorFunction = Callable[[pd.Series, Any], pd.Series]
 Plotter = Callable[[pd.DataFrame, str], None]
-Root = Union[tk.Tk, tk.Frame]
+Root = Union["tk.Tk", "tk.Frame"]
@@ -1,41 +1,64 @@
 import pandas as pd
-from functools import reduce
-from operator import __and__, __or__
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
-from src.models.config_objs.filter import Filter
+from src.models.config_objs.filter import CompiledFilter
 from src.models.config_objs.agg_function import AggFunction
 from src.read_config.get_config import get_config
+from src.utilities.profiler import PROFILER
 
+CompiledAggregation = Tuple[str, CompiledFilter, AggFunction]
 
-def custom_aggregations(df: pd.DataFrame) -> Dict[str, Any]:
+_compiled: List[Tuple[dict, List[CompiledAggregation]]] = []
+
+
+def compiled_aggregations() -> List[CompiledAggregation]:
     """
-    Performs all custom aggregations on df.
+    Compiles the filters and functions of every custom aggregation in the
+    configs. They're only compiled again once the configs are re-read.
 
     Parameters:
-        df (DataFrame): the Pandas DataFrame to aggregate
+        None
 
     Returns:
-        aggs (Dict[str, Any]): a mapping of agg name to value
+        aggs (List[CompiledAggregation]): the name, filters and function of each
+            aggregation, in the order of the configs
     """
     data = get_config()["aggregations"]
+    if len(_compiled) == 0 or _compiled[0][0] is not data:
+        _compiled[:] = [
+            (
+                data,
+                [
+                    (
+                        name,
+                        CompiledFilter.from_json(
+                            agg_data["filters"], agg_data.get("disjunction", False)
+                        ),
+                        AggFunction(**agg_data["agg"]),
+                    )
+                    for name, agg_data in data.items()
+                ],
+            )
+        ]
 
-    res = {}
-    for agg in data:
-        agg_data = data[agg]
+    return _compiled[0][1]
 
-        if len(agg_data["filters"]) > 0:
-            conjunction = reduce(
-                __or__ if agg_data.get("disjunction", False) else __and__,
-                map(lambda f: Filter(**f).filter_cond(df), agg_data["filters"]),
-            )
 
-            filtered = df.loc[conjunction]
+def custom_aggregations(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Performs all custom aggregations on df.
 
-        else:
-            filtered = df
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to aggregate
 
-        res[agg] = AggFunction(**agg_data["agg"]).aggregate(filtered)
+    Returns:
+        aggs (Dict[str, Any]): a mapping of agg name to value
+    """
+    res = {}
+    for agg, predicate, func in compiled_aggregations():
+        with PROFILER.stage("custom agg", agg):
+            filtered = df.loc[predicate.mask(df)] if len(predicate) > 0 else df
+            res[agg] = func.aggregate(filtered)
 
     return res
@@ -1,10 +1,13 @@
 import yaml
 from functools import lru_cache
 import os.path
+from typing import List, Optional
 
 from src.models.paths import Paths
 from src.utilities.dictionary_ops import recursive_merge
 
+_seeded: List[dict] = []
+
 
 @lru_cache(maxsize=1)
 def get_config() -> dict:
@@ -18,6 +21,9 @@ def get_config() -> dict:
         config (dict): a dictionary of all configs defined
             by the user
     """
+    if len(_seeded) > 0:
+        return _seeded[0]
+
     with open(Paths.base_config(), "r") as base:
         base_data = yaml.safe_load(base)
 
@@ -32,6 +38,22 @@ def get_config() -> dict:
     return base_data
 
 
+def use_config(config: Optional[dict]) -> None:
+    """
+    Uses the given configs instead of reading the config files, e.g. so worker
+    processes can share the configs already read by the main process.
+
+    Parameters:
+        config (Optional[dict]): the configs, as returned by `get_config`, or
+            None to go back to reading the config files
+
+    Returns:
+        None
+    """
+    _seeded[:] = [] if config is None else [config]
+    get_config.cache_clear()
+
+
 def config_globals() -> dict:
     """
     Returns the global variables set in the config file.
@@ -1,4 +1,5 @@
-from typing import Tuple, List
+from copy import deepcopy
+from typing import Collection, Optional, Tuple, List
 
 
 from src.models.config_objs.plot import Plot
@@ -6,17 +7,22 @@ from src.read_config.get_config import get_config
 from src.models.types import Plotter
 
 
-def _read_convert_plots() -> List[Plot]:
+def _read_convert_plots(names: Optional[Collection[str]] = None) -> List[Plot]:
     """
     Reads the config.yml and converts all dataclasses.
 
     Parameters:
-        None
+        names (Optional[Collection[str]]): which plots to convert. Default is
+            None, which converts all of them
 
     Returns:
         plots (List[Plot]): a list of converted plots
     """
-    data = get_config()["plots"]
+    data = {
+        name: deepcopy(plot)
+        for name, plot in get_config()["plots"].items()
+        if names is None or name in names
+    }
 
     for plot in data:
         data[plot]["plot_name"] = plot
@@ -24,19 +30,22 @@ def _read_convert_plots() -> List[Plot]:
     return [Plot(p) for p in data.values()]  # type: ignore
 
 
-def plotters_from_config() -> Tuple[List[Plotter], List[Plotter]]:
+def plotters_from_config(
+    names: Optional[Collection[str]] = None,
+) -> Tuple[List[Plotter], List[Plotter]]:
     """
     Generates two lists of functions that will plot various metrics.
 
     Parameters:
-        None
+        names (Optional[Collection[str]]): the keys of the plots to generate.
+            Default is None, which generates every plot in the configs
 
     Returns:
         monthlys (List[Plotter]): a list of functions to be called each month
         yearlys (List[Plotter]): a list of functions that should be called once
             per year
     """
-    plots: List[Plot] = _read_convert_plots()
+    plots: List[Plot] = _read_convert_plots(names)
 
     monthlys: List[Plotter] = []
     yearlys: List[Plotter] = []
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from os.path import splitext
+from typing import List, Tuple
+
+from src.read_data.column import Column
+from src.read_data.read_data import (
+    CSV_ENCODING,
+    OPTIONAL_COLUMNS,
+    SCHEMA,
+    convert_columns,
+    read_data,
+    transaction_ids,
+)
+from src.read_data.write_data import append_transactions
+
+REQUIRED_COLUMNS = [col for col in SCHEMA if col != Column.TRANSACTION_ID]
+
+FLAGS = {"0": 0, "1": 1, "0.0": 0, "1.0": 1, "false": 0, "true": 1}
+
+
+@dataclass
+class ImportResult:
+    """
+    The outcome of importing a batch of transactions.
+
+    Attributes:
+        read (int): how many transactions were in the batch
+        added (int): how many were added to the spreadsheet
+        duplicates (int): how many were already in the spreadsheet
+    """
+
+    read: int
+    added: int
+    duplicates: int
+
+
+def read_batch(path: str) -> pd.DataFrame:
+    """
+    Reads a batch of transactions into an unprocessed DataFrame.
+
+    Parameters:
+        path (str): the path of the batch, either a csv or txt file with a header,
+            or a JSON Lines or JSON file with an object per transaction
+
+    Returns:
+        df (DataFrame): the transactions, as read
+    """
+    extn = splitext(path)[1]
+    if extn in (".csv", ".txt"):
+        return pd.read_csv(path, header=0, encoding=CSV_ENCODING, dtype=str)
+
+    if extn in (".jsonl", ".json"):
+        return pd.read_json(path, lines=extn == ".jsonl", orient="records", dtype=False)
+
+    raise ValueError(f"Can't import transactions from a {extn} file")
+
+
+def validate_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Checks every transaction in the batch at once, and converts the columns to
+    their types. Columns that aren't in the spreadsheet schema are dropped.
+
+    Parameters:
+        df (DataFrame): the unprocessed transactions
+
+    Returns:
+        df (DataFrame): the transactions with typed columns and transaction IDs
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if len(missing) > 0:
+        raise ValueError(f"Import error: missing columns {', '.join(missing)}")
+
+    df = df[[col for col in df.columns if col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS]]
+    dates = pd.to_datetime(
+        df[Column.DATE], format="mixed", dayfirst=False, errors="coerce"
+    )
+    prices = pd.to_numeric(
+        df[Column.PRICE].astype(str).str.replace(r"[^\d\-.]", "", regex=True),
+        errors="coerce",
+    )
+    flags = {
+        col: df[col].astype(str).str.strip().str.lower().map(FLAGS)
+        for col in (Column.IS_FOOD, Column.CONTROLLABLE)
+    }
+    categories = df[Column.CATEGORY].astype(str).str.strip()
+
+    checks: List[Tuple[str, pd.Series]] = [
+        ("invalid Date", dates.isna()),
+        ("Price must be a number above zero", ~(prices > 0)),
+        ("missing Category", df[Column.CATEGORY].isna() | (categories == "")),
+        *((f"{col} must be 0 or 1", flag.isna()) for col, flag in flags.items()),
+    ]
+    errors = sorted(
+        (row + 1, message)
+        for message, bad in checks
+        for row in np.flatnonzero(bad.to_numpy())
+    )
+    if len(errors) > 0:
+        lines = [f"row {row}: {message}" for row, message in errors[:10]]
+        if len(errors) > 10:
+            lines.append(f"...and {len(errors) - 10} more")
+
+        raise ValueError("Import error: invalid transactions\n" + "\n".join(lines))
+
+    return convert_columns(
+        df.assign(
+            **{Column.DATE: dates, Column.PRICE: prices, Column.CATEGORY: categories},
+            **flags,
+        )
+    )
+
+
+def _content_ids(df: pd.DataFrame) -> np.ndarray:
+    """
+    Identifies each transaction by the required columns and how many identical
+    transactions came before it, so batches with different optional columns
+    can be compared.
+    """
+    key = df[REQUIRED_COLUMNS].astype({Column.DATE: "datetime64[ns]"})
+    return transaction_ids(key)
+
+
+def import_transactions(source: str, dest: str, dry_run: bool = False) -> ImportResult:
+    """
+    Adds a batch of transactions to a spreadsheet in a single write. The batch
+    is validated as a whole, and transactions that are already in the
+    spreadsheet are skipped. Identical transactions are counted, so if the
+    spreadsheet has one coffee for $4 on a day and the batch has two, one
+    is added.
+
+    Parameters:
+        source (str): the path of the batch. See `read_batch`
+        dest (str): the path of the spreadsheet to add to
+        dry_run (bool): whether to only work out what would be added, without
+            writing anything. Default is False
+
+    Returns:
+        result (ImportResult): how many transactions were read and added
+    """
+    batch = validate_batch(read_batch(source))
+    existing = read_data(dest)
+
+    years = set(existing[Column.DATE].dt.year) | set(batch[Column.DATE].dt.year)
+    if len(years) > 1:
+        raise ValueError(
+            "Import error: every transaction must be in the same year as the "
+            + f"spreadsheet, but found {', '.join(map(str, sorted(years)))}"
+        )
+
+    new = batch.loc[~np.isin(_content_ids(batch), _content_ids(existing))]
+    if not dry_run and new.shape[0] > 0:
+        append_transactions(
+            new.drop(columns=[Column.TRANSACTION_ID]).astype(
+                {Column.IS_FOOD: int, Column.CONTROLLABLE: int}
+            ),
+            dest,
+        )
+
+    return ImportResult(batch.shape[0], new.shape[0], batch.shape[0] - new.shape[0])
@@ -0,0 +1,84 @@
+import csv
+import pandas as pd
+from os.path import basename, dirname, exists, getsize, join, splitext
+from typing import Optional
+
+from src.read_data.column import Column
+
+# appending to these formats rewrites the whole file, so new transactions are
+# journaled instead
+JOURNALED_EXTNS = {".xlsx", ".numbers"}
+
+
+def journal_path(path: str) -> str:
+    """
+    Returns the path of the journal of transactions waiting to be written to
+    the spreadsheet at `path`.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        journal (str): the `.journal.csv` file next to the spreadsheet
+    """
+    return join(dirname(path), splitext(basename(path))[0] + ".journal.csv")
+
+
+def has_journal(path: str) -> bool:
+    """
+    Checks whether the spreadsheet has transactions waiting in its journal.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        pending (bool): whether the journal has any transactions
+    """
+    journal = journal_path(path)
+    return exists(journal) and getsize(journal) > 0
+
+
+def read_journal(path: str) -> Optional[pd.DataFrame]:
+    """
+    Reads the journal of the spreadsheet at `path` into an unprocessed
+    DataFrame, like one read from a csv file.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        df (Optional[DataFrame]): the journaled transactions, or None if there
+            aren't any
+    """
+    if not has_journal(path):
+        return None
+
+    df = pd.read_csv(journal_path(path), header=0, encoding="utf-8")
+    return df if df.shape[0] > 0 else None
+
+
+def append_journal(df: pd.DataFrame, path: str) -> None:
+    """
+    Appends transactions to the journal of the spreadsheet at `path`, which
+    only writes the new rows no matter how big the spreadsheet is. The journal
+    keeps the columns of the first transactions written to it.
+
+    Parameters:
+        df (DataFrame): the transactions to append
+        path (str): the path of the spreadsheet
+
+    Returns:
+        None
+    """
+    journal = journal_path(path)
+    columns = [col for col in df.columns if col != Column.TRANSACTION_ID]
+    pending = has_journal(path)
+    if pending:
+        with open(journal, "r", newline="", encoding="utf-8") as f:
+            columns = next(csv.reader(f))
+
+    # formatted before the journal is opened, so a failure doesn't leave it
+    # half-written
+    text = df.reindex(columns=columns).to_csv(index=False, header=not pending)
+    with open(journal, "a", newline="", encoding="utf-8") as f:
+        f.write(text)
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+from os import makedirs, replace, stat
+from os.path import basename, dirname, exists, join
+from pandas.api.types import (
+    infer_dtype,
+    is_bool_dtype,
+    is_datetime64_dtype,
+    is_numeric_dtype,
+)
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_VERSION = 3
+
+_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def cache_dir(path: str) -> str:
+    """
+    Returns the directory the parse cache for the spreadsheet at `path` lives in.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        dir (str): the `.cache` directory next to the spreadsheet
+    """
+    return join(dirname(path), ".cache")
+
+
+def cache_stats() -> Dict[str, int]:
+    """
+    Returns how many times the parse cache was hit and missed in this process.
+
+    Parameters:
+        None
+
+    Returns:
+        stats (Dict[str, int]): mapping with the keys "hits" and "misses"
+    """
+    return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    """
+    Resets the hit and miss counts of the parse cache.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    for key in _stats:
+        _stats[key] = 0
+
+
+def content_hash(path: str) -> str:
+    """
+    Hashes the raw bytes of the file at `path`.
+
+    Parameters:
+        path (str): the path of the file
+
+    Returns:
+        digest (str): the hex SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _paths(path: str) -> Tuple[str, str]:
+    """
+    Returns the paths of the metadata and column files for the spreadsheet.
+    """
+    stem = join(cache_dir(path), basename(path))
+    return stem + ".json", stem + ".npz"
+
+
+def _encode_column(series: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Converts the column into plain NumPy arrays, or returns None if the column
+    can't be stored without losing information.
+    """
+    mask = series.isna().to_numpy()
+    if isinstance(series.dtype, pd.BooleanDtype):
+        return {
+            "kind": "boolean",
+            "values": series.to_numpy(dtype=bool, na_value=False),
+            "mask": mask,
+        }
+
+    if is_datetime64_dtype(series.dtype):
+        return {
+            "kind": "datetime",
+            "dtype": str(series.dtype),
+            "values": series.to_numpy().view(np.int64),
+            "mask": mask,
+        }
+
+    if isinstance(series.dtype, np.dtype) and (
+        is_numeric_dtype(series.dtype) or is_bool_dtype(series.dtype)
+    ):
+        return {"kind": "numpy", "values": series.to_numpy(), "mask": mask}
+
+    if series.dtype == object and infer_dtype(series, skipna=True) in (
+        "string",
+        "empty",
+    ):
+        return {
+            "kind": "string",
+            "values": np.array(series.where(~mask, "").tolist(), dtype=str),
+            "mask": mask,
+        }
+
+    return None
+
+
+def _decode_column(kind: str, dtype: str, values: np.ndarray, mask: np.ndarray) -> Any:
+    """
+    Rebuilds a column from the arrays written by `_encode_column`.
+    """
+    if kind == "boolean":
+        return pd.arrays.BooleanArray(values, mask)
+
+    if kind == "datetime":
+        return values.view(dtype)
+
+    if kind == "string":
+        res = values.astype(object)
+        res[mask] = np.nan
+        return res
+
+    return values
+
+
+def load_cached(path: str, fingerprint: str) -> Optional[pd.DataFrame]:
+    """
+    Loads the parsed spreadsheet from the cache if the spreadsheet hasn't changed
+    since it was stored. The file's size and modification time are checked first,
+    and the contents are only hashed if those differ.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+        fingerprint (str): identifies how the spreadsheet was parsed, e.g. the
+            schema. The cache is ignored if it was stored with a different one
+
+    Returns:
+        df (Optional[DataFrame]): the cached DataFrame, or None on a miss
+    """
+    meta_path, data_path = _paths(path)
+    if not (exists(meta_path) and exists(data_path)):
+        _stats["misses"] += 1
+        return None
+
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+
+        info = stat(path)
+        if meta["version"] != CACHE_VERSION or meta["fingerprint"] != fingerprint:
+            _stats["misses"] += 1
+            return None
+
+        if meta["size"] != info.st_size or meta["mtime_ns"] != info.st_mtime_ns:
+            if meta["size"] != info.st_size or meta["sha256"] != content_hash(path):
+                _stats["misses"] += 1
+                return None
+
+            meta["mtime_ns"] = info.st_mtime_ns
+            _write_meta(meta_path, meta)
+
+        with np.load(data_path, allow_pickle=False) as arrays:
+            cols = {
+                col["name"]: _decode_column(
+                    col["kind"],
+                    col.get("dtype", ""),
+                    arrays[f"values_{i}"],
+                    arrays[f"mask_{i}"],
+                )
+                for i, col in enumerate(meta["columns"])
+            }
+            df = pd.DataFrame(cols, index=pd.Index(arrays["index"]))
+
+    except (OSError, ValueError, KeyError):
+        _stats["misses"] += 1
+        return None
+
+    _stats["hits"] += 1
+    return df
+
+
+def store_cached(path: str, fingerprint: str, df: pd.DataFrame) -> None:
+    """
+    Stores the parsed spreadsheet in the cache. Nothing is stored if any column
+    can't be written as a typed array, or if the cache directory isn't writable.
+
+    Parameters:
+        path (str): the path of the spreadsheet df was parsed from
+        fingerprint (str): identifies how the spreadsheet was parsed
+        df (DataFrame): the parsed spreadsheet
+
+    Returns:
+        None
+    """
+    if df.index.dtype != np.int64 or not all(isinstance(c, str) for c in df.columns):
+        return
+
+    arrays: Dict[str, np.ndarray] = {"index": df.index.to_numpy()}
+    columns: List[Dict[str, str]] = []
+    for i, col in enumerate(df.columns):
+        encoded = _encode_column(df[col])
+        if encoded is None:
+            return
+
+        arrays[f"values_{i}"] = encoded.pop("values")
+        arrays[f"mask_{i}"] = encoded.pop("mask")
+        columns.append({"name": col, **encoded})
+
+    info = stat(path)
+    meta = {
+        "version": CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "size": info.st_size,
+        "mtime_ns": info.st_mtime_ns,
+        "sha256": content_hash(path),
+        "columns": columns,
+    }
+
+    meta_path, data_path = _paths(path)
+    try:
+        makedirs(cache_dir(path), exist_ok=True)
+        with open(data_path + ".tmp", "wb") as f:
+            np.savez(f, **arrays)  # type: ignore
+
+        replace(data_path + ".tmp", data_path)
+        _write_meta(meta_path, meta)
+
+    except OSError:
+        return
+
+
+def _write_meta(meta_path: str, meta: Dict[str, Any]) -> None:
+    """
+    Atomically writes the cache metadata.
+    """
+    with open(meta_path + ".tmp", "w") as f:
+        json.dump(meta, f)
+
+    replace(meta_path + ".tmp", meta_path)
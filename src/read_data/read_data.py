@@ -1,14 +1,17 @@
+import gc
+import hashlib
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_string_dtype
 from os.path import splitext
 
 from functools import lru_cache
-from uuid import uuid4
-from numbers_parser import Document
-from typing import List, cast, Dict
+from typing import Any, List, Optional, Union, cast, Dict
 
 from src.read_data.column import Column
+from src.read_data.journal import read_journal
+from src.read_data.parse_cache import load_cached, store_cached
+from src.read_data.xlsx_reader import read_xlsx_columns
 
 
 SCHEMA = {
@@ -17,38 +20,144 @@ SCHEMA = {
     Column.PRICE: "float",
     Column.IS_FOOD: "int",
     Column.CONTROLLABLE: "int",
-    Column.TRANSACTION_ID: "str",
+    Column.TRANSACTION_ID: "int64",
 }
 
+OPTIONAL_COLUMNS = ["Description", "Vendor"]
+
+READERS = ("default", "streaming")
+
+# how csv spreadsheets are encoded, both when they're read and written
+CSV_ENCODING = "ISO-8859-1"
+
+# the spreadsheets that can be read by more than one reader
+READER_EXTNS = (".xlsx", ".csv", ".txt")
+
+# the streaming reader reads csv files this many rows at a time
+CSV_CHUNK_ROWS = 100_000
+CSV_STREAMING_DTYPES = {
+    Column.DATE: "datetime64[ns]",
+    Column.PRICE: float,
+    Column.IS_FOOD: bool,
+    Column.CONTROLLABLE: bool,
+}
+
+
+def _parse_fingerprint(reader: str) -> str:
+    """
+    Identifies how spreadsheets are parsed, so cached parses are thrown out
+    when the schema or the reader changes.
+    """
+    schema = ",".join(f"{col}:{dtype}" for col, dtype in SCHEMA.items())
+    return hashlib.sha256(f"{schema};{reader}".encode()).hexdigest()
+
+
+def _configured_reader(path: str) -> str:
+    """
+    Returns the reader set by the SPREADSHEET_READER global for the spreadsheet
+    at `path`. Only Excel and csv files have a streaming reader, and the default
+    reader is used when there are no configs to read.
+    """
+    if splitext(path)[1] not in READER_EXTNS:
+        return "default"
+
+    # imported here since the config is located through Paths, which reads data
+    from src.read_config.get_config import config_globals
+
+    try:
+        return cast(str, config_globals().get("SPREADSHEET_READER", "default"))
+
+    except FileNotFoundError:
+        return "default"
+
 
 @lru_cache(maxsize=32)
-def read_data(path: str) -> pd.DataFrame:
+def read_data(
+    path: str, use_cache: bool = True, reader: Optional[str] = None
+) -> pd.DataFrame:
     """
     Reads the data and converts any columns that need converting. Can read
-    many different file types.
+    many different file types. The parsed columns are cached on disk next to
+    the spreadsheet, so an unchanged spreadsheet is only parsed once. Any
+    transactions waiting in the spreadsheet's journal are added to the end.
 
     Parameters:
         path (str): the path of the spreadsheet
+        use_cache (bool): whether to read from and write to the on-disk parse
+            cache. Default is True
+        reader (Optional[str]): how to read Excel and csv files, either
+            "default" or "streaming". Default is None, which uses the
+            SPREADSHEET_READER global, or "default" if there are no configs
 
     Returns:
         df (DataFrame): a Pandas DataFrame with the spreadsheet info
     """
+    if reader is None:
+        reader = _configured_reader(path)
+
+    if reader not in READERS:
+        raise ValueError(f"Unknown spreadsheet reader: {reader}")
+
+    cached = load_cached(path, _parse_fingerprint(reader)) if use_cache else None
+    if cached is not None:
+        return _merge_journal(cached, path)
+
+    df = _parse(path, reader)
+    if use_cache:
+        store_cached(path, _parse_fingerprint(reader), df)
+
+    return _merge_journal(df, path)
+
+
+def _merge_journal(df: pd.DataFrame, path: str) -> pd.DataFrame:
+    """
+    Appends the transactions in the spreadsheet's journal to the parsed
+    spreadsheet, as if they had been written to it.
+    """
+    journal = read_journal(path)
+    if journal is None:
+        return df
+
+    journal = convert_columns(journal)
+    start = df.index.max() + 1 if df.shape[0] > 0 else 0
+    journal.index = pd.RangeIndex(start, start + journal.shape[0])
+
+    merged = pd.concat([df, journal[[c for c in journal if c in df]]])
+    merged[Column.TRANSACTION_ID] = transaction_ids(merged)
+    return merged
+
+
+def _parse(path: str, reader: str = "default") -> pd.DataFrame:
+    """
+    Reads the spreadsheet at `path` and converts its columns to their types.
+    """
+    if reader == "streaming" and splitext(path)[1] in (".csv", ".txt"):
+        # already converted a chunk at a time
+        return _read_csv_streaming(path)
+
     readers = {
         ".txt": _read_csv,
         ".csv": _read_csv,
         ".numbers": _read_numbers,
-        ".xlsx": _read_excel,
+        ".xlsx": _read_excel_streaming if reader == "streaming" else _read_excel,
     }
-    df = readers[splitext(path)[1]](path)
+    return convert_columns(readers[splitext(path)[1]](path))
+
+
+def convert_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drops the rows without a date and converts the columns of an unprocessed
+    DataFrame to their types.
+
+    Parameters:
+        df (DataFrame): the transactions as read from the spreadsheet
+
+    Returns:
+        df (DataFrame): the transactions with typed columns and transaction IDs
+    """
     df = df.loc[~df[Column.DATE].isna()]
 
-    new_cols: Dict[str, np.ndarray] = {
-        Column.TRANSACTION_ID: np.fromiter(
-            [str(uuid4()) for _ in range(df.shape[0])],
-            count=df.shape[0],
-            dtype=np.dtypes.StringDType(),
-        )
-    }
+    new_cols: Dict[str, np.ndarray] = {}
     if is_string_dtype(df[Column.PRICE]):
         new_cols[Column.PRICE] = np.array(
             df[Column.PRICE].str.replace(
@@ -60,17 +169,102 @@ def read_data(path: str) -> pd.DataFrame:
 
     df = df.assign(**new_cols)
     for col_name, dtype in SCHEMA.items():
-        df[col_name] = df[col_name].astype(cast(pd.BooleanDtype, dtype))
+        if col_name != Column.TRANSACTION_ID:
+            df[col_name] = df[col_name].astype(cast(pd.BooleanDtype, dtype))
 
     df[Column.IS_FOOD] = df[Column.IS_FOOD].astype("boolean")
     df[Column.CONTROLLABLE] = df[Column.CONTROLLABLE].astype("boolean")
     df[Column.DATE] = pd.to_datetime(
         df[Column.DATE], format="mixed", dayfirst=False, yearfirst=False
     )
+    df[Column.TRANSACTION_ID] = transaction_ids(df)
 
     return df
 
 
+def transaction_ids(df: pd.DataFrame) -> np.ndarray:
+    """
+    Generates a stable ID for every row, so the same spreadsheet always gets
+    the same IDs. Each ID hashes the schema and optional columns of the row
+    together with how many identical rows came before it, so duplicate rows
+    get distinct IDs. Any other columns are ignored.
+
+    Parameters:
+        df (DataFrame): the parsed transactions. An existing transaction ID
+            column is ignored
+
+    Returns:
+        ids (np.ndarray): an int64 ID for each row of df
+    """
+    return _ids_from_hashes(_content_hashes(df))
+
+
+def _content_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hashes the schema and optional columns of every row, in the order of the
+    schema, so every reader gives the same hashes no matter which other columns
+    the spreadsheet has or where they are. Rows are hashed on their own, so the
+    hashes of a DataFrame's chunks are the same as the hashes of the whole
+    DataFrame.
+    """
+    columns = [
+        col
+        for col in [*SCHEMA, *OPTIONAL_COLUMNS]
+        if col != Column.TRANSACTION_ID and col in df.columns
+    ]
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def _ids_from_hashes(content: np.ndarray) -> np.ndarray:
+    """
+    Turns the content hash of every row into an ID, counting how many identical
+    rows came before it.
+    """
+    occurrence = pd.Series(content).groupby(content).cumcount().to_numpy()
+
+    return (
+        pd.util.hash_pandas_object(
+            pd.DataFrame({"content": content, "occurrence": occurrence}), index=False
+        )
+        .to_numpy()
+        .view(np.int64)
+    )
+
+
+def read_dates(path: str) -> pd.Series:
+    """
+    Reads only the dates of the spreadsheet at `path`, which is much cheaper than
+    reading all of it for csv and excel files.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        dates (Series): the date of every transaction
+    """
+    extn = splitext(path)[1]
+    if extn in (".csv", ".txt"):
+        dates = pd.read_csv(
+            path, header=0, encoding=CSV_ENCODING, usecols=[Column.DATE]
+        )[Column.DATE]
+
+    elif extn == ".xlsx":
+        dates = read_xlsx_columns(
+            path, "Sheet1", [Column.DATE], date_columns=[Column.DATE]
+        )[Column.DATE]
+
+    else:
+        return read_data(path)[Column.DATE]
+
+    journal = read_journal(path)
+    if journal is not None:
+        dates = pd.concat([dates, journal[Column.DATE]], ignore_index=True)
+
+    return pd.to_datetime(
+        dates.dropna(), format="mixed", dayfirst=False, yearfirst=False
+    )
+
+
 def _read_excel(path: str) -> pd.DataFrame:
     """
     Reads an excel file and turns it into an unprocessed DataFrame.
@@ -82,19 +276,192 @@ def _read_excel(path: str) -> pd.DataFrame:
     )
 
 
+def _read_excel_streaming(path: str) -> pd.DataFrame:
+    """
+    Streams the schema columns of an excel file, and the optional columns if
+    it has them, into an unprocessed DataFrame.
+    """
+    return read_xlsx_columns(
+        path,
+        "Sheet1",
+        [col for col in SCHEMA if col != Column.TRANSACTION_ID],
+        optional=OPTIONAL_COLUMNS,
+        date_columns=[Column.DATE],
+    )
+
+
 def _read_csv(path: str) -> pd.DataFrame:
     """
     Reads a csv file and turns it into an unprocessed DataFrame.
     """
-    return pd.read_csv(path, header=0, encoding="ISO-8859-1")
+    return pd.read_csv(path, header=0, encoding=CSV_ENCODING)
+
+
+def _read_csv_streaming(path: str) -> pd.DataFrame:
+    """
+    Reads the schema columns of a csv file, and the optional columns if it has
+    them, a chunk of rows at a time. Each chunk is converted to the schema's
+    types and copied into arrays sized for the whole file, so the file is never
+    held as text all at once. The transaction IDs are the same as the ones
+    `convert_columns` would give, since both only hash the columns kept here.
+    """
+    header = pd.read_csv(path, nrows=0, encoding=CSV_ENCODING).columns
+    required = [col for col in SCHEMA if col != Column.TRANSACTION_ID]
+    missing = [col for col in required if col not in header]
+    if len(missing) > 0:
+        raise ValueError(f"{path} is missing columns {', '.join(missing)}")
+
+    columns = [col for col in header if col in required + OPTIONAL_COLUMNS]
+    flags = [Column.IS_FOOD, Column.CONTROLLABLE]
+
+    # every row takes at least one line, so this is enough room for all of them
+    size = _count_lines(path)
+    index = np.empty(size, dtype=np.int64)
+    content = np.empty(size, dtype=np.uint64)
+    arrays = {
+        col: np.empty(size, dtype=CSV_STREAMING_DTYPES.get(col, object))
+        for col in columns
+    }
+
+    filled = 0
+    chunks = pd.read_csv(
+        path,
+        header=0,
+        encoding=CSV_ENCODING,
+        usecols=columns,
+        # prices are left for Pandas to parse, so they're only read as text
+        # when a chunk has prices that aren't plain numbers
+        dtype={
+            col: float if col in flags else str
+            for col in columns
+            if col != Column.PRICE
+        },
+        chunksize=CSV_CHUNK_ROWS,
+    )
+    for chunk in chunks:
+        chunk = chunk.loc[chunk[Column.DATE].notna()]
+        converted = pd.DataFrame(
+            {col: _convert_csv_column(chunk[col], col) for col in columns},
+            index=chunk.index,
+        )
+
+        end = filled + chunk.shape[0]
+        index[filled:end] = chunk.index
+        # hashed a chunk at a time, since hashing every row at once takes
+        # about as much memory as the columns themselves
+        content[filled:end] = _content_hashes(converted)
+        for col in columns:
+            arrays[col][filled:end] = converted[col].to_numpy(dtype=arrays[col].dtype)
+
+        filled = end
+        # Pandas leaves reference cycles behind that hold on to each chunk, and
+        # they're rarely collected on their own since arrays are allocated
+        # outside of Python
+        gc.collect(1)
+
+    ids = _ids_from_hashes(content[:filled])
+
+    data: Dict[str, Any] = {
+        col: (
+            pd.arrays.BooleanArray(arr[:filled], np.zeros(filled, dtype=bool))
+            if col in flags
+            else arr[:filled]
+        )
+        for col, arr in arrays.items()
+    }
+    data[Column.TRANSACTION_ID] = ids
+    return pd.DataFrame(data, index=index[:filled], copy=False)
+
+
+def _convert_csv_column(
+    values: pd.Series, col: str
+) -> Union[np.ndarray, pd.arrays.BooleanArray]:
+    """
+    Converts a chunk of a csv column the same way `convert_columns` does. The
+    flags are read as floats, prices as whatever Pandas finds and everything
+    else as text.
+    """
+    if col == Column.DATE:
+        return pd.to_datetime(
+            values, format="mixed", dayfirst=False, yearfirst=False
+        ).to_numpy(dtype="datetime64[ns]")
+
+    if col == Column.PRICE:
+        if not is_string_dtype(values):
+            return values.to_numpy(dtype=float)
+
+        # only prices that aren't plain numbers, like "$1,234.50", are cleaned up
+        prices = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+        dirty = np.isnan(prices) & values.notna().to_numpy()
+        if dirty.any():
+            prices[dirty] = (
+                values[dirty].str.replace(r"[^\d\-.]", "", regex=True).astype(float)
+            )
+
+        return prices
+
+    if col in (Column.IS_FOOD, Column.CONTROLLABLE):
+        if values.isna().any():
+            raise ValueError(f"{col} is missing for some transactions")
+
+        flags = values.to_numpy().astype(int).astype(bool)
+        return pd.arrays.BooleanArray(flags, np.zeros(flags.shape[0], dtype=bool))
+
+    if col == Column.CATEGORY:
+        return values.astype(str).to_numpy()
+
+    return values.to_numpy()
+
+
+def _count_lines(path: str) -> int:
+    """
+    Counts the lines of a file without decoding it.
+    """
+    lines = 0
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            lines += block.count(b"\n")
+
+    return lines + 1
 
 
 def _read_numbers(path: str) -> pd.DataFrame:
     """
-    Reads a numbers file and turns it into an unprocessed DataFrame.
+    Reads the first table of a numbers file and turns it into an unprocessed
+    DataFrame, building each column straight from the table.
     """
-    data = Document(path).sheets[0].tables[0].rows(values_only=True)
-    return pd.DataFrame(data[1:], columns=data[0])
+    from numbers_parser import Document
+
+    table = Document(path).sheets[0].tables[0]
+    cols = {
+        values[0]: _numbers_column(values[1:])
+        for values in table.iter_cols(values_only=True)
+        if values[0] is not None
+    }
+    return pd.DataFrame(cols)
+
+
+def _numbers_column(values: tuple) -> pd.Series:
+    """
+    Converts the values of a column of a numbers table into a Series, typed if
+    every value is a number or every value is a date.
+    """
+    col = pd.Series(values)
+    if col.dtype == object:
+        # empty cells are read as None, but the other readers leave them as NaN
+        return col.where(col.notna(), np.nan)
+
+    if col.dtype != float:
+        return col
+
+    # numbers stores decimals with 15 significant digits, which don't always
+    # convert back to the nearest float, e.g. 12.42 is read as 12.419999...
+    nums = col.to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = 10.0 ** (14 - np.floor(np.log10(np.abs(nums))))
+        rounded = np.round(nums * scale) / scale
+
+    return pd.Series(np.where(np.isfinite(scale), rounded, nums))
 
 
 def get_month_dfs(year_data: pd.DataFrame) -> List[pd.DataFrame]:
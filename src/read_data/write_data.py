@@ -1,8 +1,24 @@
+import csv
 import pandas as pd
-from os.path import basename, splitext
-from typing import Literal
+from datetime import date, datetime, time
+from os import remove, replace
+from os.path import basename, exists, getsize, splitext
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_float_dtype
+from shutil import copyfile
+from typing import Any, List, Literal
 
 from src.read_data.column import Column
+from src.read_data.journal import (
+    JOURNALED_EXTNS,
+    append_journal,
+    journal_path,
+    read_journal,
+)
+from src.read_data.read_data import CSV_ENCODING, convert_columns, read_data
+
+# csv files are written this many rows at a time
+CSV_CHUNK_ROWS = 50_000
+CSV_DATE_FORMAT = "%m/%d/%Y"
 
 
 def write_data(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w") -> None:
@@ -28,29 +44,178 @@ def write_data(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w")
     writers[extn](df, path, mode=mode)
 
 
-def _write_csv(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w") -> None:
+def append_transactions(df: pd.DataFrame, path: str) -> None:
     """
-    Writes a DataFrame to a csv file.
+    Adds transactions to the end of the spreadsheet at `path`. For spreadsheets
+    that would have to be rewritten to append to, like Excel workbooks, the
+    transactions are written to the spreadsheet's journal instead, which
+    `read_data` reads along with the spreadsheet and `compact` writes to it.
+
+    Parameters:
+        df (DataFrame): the transactions to add
+        path (str): the path of the spreadsheet
+
+    Returns:
+        None
+    """
+    if splitext(path)[1] in JOURNALED_EXTNS:
+        append_journal(df, path)
+    else:
+        write_data(df, path, mode="a")
+
+    read_data.cache_clear()
+
+
+def compact(path: str) -> int:
+    """
+    Writes every transaction in the journal of the spreadsheet at `path` to the
+    spreadsheet in one batch, then deletes the journal. The spreadsheet is
+    written to a copy first, so it's never left half-written.
+
+    Parameters:
+        path (str): the path of the spreadsheet
+
+    Returns:
+        count (int): how many transactions were written
     """
-    write_cols = [col for col in df.columns.tolist() if col != Column.TRANSACTION_ID]
-    for col in write_cols:
-        df[col] = df[col].astype(str)
+    journal = read_journal(path)
+    if journal is None:
+        return 0
 
-    df.to_csv(
-        path,
-        index=False,
-        mode=mode,
-        columns=write_cols,
+    df = (
+        convert_columns(journal)
+        .drop(columns=[Column.TRANSACTION_ID])
+        .astype({Column.IS_FOOD: int, Column.CONTROLLABLE: int})
     )
+    tmp = path + ".tmp" + splitext(path)[1]
+    copyfile(path, tmp)
+    try:
+        write_data(df, tmp, mode="a")
+
+    except Exception:
+        remove(tmp)
+        raise
+
+    replace(tmp, path)
+
+    remove(journal_path(path))
+    read_data.cache_clear()
+    return df.shape[0]
+
+
+def _write_csv(df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w") -> None:
+    """
+    Writes a DataFrame to a csv file a chunk of rows at a time, formatting each
+    chunk as it's written so the DataFrame itself is never copied or changed.
+    When appending to a file with a header, the rows follow that header and it
+    isn't written again.
+    """
+    columns = [col for col in df.columns.tolist() if col != Column.TRANSACTION_ID]
+    header = True
+    if mode == "a" and exists(path) and getsize(path) > 0:
+        with open(path, "r", newline="", encoding=CSV_ENCODING) as f:
+            columns = next(csv.reader(f))
+
+        header = False
+
+    with open(path, mode, newline="", encoding=CSV_ENCODING) as f:
+        for start in range(0, max(df.shape[0], 1), CSV_CHUNK_ROWS):
+            chunk = _csv_chunk(df.iloc[start : start + CSV_CHUNK_ROWS], columns)
+            # formatted before it's written, so a chunk with characters the
+            # encoding can't hold isn't written at all
+            f.write(chunk.to_csv(index=False, header=header and start == 0))
+
+
+def _csv_chunk(chunk: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Formats the given columns of a chunk of rows for a csv file, with dates as
+    month/day/year, flags as 0 or 1 and prices to the cent. Columns the chunk
+    doesn't have are left empty.
+    """
+    formatted = {}
+    for col in columns:
+        if col not in chunk.columns:
+            formatted[col] = pd.Series(None, index=chunk.index, dtype=object)
+            continue
+
+        series = chunk[col]
+        if is_datetime64_any_dtype(series.dtype):
+            series = series.dt.strftime(CSV_DATE_FORMAT)
+
+        elif col == Column.DATE:
+            # dates entered in the UI are date objects
+            series = series.map(
+                lambda v: v.strftime(CSV_DATE_FORMAT) if isinstance(v, date) else v
+            )
+
+        elif is_bool_dtype(series.dtype):
+            series = series.astype("Int8")
+
+        elif col == Column.PRICE and is_float_dtype(series.dtype):
+            series = series.map("{:.2f}".format, na_action="ignore")
+
+        formatted[col] = series
+
+    return pd.DataFrame(formatted, index=chunk.index)
 
 
 def _write_numbers(
     df: pd.DataFrame, path: str, mode: Literal["w", "a", "x"] = "w"
 ) -> None:
     """
-    Writes a DataFrame to a numbers file.
+    Writes a DataFrame to the first table of a numbers file. When appending, the
+    rows go below the last row with a value, in the order of the table's header.
     """
-    raise NotImplementedError("Writing to a .numbers file is not currently supported.")
+    from numbers_parser import Document
+
+    if mode == "x" and exists(path):
+        raise FileExistsError(f"{path} already exists")
+
+    if mode == "a":
+        doc = Document(path)
+        table = doc.sheets[0].tables[0]
+        start = 0
+        for i, row in enumerate(table.iter_rows(values_only=True)):
+            if any(val is not None for val in row):
+                start = i + 1
+
+        header = [col for col in next(table.iter_rows(values_only=True)) if col]
+        df = df.reindex(columns=header)
+
+    else:
+        df = df.drop(columns=[Column.TRANSACTION_ID], errors="ignore")
+        doc = Document(
+            num_header_cols=0, num_rows=df.shape[0] + 1, num_cols=df.shape[1]
+        )
+        table = doc.sheets[0].tables[0]
+        for j, col in enumerate(df.columns):
+            table.write(0, j, str(col))
+
+        start = 1
+
+    for j, col in enumerate(df.columns):
+        for i, val in enumerate(_numbers_values(df[col])):
+            if val is not None:
+                table.write(start + i, j, val)
+
+    doc.save(path)
+
+
+def _numbers_values(series: pd.Series) -> List[Any]:
+    """
+    Converts a column into values that can be written to a numbers table, with
+    None for missing values, flags as 0 or 1 and dates as datetimes.
+    """
+    if is_datetime64_any_dtype(series.dtype):
+        return [None if pd.isna(v) else v.to_pydatetime() for v in series]
+
+    if is_bool_dtype(series.dtype):
+        return [None if pd.isna(v) else int(v) for v in series]
+
+    return [
+        (None if pd.isna(v) else datetime.combine(v, time()) if type(v) is date else v)
+        for v in series.tolist()
+    ]
 
 
 def _write_excel(
@@ -68,6 +233,12 @@ def _write_excel(
         path, engine="openpyxl", mode=mode, if_sheet_exists="overlay"
     ) as writer:
         sheet_name = next(iter(writer.sheets))
+        if mode == "a":
+            # rows are appended by position, so match the existing header
+            sheet = writer.sheets[sheet_name]
+            header = [cell.value for cell in next(sheet.iter_rows(max_row=1))]
+            df = df.reindex(columns=[col for col in header if col is not None])
+
         df.to_excel(
             writer,
             sheet_name=sheet_name,
@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterator, IO, List, Optional, Tuple
+from zipfile import ZipFile
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW = MAIN_NS + "row"
+_VALUE = MAIN_NS + "v"
+_TEXT = MAIN_NS + "t"
+_INLINE = MAIN_NS + "is"
+_SHARED = MAIN_NS + "si"
+
+_COLUMN_LETTERS = re.compile(r"[A-Z]+")
+
+_EPOCHS = {
+    False: np.datetime64("1899-12-30", "us"),
+    True: np.datetime64("1904-01-01", "us"),
+}
+
+
+def _text(el: ET.Element) -> str:
+    """
+    Joins the text runs of a shared or inline string.
+    """
+    return "".join(t.text or "" for t in el.iter(_TEXT))
+
+
+def _shared_strings(archive: ZipFile) -> List[str]:
+    """
+    Reads the workbook's table of shared strings, if it has one.
+    """
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+
+    strings = []
+    with archive.open("xl/sharedStrings.xml") as f:
+        for _, el in ET.iterparse(f):
+            if el.tag == _SHARED:
+                strings.append(_text(el))
+                el.clear()
+
+    return strings
+
+
+def _sheet_part(archive: ZipFile, sheet_name: str) -> Tuple[str, bool]:
+    """
+    Finds the part holding the sheet with the given name and whether the
+    workbook counts dates from 1904.
+    """
+    with archive.open("xl/workbook.xml") as f:
+        workbook = ET.parse(f).getroot()
+
+    props = workbook.find(MAIN_NS + "workbookPr")
+    date1904 = props is not None and props.get("date1904", "0") in ("1", "true")
+
+    rel_id = next(
+        (
+            sheet.get(REL_NS + "id")
+            for sheet in workbook.iter(MAIN_NS + "sheet")
+            if sheet.get("name") == sheet_name
+        ),
+        None,
+    )
+    if rel_id is None:
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+    with archive.open("xl/_rels/workbook.xml.rels") as f:
+        rels = ET.parse(f).getroot()
+
+    target = next(
+        rel.get("Target", "")
+        for rel in rels.iter(PACKAGE_REL_NS + "Relationship")
+        if rel.get("Id") == rel_id
+    )
+    if target.startswith("/"):
+        return target.lstrip("/"), date1904
+
+    return posixpath.normpath(posixpath.join("xl", target)), date1904
+
+
+def _cell_value(cell: ET.Element, shared: List[str]) -> Any:
+    """
+    Converts a cell to a Python value the same way openpyxl would, or returns
+    None if it's empty or an error.
+    """
+    kind = cell.get("t", "n")
+    if kind == "inlineStr":
+        inline = cell.find(_INLINE)
+        return None if inline is None else _text(inline)
+
+    value = cell.findtext(_VALUE)
+    if value is None or kind == "e":
+        return None
+
+    if kind == "s":
+        return shared[int(value)]
+
+    if kind == "b":
+        return value == "1"
+
+    if kind == "n":
+        if "." in value or "E" in value or "e" in value:
+            return float(value)
+
+        return int(value)
+
+    return value
+
+
+def _rows(sheet: IO[bytes], shared: List[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Streams the rows of a sheet as their row number and a mapping from column
+    letters to values. Each row is discarded once it's been read.
+    """
+    for _, el in ET.iterparse(sheet):
+        if el.tag != _ROW:
+            continue
+
+        values = {}
+        for cell in el:
+            ref = cell.get("r", "")
+            match = _COLUMN_LETTERS.match(ref)
+            if match is not None:
+                values[match.group()] = _cell_value(cell, shared)
+
+        yield int(el.get("r", "0")), values
+        el.clear()
+
+
+def _to_array(values: List[Any], date1904: bool, is_date: bool) -> Any:
+    """
+    Converts the values of one column into a typed array where possible. Columns
+    that mix types are left as objects for the caller to convert.
+    """
+    numeric = all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) or v is None
+        for v in values
+    )
+    if not numeric:
+        res = np.array(values, dtype=object)
+        if is_date:
+            for i, v in enumerate(values):
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    res[i] = _to_array([v], date1904, True)[0]
+
+        return res
+
+    serials = np.array([np.nan if v is None else v for v in values], dtype=float)
+    if is_date:
+        micros = np.round(serials * 86_400_000_000)
+        res = _EPOCHS[date1904] + np.nan_to_num(micros).astype(np.int64).astype(
+            "timedelta64[us]"
+        )
+        res[np.isnan(serials)] = np.datetime64("NaT")
+        return res.astype("datetime64[ns]")
+
+    if not np.isnan(serials).any() and all(isinstance(v, int) for v in values):
+        return serials.astype(np.int64)
+
+    return serials
+
+
+def read_xlsx_columns(
+    path: str,
+    sheet_name: str,
+    columns: List[str],
+    optional: Optional[List[str]] = None,
+    date_columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Streams a worksheet of an Excel file, keeping only the given columns.
+    Unlike `pd.read_excel`, styles and unused columns are never loaded and the
+    rows are parsed straight from the sheet's XML into one array per column.
+
+    Parameters:
+        path (str): the path of the .xlsx file
+        sheet_name (str): the name of the worksheet to read
+        columns (List[str]): the headers of the columns that must be present
+        optional (Optional[List[str]]): the headers of columns to also read if
+            the sheet has them. Default is None
+        date_columns (Optional[List[str]]): the headers of columns holding
+            Excel dates. Numeric cells in them are converted from Excel's date
+            serials to datetimes. Default is None
+
+    Returns:
+        df (DataFrame): a DataFrame with the requested columns, indexed like
+            `pd.read_excel` would be
+    """
+    wanted = set(columns) | set(optional or [])
+    dates = set(date_columns or [])
+
+    with ZipFile(path) as archive:
+        shared = _shared_strings(archive)
+        part, date1904 = _sheet_part(archive, sheet_name)
+
+        with archive.open(part) as sheet:
+            rows = _rows(sheet, shared)
+            header_row, header = next(rows, (0, {}))
+            letters = {
+                letter: name
+                for letter, name in header.items()
+                if isinstance(name, str) and name in wanted
+            }
+
+            missing = [col for col in columns if col not in letters.values()]
+            if len(missing) > 0:
+                raise ValueError(
+                    f"Worksheet '{sheet_name}' is missing columns: {missing}"
+                )
+
+            index: List[int] = []
+            cols: Dict[str, List[Any]] = {letter: [] for letter in letters}
+            for row_num, values in rows:
+                index.append(row_num - header_row - 1)
+                for letter, col in cols.items():
+                    col.append(values.get(letter))
+
+    return pd.DataFrame(
+        {
+            letters[letter]: _to_array(values, date1904, letters[letter] in dates)
+            for letter, values in cols.items()
+        },
+        index=pd.Index(index, dtype=np.int64),
+    )
@@ -1,8 +1,15 @@
-from typing import Callable, Dict, no_type_check
+import pandas as pd
+import weakref
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, no_type_check
 from dataclasses import dataclass
 
 from src.utilities.dictionary_ops import convert_dict
 
+T = TypeVar("T")
+
+_frame_memos: List[Dict[int, Tuple[weakref.ref, Any]]] = []
+
 
 def dataclass_from_converted_json(
     converters: Dict[str, Callable],
@@ -51,3 +58,47 @@ def dataclass_from_json(cls: type) -> type:
         new_type (type): the type with the added functionality
     """
     return dataclass_from_converted_json({})(cls)
+
+
+def memoize_by_frame(func: Callable[[pd.DataFrame], T]) -> Callable[[pd.DataFrame], T]:
+    """
+    Decorator that remembers the result of a function of a single DataFrame for
+    as long as that exact DataFrame object is alive. The result is shared
+    between callers, so it must not be modified.
+
+    Parameters:
+        func (Callable[[DataFrame], T]): the function to memoize
+
+    Returns:
+        memoized (Callable[[DataFrame], T]): the memoized function
+    """
+    results: Dict[int, Tuple[weakref.ref, Any]] = {}
+    _frame_memos.append(results)
+
+    @wraps(func)
+    def inner(df: pd.DataFrame) -> T:
+        key = id(df)
+        entry = results.get(key)
+        if entry is not None and entry[0]() is df:
+            return entry[1]
+
+        res = func(df)
+        results[key] = (weakref.ref(df, lambda _: results.pop(key, None)), res)
+        return res
+
+    return inner
+
+
+def clear_frame_memos() -> None:
+    """
+    Forgets every result remembered by `memoize_by_frame`, e.g. after the
+    configs have changed.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    for results in _frame_memos:
+        results.clear()
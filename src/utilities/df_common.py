@@ -8,11 +8,42 @@ from src.read_data.column import Column
 from src.read_config.get_config import config_globals
 
 
+def partition_codes(
+    df: pd.DataFrame, date_func: Callable[[date, date], List[date]]
+) -> Tuple[List[date], np.ndarray]:
+    """
+    Assigns every row of df to one of the chunks generated by `date_func`. Each
+    row belongs to the chunk with the latest start date on or before its date.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to divide
+        date_func (Callable[[date, date], List[date]]): the function to call to
+            generate the starting date of each chunk
+
+    Returns:
+        dates (List[date]): the starting dates of each chunk
+        codes (np.ndarray): the index into `dates` of each row of df, in the
+            same order as the rows
+    """
+    if df.shape[0] == 0:
+        return [], np.empty(0, dtype=np.intp)
+
+    dates = date_func(df[Column.DATE].min().date(), df[Column.DATE].max().date())
+    if len(dates) == 0:
+        return [], np.empty(0, dtype=np.intp)
+
+    days = df[Column.DATE].to_numpy().astype("datetime64[D]")
+    bounds = np.array(dates, dtype="datetime64[D]")
+    codes = np.searchsorted(bounds, days, side="right") - 1
+    return dates, np.clip(codes, 0, None)
+
+
 def _group_df(
     df: pd.DataFrame, date_func: Callable[[date, date], List[date]]
 ) -> Tuple[List[date], List[pd.DataFrame]]:
     """
-    Divides the df into as many chunks as are generated by `date_func`.
+    Divides the df into as many chunks as are generated by `date_func`. The rows
+    are sorted by chunk once, so each partition is a slice of the same frame.
 
     Parameters:
         df (DataFrame): the Pandas DataFrame to divide
@@ -23,21 +54,20 @@ def _group_df(
         dates (List[dates]): the starting dates of each chunk
         partitions (List[DataFrame]): the list of partitions
     """
-    if df.shape[0] == 0:
+    dates, codes = partition_codes(df, date_func)
+    if len(dates) == 0:
         return [], []
 
-    dates = date_func(df[Column.DATE].min().date(), df[Column.DATE].max().date())
-    partitions = []
-    for i in range(len(dates) - 1):
-        partitions.append(
-            df.loc[
-                (pd.to_datetime(df[Column.DATE]).dt.date >= dates[i])
-                & (pd.to_datetime(df[Column.DATE]).dt.date < dates[i + 1])
-            ]
-        )
+    if np.all(codes[:-1] <= codes[1:]):
+        grouped = df
+        ends = np.searchsorted(codes, np.arange(len(dates)), side="right")
+    else:
+        order = np.argsort(codes, kind="stable")
+        grouped = df.take(order)
+        ends = np.searchsorted(codes[order], np.arange(len(dates)), side="right")
 
-    partitions.append(df.loc[pd.to_datetime(df[Column.DATE]).dt.date >= dates[-1]])
-    return dates, partitions
+    starts = np.concatenate(([0], ends[:-1]))
+    return dates, [grouped.iloc[i:j] for i, j in zip(starts, ends)]
 
 
 def group_by_week(df: pd.DataFrame) -> Tuple[List[date], List[pd.DataFrame]]:
@@ -68,6 +98,51 @@ def group_by_month(df: pd.DataFrame) -> Tuple[List[date], List[pd.DataFrame]]:
     return _group_df(df, get_months)
 
 
+def codes_by_week(df: pd.DataFrame) -> Tuple[List[date], np.ndarray]:
+    """
+    Assigns every row of the DataFrame to a week-size chunk.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to divide
+
+    Returns:
+        weeks (List[date]): the starting date of each group
+        codes (np.ndarray): the index into `weeks` of each row of df
+    """
+    return partition_codes(df, get_weeks)
+
+
+def codes_by_month(df: pd.DataFrame) -> Tuple[List[date], np.ndarray]:
+    """
+    Assigns every row of the DataFrame to a month-size chunk.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to divide
+
+    Returns:
+        months (List[date]): the starting date of each group
+        codes (np.ndarray): the index into `months` of each row of df
+    """
+    return partition_codes(df, get_months)
+
+
+def large_transaction_threshold() -> float:
+    """
+    Returns the price at which a transaction is considered an outlier.
+
+    Parameters:
+        None
+
+    Returns:
+        thresh (float): the threshold, or infinity if outliers aren't filtered
+    """
+    thresh = config_globals()["PROJECTED_SPENDING_LARGE_EXPENSE_THRESHOLD"]
+    if thresh == 0:
+        return np.inf
+
+    return cast(float, thresh)
+
+
 def filter_large_transactions(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
     """
     Throws out outlier transactions that throw off certain calculations.
@@ -79,9 +154,7 @@ def filter_large_transactions(df: pd.DataFrame) -> Tuple[pd.DataFrame, float]:
         df (DataFrame): the filtered DataFrame
         filtered_out (float): how much money was filtered out
     """
-    thresh = config_globals()["PROJECTED_SPENDING_LARGE_EXPENSE_THRESHOLD"]
-    if thresh == 0:
-        thresh = np.inf
+    thresh = large_transaction_threshold()
     return (
         df.loc[(df[Column.PRICE] < thresh) | (df[Column.CATEGORY] == "Bills")],
         cast(float, df.loc[df[Column.PRICE] >= thresh][Column.PRICE].sum()),
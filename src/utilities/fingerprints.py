@@ -0,0 +1,63 @@
+import hashlib
+import json
+import pandas as pd
+from typing import Any
+
+from src.read_data.column import Column
+from src.read_config.get_config import get_config
+
+
+def combine_fingerprints(*parts: Any) -> str:
+    """
+    Combines several values into one fingerprint.
+
+    Parameters:
+        parts (Any): the values to combine. Each is converted to a string
+
+    Returns:
+        fingerprint (str): a hex digest that changes when any of the parts change
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Fingerprints the contents of the DataFrame, ignoring the index and the
+    transaction IDs.
+
+    Parameters:
+        df (DataFrame): the Pandas DataFrame to fingerprint
+
+    Returns:
+        fingerprint (str): a hex digest that changes when the data changes
+    """
+    data = df.drop(columns=[Column.TRANSACTION_ID], errors="ignore")
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in data.columns]).encode())
+    digest.update(json.dumps([str(d) for d in data.dtypes]).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def config_fingerprint(*sections: str) -> str:
+    """
+    Fingerprints the given sections of the user configs.
+
+    Parameters:
+        sections (str): the top level keys of the config to include, e.g. "plots"
+
+    Returns:
+        fingerprint (str): a hex digest that changes when those sections change
+    """
+    config = get_config()
+    return combine_fingerprints(
+        *(
+            json.dumps(config.get(section), sort_keys=True, default=str)
+            for section in sections
+        )
+    )
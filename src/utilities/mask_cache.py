@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+FrameKey = Tuple[int, Hashable]
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Converts a config value into something that can be used as a dictionary key.
+
+    Parameters:
+        value (Any): the value, usually read from the config files
+
+    Returns:
+        frozen (Hashable): an equivalent hashable value
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(map(freeze, value))
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(freeze, value))
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+
+    return value
+
+
+class MaskCache:
+    """
+    A cache of boolean masks computed over DataFrames, so that identical filters
+    used by several plots and aggregations are only evaluated once per frame.
+    Entries are dropped when their frame is garbage collected, and the least
+    recently used entries are evicted once the masks exceed `max_bytes`.
+
+    Attributes:
+        max_bytes (int): how many bytes of masks to keep at most
+        hits (int): how many lookups were answered from the cache
+        misses (int): how many lookups had to compute the mask
+        evictions (int): how many masks were evicted to stay under `max_bytes`
+    """
+
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[FrameKey, Tuple[weakref.ref, np.ndarray]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self.clear()
+
+    def _remove(self, key: FrameKey) -> None:
+        """
+        Removes the entry with the given key, if it's still there.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1].nbytes
+
+    def get(
+        self, df: pd.DataFrame, key: Hashable, compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Returns the mask for `key` over df, computing and storing it if needed.
+
+        Parameters:
+            df (DataFrame): the Pandas DataFrame the mask was computed over
+            key (Hashable): identifies the filter, e.g. (column, operator, value)
+            compute (Callable[[], np.ndarray]): computes the mask on a miss
+
+        Returns:
+            mask (np.ndarray): a read-only boolean array with one value per row
+        """
+        full_key = (id(df), key)
+        entry = self._entries.get(full_key)
+        if entry is not None and entry[0]() is df:
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return entry[1]
+
+        self._remove(full_key)
+        self.misses += 1
+
+        mask = compute()
+        mask.setflags(write=False)
+        if mask.nbytes > self.max_bytes:
+            return mask
+
+        ref = weakref.ref(df, lambda _: self._remove(full_key))
+        self._entries[full_key] = (ref, mask)
+        self._bytes += mask.nbytes
+
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+        return mask
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns how much the cache has been reused.
+
+        Parameters:
+            None
+
+        Returns:
+            stats (Dict[str, int]): the hits, misses, evictions, the number of
+                cached masks and how many bytes they take up
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def report(self) -> str:
+        """
+        Summarizes the cache statistics in one line.
+
+        Parameters:
+            None
+
+        Returns:
+            report (str): a human readable summary
+        """
+        lookups = self.hits + self.misses
+        reuse = 100 * self.hits / lookups if lookups > 0 else 0.0
+        return (
+            f"Filter masks: {self.hits}/{lookups} reused ({reuse:.1f}%), "
+            + f"{self.evictions} evicted, {len(self._entries)} cached "
+            + f"({self._bytes / 1024:.1f} KiB)"
+        )
+
+
+MASK_CACHE = MaskCache(max_bytes=64 * 1024 * 1024)
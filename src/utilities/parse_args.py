@@ -2,15 +2,47 @@ from datetime import date
 import argparse
 from functools import lru_cache
 from enum import StrEnum
+from typing import List
 
 
 class Subcommand(StrEnum):
     CLI = "cli"
     UI = "ui"
     INIT = "init"
+    TRENDS = "trends"
+    COMPACT = "compact"
+    IMPORT = "import"
     UNSET = "unset"
 
 
+class Stage(StrEnum):
+    VALIDATE = "validate"
+    PLOTS = "plots"
+    AGGREGATIONS = "aggregations"
+
+
+def _years(arg: str) -> List[int]:
+    """
+    Parses a comma separated list of years and ranges of years, e.g. 2018-2020.
+    """
+    years: List[int] = []
+    for part in _names(arg):
+        first, _, last = part.partition("-")
+        try:
+            years.extend(range(int(first), int(last or first) + 1))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid years: '{part}'")
+
+    return years
+
+
+def _names(arg: str) -> List[str]:
+    """
+    Splits a comma separated list of names.
+    """
+    return [name.strip() for name in arg.split(",") if len(name.strip()) > 0]
+
+
 @lru_cache(maxsize=1)
 def parse_args() -> argparse.Namespace:
     """
@@ -36,11 +68,36 @@ def parse_args() -> argparse.Namespace:
 
     cli_parser = subparsers.add_parser(Subcommand.CLI, help="run using the CLI")
     _ = subparsers.add_parser(Subcommand.UI, help="launch the Tkinter UI")
+    trends_parser = subparsers.add_parser(
+        Subcommand.TRENDS, help="compare spending across years"
+    )
     init_parser = subparsers.add_parser(
         Subcommand.INIT, help="initialize the repository"
     )
 
-    for par in (cli_parser, init_parser):
+    compact_parser = subparsers.add_parser(
+        Subcommand.COMPACT,
+        help="write the transactions added through the UI to the spreadsheet",
+    )
+
+    import_parser = subparsers.add_parser(
+        Subcommand.IMPORT,
+        help="add a batch of transactions from a csv or JSON Lines file",
+    )
+    import_parser.add_argument(
+        "source",
+        help=(
+            "the transactions to add, as a csv file with a header or a JSON Lines "
+            + "file with an object per transaction."
+        ),
+    )
+    import_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only report how many transactions would be added. Default False.",
+    )
+
+    for par in (cli_parser, init_parser, compact_parser, import_parser):
         par.add_argument(
             "-y",
             "--year",
@@ -56,12 +113,123 @@ def parse_args() -> argparse.Namespace:
         help=("force overwrite files that already exist. Default False."),
     )
 
+    for par in (cli_parser, compact_parser, import_parser):
+        par.add_argument(
+            "-f",
+            "--file",
+            help=(
+                "the path of the file to process. "
+                + "Defaults to /data/{year}/Spending.{xlsx|csv|txt|numbers}"
+            ),
+        )
+
+    cli_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "how many processes to render plots in. "
+            + "Default 1, which renders them one at a time."
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help=(
+            "regenerate every plot and aggregation, even if their inputs haven't "
+            + "changed since they were last generated. Default False."
+        ),
+    )
+
+    years_group = cli_parser.add_mutually_exclusive_group()
+    years_group.add_argument(
+        "--all-years",
+        action="store_true",
+        help=(
+            "analyze every year with a spreadsheet in /data. Each year is run "
+            + "in its own process, --jobs at a time."
+        ),
+    )
+
+    years_group.add_argument(
+        "--years",
+        type=_years,
+        metavar="YEARS",
+        help="analyze the given years, e.g. 2018-2025 or 2020,2022.",
+    )
+
+    cli_parser.add_argument(
+        "--only",
+        nargs="+",
+        type=Stage,
+        choices=list(Stage),
+        help=(
+            "only run the given stages, e.g. --only aggregations to just "
+            + "refresh aggregation.csv. Default runs every stage."
+        ),
+    )
+
     cli_parser.add_argument(
-        "-f",
-        "--file",
+        "--plots",
+        type=_names,
+        metavar="NAME[,NAME...]",
+        help=(
+            "only render the plots with the given names, which are either keys "
+            + "under plots in the configs or names of plotting modules. Implies "
+            + "--only plots unless --only is passed."
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "keep running, and update the outputs whenever the spreadsheet or "
+            + "the configs change. Default False."
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="with --watch, how many seconds to wait between checks. Default 1.",
+    )
+
+    cli_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "record the time and peak memory of every validation, plot and "
+            + "aggregation, printing a table and writing "
+            + "/data/{year}/profile.json. Slows the run down. Default False."
+        ),
+    )
+
+    cli_parser.add_argument(
+        "--pstats",
+        metavar="FILE",
+        help="with --profile, also write cProfile statistics to FILE.",
+    )
+
+    trends_parser.add_argument(
+        "--years",
+        type=_years,
+        metavar="YEARS",
+        help=(
+            "compare the given years, e.g. 2018-2025 or 2020,2022. Defaults to "
+            + "every year with a spreadsheet in /data."
+        ),
+    )
+
+    trends_parser.add_argument(
+        "--rebuild",
+        action="store_true",
         help=(
-            "the path of the file to process. "
-            + "Defaults to /data/{year}/Spending.{xlsx|csv|txt|numbers}"
+            "rebuild the monthly rollup of every year and regenerate the "
+            + "outputs, even if no spreadsheet changed. Default False."
         ),
     )
 
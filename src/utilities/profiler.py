@@ -0,0 +1,227 @@
+import cProfile
+import json
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from os import makedirs
+from os.path import dirname
+from time import perf_counter, process_time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utilities.mask_cache import MASK_CACHE
+
+
+@dataclass
+class StageRecord:
+    """
+    The cost of one run of a stage.
+
+    Attributes:
+        kind (str): what sort of stage it is, e.g. "plot" or "aggregation"
+        name (str): which stage it is, e.g. the name of the plot
+        wall (float): how many seconds the stage took
+        cpu (float): how many seconds of CPU time the stage used in its process
+        peak_bytes (int): how far memory use rose above where it was when the
+            stage started, at its highest
+    """
+
+    kind: str
+    name: str
+    wall: float
+    cpu: float
+    peak_bytes: int
+
+
+class Profiler:
+    """
+    Records the wall time, CPU time and peak memory of each stage of the
+    pipeline. Does nothing until it's enabled, so stages can always be wrapped
+    in `stage`.
+
+    Attributes:
+        enabled (bool): whether stages are being recorded
+        records (List[StageRecord]): every stage recorded so far, in the order
+            they finished
+    """
+
+    enabled: bool
+    records: List[StageRecord]
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.records = []
+        self._peaks: List[int] = []
+        self._profile: Optional[cProfile.Profile] = None
+
+    def enable(self, with_cprofile: bool = False) -> None:
+        """
+        Starts recording stages, tracing memory allocations to do so.
+
+        Parameters:
+            with_cprofile (bool): whether to also run cProfile until
+                `dump_stats` is called. Default is False
+
+        Returns:
+            None
+        """
+        self.enabled = True
+        self.records = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        if with_cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def disable(self) -> None:
+        """
+        Stops recording stages and tracing memory.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.enabled = False
+        if self._profile is not None:
+            self._profile.disable()
+
+        tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, kind: str, name: str) -> Iterator[None]:
+        """
+        Records the stage run inside the with block. Stages can be nested, and
+        the peak memory of a stage includes that of the stages inside it.
+
+        Parameters:
+            kind (str): what sort of stage it is
+            name (str): which stage it is
+
+        Returns:
+            ctx (Iterator[None]): a context manager wrapping the stage
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if len(self._peaks) > 0:
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.reset_peak()
+        start_mem = tracemalloc.get_traced_memory()[0]
+        self._peaks.append(start_mem)
+        start_wall = perf_counter()
+        start_cpu = process_time()
+        try:
+            yield
+
+        finally:
+            wall = perf_counter() - start_wall
+            cpu = process_time() - start_cpu
+            peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if len(self._peaks) > 0:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+
+            self.records.append(StageRecord(kind, name, wall, cpu, peak - start_mem))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Totals the records of each stage, since plots run once per month.
+
+        Parameters:
+            None
+
+        Returns:
+            stages (List[Dict[str, Any]]): the kind, name, number of calls, total
+                wall and CPU time and highest peak memory of each stage, slowest
+                first
+        """
+        totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for rec in self.records:
+            total = totals.setdefault(
+                (rec.kind, rec.name),
+                {
+                    "kind": rec.kind,
+                    "name": rec.name,
+                    "calls": 0,
+                    "wall": 0.0,
+                    "cpu": 0.0,
+                    "peak_bytes": 0,
+                },
+            )
+            total["calls"] += 1
+            total["wall"] += rec.wall
+            total["cpu"] += rec.cpu
+            total["peak_bytes"] = max(total["peak_bytes"], rec.peak_bytes)
+
+        return sorted(totals.values(), key=lambda t: t["wall"], reverse=True)
+
+    def report(self) -> str:
+        """
+        Formats the summary as a table.
+
+        Parameters:
+            None
+
+        Returns:
+            table (str): a human readable table of every stage, slowest first
+        """
+        header = (
+            f"{'kind':<12} {'stage':<40} {'calls':>5} "
+            + f"{'wall (s)':>9} {'cpu (s)':>9} {'peak (MiB)':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for total in self.summary():
+            lines.append(
+                f"{total['kind']:<12} {total['name'][:40]:<40} {total['calls']:>5} "
+                + f"{total['wall']:>9.3f} {total['cpu']:>9.3f} "
+                + f"{total['peak_bytes'] / 2**20:>10.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """
+        Writes every record, the summary and the filter mask cache statistics
+        to a JSON file.
+
+        Parameters:
+            path (str): where to write the report
+
+        Returns:
+            None
+        """
+        if len(dirname(path)) > 0:
+            makedirs(dirname(path), exist_ok=True)
+
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "summary": self.summary(),
+                    "records": [asdict(rec) for rec in self.records],
+                    "mask_cache": MASK_CACHE.stats(),
+                },
+                f,
+                indent=2,
+            )
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Writes the cProfile statistics, which can be read with `pstats` or
+        tools like snakeviz.
+
+        Parameters:
+            path (str): where to write the statistics
+
+        Returns:
+            None
+        """
+        if self._profile is None:
+            raise ValueError("cProfile wasn't enabled")
+
+        self._profile.dump_stats(path)
+
+
+PROFILER = Profiler()
@@ -1,7 +1,5 @@
 import numpy as np
 from typing import Dict, Tuple
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 
 
 def metrics_over_time(
@@ -23,6 +21,10 @@ def metrics_over_time(
     Returns:
         None
     """
+    # imported here so only plotting pays for importing matplotlib
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
     plt.clf()
     plt.title(title)
     plt.ylabel("Dollars Spent Per Month")
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from os.path import join
+
+from src.calculations.rollups import year_over_year
+
+
+def category_by_year(rollups: pd.DataFrame, out_dir: str) -> None:
+    """
+    Plots how much was spent in each category each year using grouped bars.
+
+    Parameters:
+        rollups (DataFrame): the monthly rollups of every year to plot
+        out_dir (str): the directory to put the plot in
+
+    Returns:
+        None
+    """
+    totals = year_over_year(rollups).drop(index="Total")
+    years = totals.columns.tolist()
+    inds = np.arange(totals.shape[0], dtype=float)
+    width = 0.8 / max(len(years), 1)
+
+    plt.clf()
+    fig = plt.figure(figsize=(max(6.4, totals.shape[0] * 0.3 * len(years)), 4.8))
+    fig.add_subplot()
+
+    plt.title("Spending By Category Each Year")
+    plt.ylabel("Total Spent")
+
+    for i, year in enumerate(years):
+        plt.bar(
+            inds + (i - (len(years) - 1) / 2) * width, totals[year], width, label=year
+        )
+
+    plt.xticks(inds, totals.index, rotation=45, ha="right")
+    plt.legend(loc="upper right")
+    plt.tight_layout()
+
+    plt.savefig(join(out_dir, "category_by_year.png"))
+    plt.close()
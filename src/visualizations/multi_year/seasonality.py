@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from calendar import month_abbr
+from os.path import join
+
+from src.calculations.rollups import seasonality
+
+
+def monthly_seasonality(rollups: pd.DataFrame, out_dir: str) -> None:
+    """
+    Plots how much was spent each month, with a line for each year and a
+    dashed line for the average across years.
+
+    Parameters:
+        rollups (DataFrame): the monthly rollups of every year to plot
+        out_dir (str): the directory to put the plot in
+
+    Returns:
+        None
+    """
+    totals = seasonality(rollups)
+    inds = np.arange(1, 13)
+
+    plt.clf()
+    fig = plt.figure()
+    fig.add_subplot()
+
+    plt.title("Spending By Month Each Year")
+    plt.ylabel("Total Spent")
+    plt.xticks(inds, month_abbr[1:])
+
+    for year in totals.columns:
+        plt.plot(inds, totals[year], marker="o", label=year)
+
+    plt.plot(inds, totals.mean(axis=1), "k--", label="Average")
+    plt.legend(loc="upper right")
+
+    plt.savefig(join(out_dir, "seasonality.png"))
+    plt.close()
@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import LedgerSpec, generate_year
+from src.read_data.column import Column
+
+
+def test_generate_year():
+    spec = LedgerSpec(rows=500, categories=10, bill_ratio=0.1, seed=3)
+    df = generate_year(spec, 2024)
+
+    assert df.shape[0] == 500
+    assert df[Column.DATE].is_monotonic_increasing
+    assert (df[Column.DATE].dt.year == 2024).all()
+    assert (df[Column.PRICE] > 0).all()
+    assert df[Column.CATEGORY].nunique() <= 11
+    assert 0 < (df[Column.CATEGORY] == "Bills").mean() < 0.2
+
+    pd.testing.assert_frame_equal(df, generate_year(spec, 2024))
+    assert not df.equals(generate_year(spec, 2025))
+
+
+def test_generate_year_invalid():
+    with pytest.raises(ValueError):
+        generate_year(LedgerSpec(rows=0), 2024)
+
+    with pytest.raises(ValueError):
+        generate_year(LedgerSpec(bill_ratio=2), 2024)
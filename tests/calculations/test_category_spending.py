@@ -1,11 +1,14 @@
 import numpy as np
 
 from src.calculations.category_spending import category_spending
+from src.models.paths import Paths
 
 from tests.test_utils import sample_data
 
 
-def test_category_spending():
+def test_category_spending(data_root):
+    # the income comes from the configs, which only have it for the sample's year
+    Paths.set_year(2024)
     data = sample_data()
 
     cats = category_spending(data)
@@ -11,3 +11,10 @@ def test_monthly_spending():
     months = monthly_spending(data)
     assert np.isclose(months["Jan"], 731.39, rtol=0.1)
     assert np.isclose(months["Feb"], 120.35, rtol=0.1)
+
+
+def test_monthly_spending_memoized():
+    data = sample_data()
+
+    assert monthly_spending(data) is monthly_spending(data)
+    assert monthly_spending(data.copy()) == monthly_spending(data)
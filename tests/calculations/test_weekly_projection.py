@@ -0,0 +1,56 @@
+import numpy as np
+from datetime import datetime, timedelta
+
+from src.calculations.weekly_projection import weekly_projection
+from src.models.day_counts import DayCounts
+from src.read_config.get_config import config_globals
+from src.read_data.column import Column
+from src.read_data.read_data import get_month_dfs
+from src.utilities.helpers import get_weeks, time_filter
+
+from tests.test_utils import sample_data
+
+
+def _expected(df):
+    fmt = "%m/%d/%Y"
+    thresh = config_globals()["PROJECTED_SPENDING_BILL_THRESHOLD"]
+    is_bill = (df[Column.CATEGORY] == "Bills") & (
+        df[Column.PRICE] >= (thresh if thresh > 0 else np.inf)
+    )
+    bills = df.loc[is_bill]
+    rest = df.loc[~is_bill]
+
+    avgs = []
+    for start in get_weeks(df[Column.DATE].min().date(), df[Column.DATE].max().date()):
+        dtm = datetime.combine(start, datetime.min.time())
+        week_df = time_filter(
+            rest, dtm.strftime(fmt), (dtm + timedelta(days=6)).strftime(fmt)
+        )
+        if week_df.shape[0] == 0:
+            avgs.append(0.0)
+            continue
+
+        month_bills = bills.loc[
+            (bills[Column.DATE].dt.month == dtm.month)
+            & (bills[Column.DATE].dt.year == dtm.year)
+        ]
+        next_month = datetime(dtm.year + dtm.month // 12, dtm.month % 12 + 1, 1)
+        days_in_month = (next_month - timedelta(days=1)).day
+        avgs.append(
+            (week_df[Column.PRICE].sum() / 7) * DayCounts.days_per_month()
+            + month_bills[Column.PRICE].sum()
+            * (DayCounts.days_per_month() / days_in_month)
+        )
+
+    return avgs
+
+
+def test_weekly_projection():
+    data = sample_data()
+
+    for df in [data] + get_month_dfs(data):
+        result = weekly_projection(df)
+        expected = _expected(df)
+
+        assert len(result) == len(expected)
+        assert np.allclose(result, expected)
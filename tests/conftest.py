@@ -0,0 +1,52 @@
+from copy import deepcopy
+from os import makedirs
+
+import pytest
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.models.paths import Paths
+from src.read_config.get_config import get_config, use_config
+from src.read_data.read_data import read_data
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "ledgers(*years, rows=300): give the data_root fixture a synthetic "
+        + "spreadsheet for each year",
+    )
+
+
+@pytest.fixture
+def data_root(tmp_path, request):
+    """
+    Points Paths at a temporary data directory, and restores the data root, year,
+    spreadsheet and configs after the test. Tests marked with `ledgers` get a
+    synthetic spreadsheet for each of the marker's years, and the configs are a
+    copy that the test can change, with an income for each of those years.
+    """
+    root, year = Paths.get_data_root(), list(Paths._year_mut)
+    sheet = Paths.get_spending_override()
+
+    marker = request.node.get_closest_marker("ledgers")
+    years = () if marker is None else marker.args
+    rows = 300 if marker is None else marker.kwargs.get("rows", 300)
+
+    config = deepcopy(get_config())
+    for y in years:
+        makedirs(tmp_path / str(y))
+        write_ledger(
+            generate_year(LedgerSpec(rows=rows), y),
+            str(tmp_path / str(y) / "Spending.csv"),
+        )
+        config["globals"]["YEARLY_TAKE_HOME_PAY"][str(y)] = 50000
+
+    Paths.set_data_root(str(tmp_path))
+    use_config(config)
+    yield tmp_path
+
+    use_config(None)
+    read_data.cache_clear()
+    Paths.set_data_root(root)
+    Paths.set_spending_path(sheet)
+    Paths._year_mut[:] = year
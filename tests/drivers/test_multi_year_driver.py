@@ -0,0 +1,35 @@
+from os import makedirs
+
+import pytest
+
+from src.drivers.multi_year_driver import MultiYearDriver
+from src.models.paths import Paths
+from src.utilities.parse_args import Stage, _years
+
+
+pytestmark = pytest.mark.ledgers(2021, 2022, rows=200)
+
+
+@pytest.fixture
+def data_root(data_root):
+    # a year without a spreadsheet
+    makedirs(data_root / "2023")
+    return data_root
+
+
+def test_years_arg():
+    assert _years("2018-2020,2023") == [2018, 2019, 2020, 2023]
+
+
+def test_available_years(data_root):
+    assert Paths.available_years() == [2021, 2022]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_years(data_root, jobs):
+    # validating needs the income for each year, which is only in the seeded configs
+    results = MultiYearDriver([2021, 2022, 2023], jobs).analyze(stages=[Stage.VALIDATE])
+
+    assert [res.year for res in results] == [2021, 2022, 2023]
+    assert [res.error is None for res in results] == [True, True, False]
+    assert "No spending spreadsheet" in str(results[2].error)
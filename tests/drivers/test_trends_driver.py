@@ -0,0 +1,29 @@
+from os import remove
+from os.path import exists, getmtime, join
+
+import pytest
+
+from src.drivers.trends_driver import TrendsDriver
+from src.models.paths import Paths
+
+OUTPUTS = (
+    "year_over_year.csv",
+    "seasonality.csv",
+    "category_by_year.png",
+    "seasonality.png",
+)
+
+
+@pytest.mark.ledgers(2021, 2022, rows=200)
+def test_trends_regenerates_missing_outputs(data_root):
+    TrendsDriver().trends()
+    out_dir = Paths.trends_dir()
+    assert all(exists(join(out_dir, output)) for output in OUTPUTS)
+
+    mtime = getmtime(join(out_dir, "year_over_year.csv"))
+    TrendsDriver().trends()
+    assert getmtime(join(out_dir, "year_over_year.csv")) == mtime
+
+    remove(join(out_dir, "seasonality.png"))
+    TrendsDriver().trends()
+    assert exists(join(out_dir, "seasonality.png"))
@@ -0,0 +1,75 @@
+from os.path import basename, exists, join, normpath
+
+import pytest
+
+from src.drivers.visualization_driver import VisualizationDriver, plotter_name
+from src.models.manifest import Manifest
+from src.models.paths import Paths
+from src.read_config.get_config import get_config
+
+
+@pytest.fixture
+def year_data(data_root):
+    get_config()["plots"]["cheap"] = {
+        "timeframe": "yearly",
+        "title": "Cheap",
+        "lines": [
+            {
+                "filters": [{"column": "Price", "operator": "in", "value": [10, 20]}],
+                "label": "cheap",
+            }
+        ],
+    }
+    Paths.set_year(2024)
+    return data_root
+
+
+def combined_only(df, out_dir):
+    if basename(normpath(out_dir)) == "Combined":
+        raise ValueError("can't plot everything")
+
+
+def test_select_plots(data_root):
+    driver = VisualizationDriver(["sankey_flow", "food_over_time"])
+
+    assert list(map(plotter_name, driver.monthlys)) == ["sankey_flow"]
+    assert list(map(plotter_name, driver.yearlys)) == ["food_over_time"]
+
+
+def test_select_all_plots(data_root):
+    driver = VisualizationDriver()
+    names = set(map(plotter_name, driver.monthlys + driver.yearlys))
+
+    assert {"sankey_flow", "food_over_time", "saved_over_time"} <= names
+    assert driver.selected is None
+
+
+def test_select_unknown_plot(data_root):
+    with pytest.raises(ValueError):
+        VisualizationDriver(["sankey_flow", "not_a_plot"])
+
+
+@pytest.mark.ledgers(2024)
+def test_visualize_in_parallel(year_data):
+    VisualizationDriver(["cheap"]).visualize(jobs=2)
+
+    assert exists(join(Paths.plots_dir(), "Combined", "cheap.png"))
+
+
+@pytest.mark.ledgers(2024)
+def test_visualize_in_parallel_errors(year_data):
+    driver = VisualizationDriver(["cheap"])
+    driver.selected = None
+    driver.monthlys = [combined_only]
+
+    with pytest.raises(RuntimeError) as err:
+        driver.visualize(jobs=2)
+
+    assert "1 plot(s) failed" in str(err.value)
+    assert join("Combined", "combined_only") in str(err.value)
+
+    # the folders that rendered are up to date, but the one that failed isn't
+    entries = Manifest(Paths.manifest_path()).entries
+    assert "plots/Combined" not in entries
+    assert len(entries) > 0
+    assert exists(join(Paths.plots_dir(), "Combined", "cheap.png"))
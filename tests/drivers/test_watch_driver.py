@@ -0,0 +1,22 @@
+from src.drivers.watch_driver import stages_to_run
+from src.utilities.parse_args import Stage
+
+
+def test_stages_to_run():
+    config = {
+        "globals": {"SANKEY_OTHER_THRESHOLD": 0.02},
+        "plots": {"a": {"title": "A"}},
+        "aggregations": {"b": {"filters": []}},
+    }
+
+    assert stages_to_run(False, config, config) == []
+    assert stages_to_run(True, config, config) == list(Stage)
+
+    plots = {**config, "plots": {"a": {"title": "B"}}}
+    assert stages_to_run(False, config, plots) == [Stage.PLOTS]
+
+    aggs = {**plots, "aggregations": {}}
+    assert stages_to_run(False, config, aggs) == [Stage.PLOTS, Stage.AGGREGATIONS]
+
+    globs = {**config, "globals": {"SANKEY_OTHER_THRESHOLD": 0.05}}
+    assert stages_to_run(False, config, globs) == list(Stage)
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.config_objs.filter import (
+    OPERATORS,
+    CompiledFilter,
+    Filter,
+    NegatedFilter,
+    parse_filter,
+)
+from src.utilities.mask_cache import MASK_CACHE
+
+from tests.test_utils import sample_data
+
+
+def _frame():
+    df = sample_data().copy()
+    # missing values in a nullable and a plain numeric column
+    df.loc[df.index[:5], "Is Food"] = pd.NA
+    df.loc[df.index[5:10], "Price"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize(
+    "column,operator,value",
+    [
+        ("Price", "=", 10),
+        ("Price", ">", 25.5),
+        ("Price", "<", 10),
+        ("Price", "<=", 10),
+        ("Price", ">=", 2000),
+        ("Price", "in", [10, 20]),
+        ("Is Food", "=", 1),
+        ("Is Food", "=", 0),
+        ("Controllable", "in", [True]),
+        ("Category", "=", "Groceries"),
+        ("Category", "iequals", "bills"),
+        ("Category", "icontains", "out"),
+        ("Category", "in", ["Bills", "Groceries"]),
+    ],
+)
+def test_filter_matches_pandas(column, operator, value):
+    df = _frame()
+    expected = OPERATORS[operator](df[column], value).to_numpy(
+        dtype=bool, na_value=False
+    )
+
+    assert np.array_equal(Filter(column, operator, value)._evaluate(df), expected)
+
+
+def test_invalid_operator():
+    with pytest.raises(ValueError):
+        Filter("Price", "!=", 1)
+
+
+@pytest.mark.parametrize("disjunction", [False, True])
+def test_compiled_filter(disjunction):
+    df = _frame()
+    filters = [
+        Filter("Is Food", "=", 1),
+        Filter("Price", ">", 10),
+        Filter("Category", "iequals", "bills"),
+        Filter("Price", ">", 10),
+    ]
+    combine = np.logical_or if disjunction else np.logical_and
+    expected = combine.reduce([f.mask(df) for f in filters])
+
+    compiled = CompiledFilter(filters, disjunction)
+    assert len(compiled) == 3
+    assert np.array_equal(compiled.mask(df), expected)
+    assert not compiled.mask(df).flags.writeable
+
+
+def test_compiled_filter_short_circuits():
+    df = sample_data()
+    MASK_CACHE.clear()
+    never = Filter("Price", "<", -1)
+    compiled = CompiledFilter([never, Filter("Category", "icontains", "x")])
+
+    assert not compiled.mask(df).any()
+    # only the first filter and the combined mask were evaluated
+    assert MASK_CACHE.misses == 2
+    assert CompiledFilter([]).mask(df).all()
+
+
+FOOD = {"column": "Is Food", "operator": "=", "value": 1}
+CHEAP = {"column": "Price", "operator": "<", "value": 10}
+BILLS = {"column": "Category", "operator": "=", "value": "Bills"}
+
+
+def test_nested_groups():
+    df = _frame()
+    food, cheap, bills = (Filter(**f).mask(df) for f in (FOOD, CHEAP, BILLS))
+    tree = CompiledFilter.from_json(
+        {"any": [{"all": [FOOD, CHEAP]}, {"not": [BILLS, {"not": CHEAP}]}]}
+    )
+
+    assert np.array_equal(tree.mask(df), (food & cheap) | ~(bills & ~cheap))
+
+
+def test_groups_are_canonical():
+    assert parse_filter({"not": {"not": FOOD}}).key == Filter(**FOOD).key
+    assert parse_filter({"any": [FOOD]}).key == Filter(**FOOD).key
+    assert isinstance(parse_filter({"not": FOOD}), NegatedFilter)
+
+    nested = parse_filter({"all": [FOOD, {"all": [CHEAP, BILLS]}]})
+    flat = parse_filter([BILLS, CHEAP, FOOD, CHEAP])
+    assert nested.key == flat.key
+    assert parse_filter({"any": [FOOD, CHEAP]}).key != parse_filter([FOOD, CHEAP]).key
+
+
+@pytest.mark.parametrize(
+    "node", [{"any": []}, {"all": FOOD}, {"not": FOOD, "any": [CHEAP]}, "Bills"]
+)
+def test_invalid_groups(node):
+    with pytest.raises(ValueError):
+        parse_filter(node)
+
+
+def test_shared_subexpressions():
+    df = sample_data()
+    MASK_CACHE.clear()
+    shared = {"any": [FOOD, BILLS]}
+    first = CompiledFilter.from_json([shared, CHEAP])
+    second = CompiledFilter.from_json([{"not": CHEAP}, {"any": [BILLS, FOOD]}])
+
+    first.mask(df)
+    misses = MASK_CACHE.misses
+    second.mask(df)
+    # only the negation and the new combination had to be evaluated
+    assert MASK_CACHE.misses - misses == 2
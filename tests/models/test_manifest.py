@@ -0,0 +1,16 @@
+from src.models.manifest import Manifest
+
+
+def test_manifest(tmp_path):
+    path = str(tmp_path / ".manifest.json")
+    manifest = Manifest(path)
+
+    assert not manifest.is_current("plots/January", "abc")
+
+    manifest.update("plots/January", "abc")
+    assert manifest.is_current("plots/January", "abc")
+
+    reloaded = Manifest(path)
+    assert reloaded.is_current("plots/January", "abc")
+    assert not reloaded.is_current("plots/January", "def")
+    assert not reloaded.is_current("plots/Combined", "abc")
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pandas as pd
+
+from src.models.paths import Paths
+from src.read_data.column import Column
+from src.read_data.read_data import read_dates
+
+
+def test_import_is_lazy():
+    code = (
+        "from src.models.paths import Paths; "
+        + "import src.utilities.parse_args as p; "
+        + "assert Paths._year_mut == []; "
+        + "assert p.parse_args.cache_info().currsize == 0"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code, "--not-an-arg"], capture_output=True, text=True
+    )
+
+    assert res.returncode == 0, res.stderr
+
+
+def test_year_from_spending_path():
+    year, sheet = list(Paths._year_mut), Paths._sheet_override[0]
+    try:
+        Paths._year_mut.clear()
+        Paths.set_spending_path("sample_data.xlsx")
+        assert Paths.get_year() == 2024
+        assert Paths.spending_path() == "sample_data.xlsx"
+
+        Paths.set_year(2023)
+        assert Paths.get_year() == 2023
+
+    finally:
+        Paths._year_mut[:] = year
+        Paths.set_spending_path(sheet)
+
+
+def test_read_dates(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    pd.DataFrame(
+        {
+            Column.DATE: ["1/3/2024", None, "2/1/2024"],
+            Column.CATEGORY: ["Coffee", "Coffee", "Coffee"],
+        }
+    ).to_csv(path, index=False)
+
+    assert list(read_dates(path)) == list(pd.to_datetime(["1/3/2024", "2/1/2024"]))
+    assert read_dates("sample_data.xlsx").equals(
+        pd.read_excel("sample_data.xlsx")[Column.DATE]
+    )
@@ -0,0 +1,110 @@
+import pickle
+import numpy as np
+
+from src.models.config_objs.plot import Plot
+from src.read_data.column import Column
+from src.utilities.df_common import (
+    group_by_month,
+    group_by_week,
+    filter_large_transactions,
+)
+
+from tests.test_utils import sample_data
+
+
+def _plot(timeframe):
+    return Plot(
+        {
+            "plot_name": "test_plot",
+            "title": "Test plot",
+            "timeframe": timeframe,
+            "lines": [
+                {
+                    "filters": [
+                        {"column": "Is Food", "operator": "=", "value": 1},
+                        {"column": "Price", "operator": ">", "value": 10},
+                    ],
+                    "label": "food",
+                },
+                {
+                    "filters": [
+                        {"column": "Category", "operator": "iequals", "value": "bills"},
+                        {"column": "Price", "operator": ">=", "value": 2000},
+                    ],
+                    "disjunction": True,
+                    "label": "bills",
+                },
+                {"filters": [], "label": "total"},
+                {"filters": [], "label": "average", "agg": {"func": "mean"}},
+            ],
+        }
+    )
+
+
+def _expected(plot, df):
+    group = group_by_week if plot.timeframe == "monthly" else group_by_month
+    _, partitions = group(df)
+
+    filt_total = 0.0
+    expected = {}
+    for line in plot.lines:
+        y_vals = []
+        for part in partitions:
+            if len(line.filters) == 0:
+                y_vals.append(part[Column.PRICE].sum())
+                continue
+
+            conds = [f.filter_cond(part) for f in line.filters]
+            cond = conds[0]
+            for c in conds[1:]:
+                cond = (cond | c) if line.disjunction else (cond & c)
+
+            part_filt, to_add = filter_large_transactions(part.loc[cond])
+            y_vals.append(part_filt[Column.PRICE].sum())
+            filt_total += to_add
+
+        y = np.array(y_vals) + filt_total / len(y_vals)
+        if line.agg is not None:
+            y = np.full(len(y), getattr(np, line.agg.func)(y))
+
+        expected[line.label] = y
+
+    return expected
+
+
+def test_plot_metrics():
+    data = sample_data()
+    for timeframe in ("monthly", "yearly"):
+        plot = _plot(timeframe)
+        starts, metrics = plot.metrics(data)
+        expected = _expected(plot, data)
+
+        assert metrics.keys() == expected.keys()
+        for label, (values, _) in metrics.items():
+            assert len(values) == len(starts)
+            assert np.allclose(values, expected[label])
+
+
+def test_plot_pickles():
+    plot = Plot(
+        {
+            "plot_name": "cheap",
+            "title": "Cheap",
+            "timeframe": "monthly",
+            "lines": [
+                {
+                    "filters": [
+                        {"column": "Price", "operator": "in", "value": [10, 20]}
+                    ],
+                    "label": "cheap",
+                }
+            ],
+        }
+    )
+    df = sample_data()
+
+    copy = pickle.loads(pickle.dumps(plot))
+
+    assert np.array_equal(
+        copy.lines[0].predicate.mask(df), df[Column.PRICE].isin([10, 20])
+    )
@@ -0,0 +1,65 @@
+from os import utime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.calculations.rollups import monthly_rollup, seasonality, year_over_year
+from src.models.paths import Paths
+from src.models.rollup_store import RollupStore
+from src.read_data.column import Column
+from src.read_data.read_data import read_data
+
+YEARS = (2021, 2022, 2023)
+
+
+pytestmark = pytest.mark.ledgers(*YEARS)
+
+
+def test_monthly_rollup(data_root):
+    df = read_data(Paths.year_spending_path(2021))
+    rollup = monthly_rollup(df)
+
+    assert rollup["total"].sum() == pytest.approx(df[Column.PRICE].sum())
+    assert rollup["count"].sum() == df.shape[0]
+    assert rollup["food"].sum() == pytest.approx(
+        df.loc[df[Column.IS_FOOD].astype(bool), Column.PRICE].sum()
+    )
+    assert not rollup.duplicated(["year", "month", Column.CATEGORY]).any()
+
+
+def test_refresh_is_incremental(data_root):
+    store = RollupStore(Paths.rollups_dir())
+    assert store.refresh(YEARS) == list(YEARS)
+    assert store.refresh(YEARS) == []
+
+    utime(Paths.year_spending_path(2022), ns=(0, 0))
+    assert RollupStore(Paths.rollups_dir()).refresh(YEARS) == [2022]
+    assert store.refresh(YEARS, rebuild=True) == list(YEARS)
+
+
+def test_load_matches_spreadsheets(data_root):
+    store = RollupStore(Paths.rollups_dir())
+    store.refresh(YEARS)
+    rollups = store.load(YEARS)
+
+    expected = pd.concat(
+        [monthly_rollup(read_data(Paths.year_spending_path(y))) for y in YEARS],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(rollups, expected)
+    assert store.load([1999]).shape[0] == 0
+
+
+def test_year_over_year_and_seasonality(data_root):
+    store = RollupStore(Paths.rollups_dir())
+    store.refresh(YEARS)
+    rollups = store.load(YEARS)
+
+    totals = year_over_year(rollups)
+    assert totals.columns.tolist() == list(YEARS)
+    assert np.allclose(totals.loc["Total"], totals.drop(index="Total").sum())
+
+    months = seasonality(rollups)
+    assert months.index.tolist() == list(range(1, 13))
+    assert np.allclose(months.sum(), totals.loc["Total"])
@@ -0,0 +1,12 @@
+from src.read_config.get_config import get_config
+from src.read_config.plotters_from_config import plotters_from_config
+
+
+def test_plotters_from_config_repeatable():
+    first = plotters_from_config()
+    second = plotters_from_config()
+
+    assert list(map(len, first)) == list(map(len, second))
+    for plot in get_config()["plots"].values():
+        assert "plot_name" not in plot
+        assert all(isinstance(line, dict) for line in plot["lines"])
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.read_data.column import Column
+from src.read_data.import_transactions import import_transactions, validate_batch
+from src.read_data.read_data import read_data
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    df = generate_year(LedgerSpec(rows=100), 2024)
+    path = str(tmp_path / "Spending.xlsx")
+    write_ledger(df, path)
+    return df, path
+
+
+def _coffee(**changes):
+    row = {
+        Column.DATE: "05/03/2024",
+        Column.CATEGORY: "Eating Out",
+        Column.PRICE: "$4.50",
+        Column.IS_FOOD: "1",
+        Column.CONTROLLABLE: "true",
+        "Bank Reference": "abc",
+    }
+    return {**row, **changes}
+
+
+def test_import_skips_duplicates(ledger, tmp_path):
+    df, path = ledger
+    batch = tmp_path / "batch.csv"
+    pd.concat([df.iloc[:5], pd.DataFrame([_coffee(), _coffee()])]).to_csv(
+        batch, index=False
+    )
+
+    result = import_transactions(str(batch), path, dry_run=True)
+    assert (result.read, result.added, result.duplicates) == (7, 2, 5)
+    assert read_data(path).shape[0] == 100
+
+    import_transactions(str(batch), path)
+    after = read_data(path)
+    assert after.shape[0] == 102
+    assert (after[Column.PRICE].iloc[-2:] == 4.5).all()
+    assert "Bank Reference" not in after.columns
+
+    # the second import only adds the coffee that isn't in the spreadsheet yet
+    jsonl = tmp_path / "batch.jsonl"
+    pd.DataFrame([_coffee()] * 3).to_json(jsonl, orient="records", lines=True)
+    assert import_transactions(str(jsonl), path).added == 1
+
+
+def test_validate_batch():
+    rows = [
+        _coffee(),
+        _coffee(Date="not a date"),
+        _coffee(Price="-3"),
+        _coffee(Category=" "),
+        _coffee(**{Column.IS_FOOD: "maybe"}),
+    ]
+    with pytest.raises(ValueError) as err:
+        validate_batch(pd.DataFrame(rows).astype(str))
+
+    assert "row 1" not in str(err.value)
+    for row in (2, 3, 4, 5):
+        assert f"row {row}:" in str(err.value)
+
+    with pytest.raises(ValueError, match="missing columns Price"):
+        validate_batch(pd.DataFrame([_coffee()]).drop(columns=[Column.PRICE]))
+
+
+def test_import_other_year(ledger, tmp_path):
+    _, path = ledger
+    batch = tmp_path / "batch.csv"
+    pd.DataFrame([_coffee(Date="01/02/2025")]).to_csv(batch, index=False)
+
+    with pytest.raises(ValueError, match="same year"):
+        import_transactions(str(batch), path)
@@ -0,0 +1,80 @@
+from datetime import date
+from os.path import exists, getmtime, splitext
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.read_data.column import Column
+from src.read_data.journal import JOURNALED_EXTNS, journal_path
+from src.read_data.read_data import read_data, read_dates
+from src.read_data.write_data import append_transactions, compact
+
+
+def _transaction(price):
+    return pd.DataFrame(
+        {
+            Column.DATE: [date(2024, 5, 3)],
+            Column.CATEGORY: ["Groceries"],
+            Column.PRICE: [price],
+            Column.IS_FOOD: [1],
+            Column.CONTROLLABLE: [0],
+        }
+    )
+
+
+@pytest.fixture(params=["xlsx", "numbers", "csv"])
+def sheet(tmp_path, request):
+    path = str(tmp_path / f"Spending.{request.param}")
+    write_ledger(generate_year(LedgerSpec(rows=100), 2024), path)
+    return path
+
+
+def test_append_and_compact(sheet):
+    before = read_data(sheet)
+    mtime = getmtime(sheet)
+    append_transactions(_transaction(12.5), sheet)
+    append_transactions(_transaction(12.5), sheet)
+
+    journaled = splitext(sheet)[1] in JOURNALED_EXTNS
+    assert exists(journal_path(sheet)) == journaled
+    assert (getmtime(sheet) == mtime) == journaled
+
+    merged = read_data(sheet)
+    assert merged.shape[0] == before.shape[0] + 2
+    assert merged[Column.TRANSACTION_ID].is_unique
+    assert (merged[Column.PRICE].iloc[-2:] == 12.5).all()
+    assert read_dates(sheet).shape[0] == merged.shape[0]
+
+    assert compact(sheet) == (2 if journaled else 0)
+    assert not exists(journal_path(sheet))
+    pd.testing.assert_frame_equal(
+        read_data(sheet).reset_index(drop=True),
+        merged.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_journal_unicode(tmp_path):
+    path = str(tmp_path / "Spending.xlsx")
+    write_ledger(generate_year(LedgerSpec(rows=20), 2024), path)
+    append_transactions(_transaction(20).assign(Description=["Dinner €20"]), path)
+
+    assert read_data(path)["Description"].iloc[-1] == "Dinner €20"
+
+    compact(path)
+    read_data.cache_clear()
+    assert read_data(path)["Description"].iloc[-1] == "Dinner €20"
+
+
+def test_compact_writes_flags(tmp_path):
+    from openpyxl import load_workbook
+
+    path = str(tmp_path / "Spending.xlsx")
+    write_ledger(generate_year(LedgerSpec(rows=20), 2024), path)
+    append_transactions(_transaction(12.5), path)
+    compact(path)
+
+    last = list(load_workbook(path).active.iter_rows(values_only=True))[-1]
+    assert last[-2:] == (1, 0)
+    assert all(not isinstance(val, bool) for val in last)
@@ -0,0 +1,32 @@
+import pandas as pd
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.read_data.column import Column
+from src.read_data.read_data import read_data
+from src.read_data.write_data import write_data
+
+
+def test_round_trip(tmp_path):
+    csv, numbers = str(tmp_path / "Spending.csv"), str(tmp_path / "Spending.numbers")
+    write_ledger(generate_year(LedgerSpec(rows=200), 2024), csv)
+    expected = read_data(csv)
+
+    write_data(expected, numbers)
+    pd.testing.assert_frame_equal(read_data(numbers), expected)
+
+
+def test_append_follows_header(tmp_path):
+    path = str(tmp_path / "Spending.numbers")
+    write_ledger(generate_year(LedgerSpec(rows=20), 2024), path)
+    df = read_data(path)
+
+    new = df.iloc[:3].drop(columns=[Column.TRANSACTION_ID])
+    write_data(new[new.columns[::-1]], path, mode="a")
+    read_data.cache_clear()
+
+    appended = read_data(path)
+    assert appended.shape[0] == 23
+    pd.testing.assert_frame_equal(
+        appended.iloc[-3:].drop(columns=[Column.TRANSACTION_ID]).reset_index(drop=True),
+        new.reset_index(drop=True),
+    )
@@ -0,0 +1,41 @@
+import pandas as pd
+from os import utime
+
+from src.read_data.read_data import read_data
+from src.read_data.parse_cache import cache_stats, reset_cache_stats
+from src.read_data.column import Column
+
+
+def _write_sheet(path, prices):
+    pd.DataFrame(
+        {
+            Column.DATE: ["1/1/2024", "1/2/2024", "1/3/2024"],
+            "Description": ["Rent", None, "Lunch"],
+            Column.CATEGORY: ["Bills", "Groceries", "Eating Out"],
+            Column.PRICE: prices,
+            Column.IS_FOOD: [0, 1, 1],
+            Column.CONTROLLABLE: [0, 1, 1],
+        }
+    ).to_csv(path, index=False)
+
+
+def test_parse_cache(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    _write_sheet(path, ["$1,000.00", "20.50", "12"])
+    reset_cache_stats()
+
+    parsed = read_data.__wrapped__(path)
+    assert cache_stats() == {"hits": 0, "misses": 1}
+
+    cached = read_data.__wrapped__(path)
+    assert cache_stats() == {"hits": 1, "misses": 1}
+    pd.testing.assert_frame_equal(parsed, cached)
+
+    utime(path)
+    read_data.__wrapped__(path)
+    assert cache_stats() == {"hits": 2, "misses": 1}
+
+    _write_sheet(path, ["$1,000.00", "20.50", "13"])
+    changed = read_data.__wrapped__(path)
+    assert cache_stats() == {"hits": 2, "misses": 2}
+    assert changed[Column.PRICE].tolist() == [1000.0, 20.5, 13.0]
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+from shutil import copyfile
+import pandas as pd
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.read_config.get_config import get_config
+from src.read_data import read_data as read_data_module
+from src.read_data.read_data import read_data
+from src.read_data.column import Column
+
+
+def test_transaction_ids(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    pd.DataFrame(
+        {
+            Column.DATE: ["1/1/2024", "1/1/2024", "1/2/2024"],
+            Column.CATEGORY: ["Coffee", "Coffee", "Coffee"],
+            Column.PRICE: [4.5, 4.5, 4.5],
+            Column.IS_FOOD: [1, 1, 1],
+            Column.CONTROLLABLE: [1, 1, 1],
+        }
+    ).to_csv(path, index=False)
+
+    first = read_data.__wrapped__(path, use_cache=False)
+    second = read_data.__wrapped__(path, use_cache=False)
+
+    assert first[Column.TRANSACTION_ID].dtype == np.int64
+    assert first[Column.TRANSACTION_ID].tolist() == (
+        second[Column.TRANSACTION_ID].tolist()
+    )
+    assert first[Column.TRANSACTION_ID].nunique() == first.shape[0]
+
+
+def test_streaming_reader():
+    default = read_data.__wrapped__(
+        "sample_data.xlsx", use_cache=False, reader="default"
+    )
+    streaming = read_data.__wrapped__(
+        "sample_data.xlsx", use_cache=False, reader="streaming"
+    )
+
+    pd.testing.assert_frame_equal(default, streaming)
+
+
+def test_streaming_reader_selects_columns(tmp_path):
+    path = str(tmp_path / "Spending.xlsx")
+    pd.DataFrame(
+        {
+            Column.DATE: pd.to_datetime(["1/1/2024", "1/2/2024"]),
+            "Unused": ["a", "b"],
+            Column.CATEGORY: ["Coffee", "Rent"],
+            Column.PRICE: [4.5, 1000],
+            Column.IS_FOOD: [1, 0],
+            Column.CONTROLLABLE: [1, 0],
+        }
+    ).to_excel(path, sheet_name="Sheet1", index=False)
+
+    df = read_data.__wrapped__(path, use_cache=False, reader="streaming")
+
+    assert "Unused" not in df.columns
+    assert df[Column.DATE].tolist() == list(pd.to_datetime(["1/1/2024", "1/2/2024"]))
+    assert df[Column.PRICE].tolist() == [4.5, 1000.0]
+
+
+def test_streaming_csv_reader(tmp_path, monkeypatch):
+    monkeypatch.setattr(read_data_module, "CSV_CHUNK_ROWS", 37)
+    path = str(tmp_path / "Spending.csv")
+    df = generate_year(LedgerSpec(rows=500), 2024)
+    df.loc[[3, 100], Column.DATE] = pd.NaT
+    df[Column.PRICE] = df[Column.PRICE].astype(str)
+    df.loc[::50, Column.PRICE] = [f"${float(p):,.2f}" for p in df[Column.PRICE][::50]]
+    write_ledger(df, path)
+
+    default = read_data.__wrapped__(path, use_cache=False, reader="default")
+    streaming = read_data.__wrapped__(path, use_cache=False, reader="streaming")
+
+    assert streaming.shape[0] == 498
+    pd.testing.assert_frame_equal(default, streaming)
+
+
+@pytest.mark.parametrize("extn", ["csv", "xlsx"])
+def test_streaming_ids_ignore_extra_columns(tmp_path, extn):
+    path = str(tmp_path / f"Spending.{extn}")
+    df = generate_year(LedgerSpec(rows=50), 2024)
+    write_ledger(df.assign(Notes="extra"), path)
+
+    default = read_data.__wrapped__(path, use_cache=False, reader="default")
+    streaming = read_data.__wrapped__(path, use_cache=False, reader="streaming")
+
+    assert "Notes" in default.columns
+    assert (
+        default[Column.TRANSACTION_ID].tolist()
+        == streaming[Column.TRANSACTION_ID].tolist()
+    )
+
+
+def test_streaming_csv_reader_missing_column(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    pd.DataFrame({Column.DATE: ["1/1/2024"], Column.PRICE: [4.5]}).to_csv(
+        path, index=False
+    )
+
+    with pytest.raises(ValueError):
+        read_data.__wrapped__(path, use_cache=False, reader="streaming")
+
+
+def test_read_without_configs(tmp_path, monkeypatch):
+    path = str(tmp_path / "Spending.xlsx")
+    copyfile("sample_data.xlsx", path)
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")
+    get_config.cache_clear()
+
+    assert read_data.__wrapped__(path, use_cache=False).shape[0] > 0
+
+
+def test_unknown_reader():
+    with pytest.raises(ValueError):
+        read_data.__wrapped__("sample_data.xlsx", use_cache=False, reader="fast")
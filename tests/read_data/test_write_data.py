@@ -0,0 +1,71 @@
+from datetime import date
+
+import pandas as pd
+
+from benchmarks.synthetic import LedgerSpec, generate_year, write_ledger
+from src.read_data import write_data as write_module
+from src.read_data.column import Column
+from src.read_data.read_data import CSV_ENCODING, read_data
+from src.read_data.write_data import write_data
+
+
+def test_csv_leaves_frame_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(write_module, "CSV_CHUNK_ROWS", 7)
+    src, dest = str(tmp_path / "Spending.csv"), str(tmp_path / "Copy.csv")
+    write_ledger(generate_year(LedgerSpec(rows=50), 2024), src)
+    df = read_data(src)
+    before = df.copy()
+
+    write_data(df, dest)
+    pd.testing.assert_frame_equal(df, before)
+    pd.testing.assert_frame_equal(read_data(dest), df)
+
+    with open(dest) as f:
+        header, first = f.readline(), f.readline()
+
+    assert Column.TRANSACTION_ID not in header
+    assert first.startswith(df[Column.DATE].iloc[0].strftime("%m/%d/%Y"))
+    assert f",{df[Column.PRICE].iloc[0]:.2f}," in first
+    assert ",True," not in first and ",False," not in first
+
+
+def test_csv_append_follows_header(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    write_ledger(generate_year(LedgerSpec(rows=20), 2024), path)
+    df = read_data(path)
+
+    new = df.iloc[:3].drop(columns=[Column.TRANSACTION_ID])
+    write_data(new[new.columns[::-1]], path, mode="a")
+    read_data.cache_clear()
+
+    appended = read_data(path)
+    assert appended.shape[0] == 23
+    pd.testing.assert_frame_equal(
+        appended.iloc[-3:].drop(columns=[Column.TRANSACTION_ID]).reset_index(drop=True),
+        new.reset_index(drop=True),
+    )
+
+
+def test_csv_append_from_ui(tmp_path):
+    path = str(tmp_path / "Spending.csv")
+    write_ledger(generate_year(LedgerSpec(rows=20), 2024), path)
+    write_data(
+        pd.DataFrame(
+            {
+                Column.DATE: [date(2024, 1, 9)],
+                "Description": ["Café"],
+                Column.CATEGORY: ["Eating Out"],
+                Column.PRICE: [4.5],
+                Column.IS_FOOD: [1],
+                Column.CONTROLLABLE: [1],
+            }
+        ),
+        path,
+        mode="a",
+    )
+
+    with open(path, encoding=CSV_ENCODING) as f:
+        assert f.read().splitlines()[-1].startswith("01/09/2024,Café,")
+
+    df = read_data.__wrapped__(path, use_cache=False)
+    assert df["Description"].iloc[-1] == "Café"
@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.import_time import import_times
+
+PLOTTING = {"matplotlib", "sankeyflow"}
+UI = {"tkinter"}
+SPREADSHEETS = {"numbers_parser", "openpyxl"}
+DATA = {"pandas", "numpy"}
+
+
+@pytest.mark.parametrize(
+    "module,forbidden",
+    [
+        ("main", PLOTTING | UI | SPREADSHEETS | DATA),
+        ("src.initialize", PLOTTING | UI | SPREADSHEETS | DATA),
+        ("src.analyze_spending", PLOTTING | UI | SPREADSHEETS),
+        ("src.drivers.watch_driver", PLOTTING | UI | SPREADSHEETS),
+    ],
+)
+def test_lazy_imports(module, forbidden):
+    assert set(import_times(module)) & forbidden == set()
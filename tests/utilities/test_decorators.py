@@ -1,5 +1,10 @@
+import pandas as pd
 from dataclasses import dataclass, asdict
-from src.utilities.decorators import dataclass_from_converted_json
+from src.utilities.decorators import (
+    dataclass_from_converted_json,
+    memoize_by_frame,
+    clear_frame_memos,
+)
 
 
 class DataclassFromJsonTestClass:
@@ -27,3 +32,24 @@ def test_dataclass_from_json():
     var2 = deco2(DataclassFromJsonTestClass)(fields)
 
     assert sorted(asdict(var1).items()) == sorted(asdict(var2).items())
+
+
+def test_memoize_by_frame():
+    calls = []
+
+    @memoize_by_frame
+    def total(df):
+        calls.append(1)
+        return df["col"].sum()
+
+    df = pd.DataFrame({"col": [1, 2, 3]})
+    assert total(df) == 6
+    assert total(df) == 6
+    assert len(calls) == 1
+
+    assert total(df.copy()) == 6
+    assert len(calls) == 2
+
+    clear_frame_memos()
+    assert total(df) == 6
+    assert len(calls) == 3
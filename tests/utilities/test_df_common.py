@@ -27,3 +27,16 @@ def test_group_by_week():
     assert len(partitions) == num_weeks
 
     assert sum(map(lambda p: p.shape[0], partitions)) == data.shape[0]
+
+
+def test_group_by_month_unsorted():
+    data = sample_data().sample(frac=1, random_state=0)
+    starts, partitions = group_by_month(data)
+
+    for i, part in enumerate(partitions):
+        days = data[Column.DATE].dt.date
+        in_month = days >= starts[i]
+        if i + 1 < len(starts):
+            in_month &= days < starts[i + 1]
+
+        assert part.index.tolist() == data.loc[in_month].index.tolist()
@@ -0,0 +1,24 @@
+from src.utilities.fingerprints import combine_fingerprints, frame_fingerprint
+from src.read_data.column import Column
+
+from tests.test_utils import sample_data
+
+
+def test_frame_fingerprint():
+    data = sample_data()
+    fingerprint = frame_fingerprint(data)
+
+    assert frame_fingerprint(data.copy()) == fingerprint
+    assert frame_fingerprint(data.assign(**{Column.TRANSACTION_ID: "x"})) == (
+        fingerprint
+    )
+
+    changed = data.copy()
+    changed.loc[changed.index[-1], Column.PRICE] += 1
+    assert frame_fingerprint(changed) != fingerprint
+    assert frame_fingerprint(data.iloc[:-1]) != fingerprint
+
+
+def test_combine_fingerprints():
+    assert combine_fingerprints("a", 1) == combine_fingerprints("a", 1)
+    assert combine_fingerprints("a", 1) != combine_fingerprints("a1")
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from src.utilities.mask_cache import MaskCache, freeze
+
+
+def test_mask_cache_reuse():
+    cache = MaskCache(max_bytes=1024)
+    df = pd.DataFrame({"col": [1, 2, 3]})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return (df["col"] > 1).to_numpy()
+
+    first = cache.get(df, ("col", ">", 1), compute)
+    second = cache.get(df, ("col", ">", 1), compute)
+
+    assert first is second
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    other = df.copy()
+    cache.get(other, ("col", ">", 1), compute)
+    assert len(calls) == 2
+
+    del other
+    assert cache.stats()["entries"] == 1
+
+
+def test_mask_cache_eviction():
+    cache = MaskCache(max_bytes=250)
+    df = pd.DataFrame({"col": np.arange(100)})
+
+    for i in range(3):
+        cache.get(df, i, lambda: (df["col"] > i).to_numpy())
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= 250
+
+    cache.get(df, 0, lambda: (df["col"] > 0).to_numpy())
+    assert cache.stats()["misses"] == 4
+
+
+def test_freeze():
+    assert freeze([1, [2, 3]]) == (1, (2, 3))
+    assert hash(freeze({"a": [1]})) == hash((("a", (1,)),))
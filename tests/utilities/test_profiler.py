@@ -0,0 +1,52 @@
+import json
+import pstats
+
+from src.utilities.profiler import Profiler
+
+
+def test_profiler_disabled():
+    profiler = Profiler()
+    with profiler.stage("plot", "a"):
+        pass
+
+    assert profiler.records == []
+
+
+def test_profiler_stages(tmp_path):
+    profiler = Profiler()
+    profiler.enable(with_cprofile=True)
+    try:
+        with profiler.stage("stage", "outer"):
+            for _ in range(2):
+                with profiler.stage("plot", "inner"):
+                    data = bytearray(4 * 2**20)
+                    del data
+
+    finally:
+        profiler.disable()
+
+    assert [(r.kind, r.name) for r in profiler.records] == [
+        ("plot", "inner"),
+        ("plot", "inner"),
+        ("stage", "outer"),
+    ]
+    inner, _, outer = profiler.records
+    assert inner.peak_bytes > 3 * 2**20
+    assert outer.peak_bytes >= inner.peak_bytes
+    assert outer.wall >= inner.wall >= 0
+
+    summary = {(t["kind"], t["name"]): t for t in profiler.summary()}
+    assert summary[("plot", "inner")]["calls"] == 2
+    assert "inner" in profiler.report()
+
+    report_path = str(tmp_path / "profile.json")
+    profiler.write_json(report_path)
+    with open(report_path, "r") as f:
+        report = json.load(f)
+
+    assert len(report["records"]) == 3
+    assert "hits" in report["mask_cache"]
+
+    stats_path = str(tmp_path / "profile.pstats")
+    profiler.dump_stats(stats_path)
+    assert pstats.Stats(stats_path).total_calls > 0